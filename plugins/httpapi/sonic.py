@@ -35,20 +35,87 @@ options:
     default: '/restconf'
     vars:
       - name: ansible_httpapi_restconf_root
+  keepalive:
+    type: bool
+    description:
+      - Send requests over persistent HTTP/1.1 keep-alive connections instead of
+        opening a new connection for every request.
+      - Requests to be sent through a proxy are sent over a new connection as usual.
+      - Only idempotent requests are resent when a kept-alive connection turns out
+        to be closed by the device, so keep I(pool_idle_timeout) below the
+        keep-alive timeout of the device.
+      - Pool statistics can be retrieved with the C(get_pool_stats) connection method.
+    default: false
+    version_added: 2.1.0
+    vars:
+      - name: ansible_httpapi_sonic_keepalive
+  pool_size:
+    type: int
+    description:
+      - Maximum number of idle keep-alive connections kept open per host.
+    default: 4
+    version_added: 2.1.0
+    vars:
+      - name: ansible_httpapi_sonic_pool_size
+  pool_idle_timeout:
+    type: int
+    description:
+      - Number of seconds an idle keep-alive connection is kept before it is closed.
+    default: 30
+    version_added: 2.1.0
+    vars:
+      - name: ansible_httpapi_sonic_pool_idle_timeout
+  pool_max_requests:
+    type: int
+    description:
+      - Maximum number of requests sent over a single keep-alive connection
+        before it is closed and replaced.
+    default: 100
+    version_added: 2.1.0
+    vars:
+      - name: ansible_httpapi_sonic_pool_max_requests
+  max_inflight:
+    type: int
+    description:
+      - Maximum number of requests sent concurrently by C(edit_config).
+      - Only consecutive requests flagged as C(independent) are sent concurrently,
+        any other request waits for all the previous requests to complete.
+      - Requires I(keepalive), as the requests sent over new connections share
+        state that is not thread safe. Without it, the requests are sent serially.
+    default: 1
+    version_added: 2.1.0
+    vars:
+      - name: ansible_httpapi_sonic_max_inflight
 """
 
+import base64
 import json
+import socket
+import ssl
+import threading
+import time
+from collections import deque
+from io import BytesIO
 
-from ansible.module_utils._text import to_text
+from ansible.module_utils._text import to_bytes, to_text
 from ansible.module_utils.connection import ConnectionError
+from ansible.module_utils.six.moves import http_client
 from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.request import getproxies, proxy_bypass
 from ansible.plugins.httpapi import HttpApiBase
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import to_list
 
 CONTENT_TYPE = 'application/yang-data+json'
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'))
 
 
 class HttpApi(HttpApiBase):
+    def __init__(self, connection):
+        super(HttpApi, self).__init__(connection)
+        self._pools = {}
+        self._pools_lock = threading.Lock()
+        self._auth_lock = threading.Lock()
+
     def send_request(self, data, **message_kwargs):
         if data:
             data = json.dumps(data)
@@ -59,35 +126,325 @@ class HttpApi(HttpApiBase):
             'Content-Type': message_kwargs.get('content_type') or CONTENT_TYPE,
             'Accept': message_kwargs.get('accept') or CONTENT_TYPE,
         }
-        response, response_data = self.connection.send(path, data, headers=headers, method=message_kwargs.get('method'))
+        if self.use_pool():
+            response, response_data = self.send_pooled(path, data, headers=headers, method=message_kwargs.get('method'))
+        else:
+            response, response_data = self.connection.send(path, data, headers=headers, method=message_kwargs.get('method'))
 
         return handle_response(response, response_data, message_kwargs)
 
+    def use_pool(self):
+        """Tell whether requests go through the keep-alive pool.
+
+        Requests to be sent through a proxy are left to connection.send,
+        which is the one handling proxies.
+        """
+        if not self.get_option('keepalive'):
+            return False
+        if self.connection.get_option('use_proxy'):
+            scheme = 'https' if self.connection.get_option('use_ssl') else 'http'
+            if scheme in getproxies() and not proxy_bypass(self.connection.get_option('host')):
+                return False
+        return True
+
+    def send_pooled(self, path, data, headers, method, retries=1):
+        """Send a request over a keep-alive connection taken from the
+        per-host pool and return it the same way as connection.send
+
+        The authentication, the HTTP errors (such as a 401 on an expired
+        session) and the logging go through the same connection and
+        plugin hooks as connection.send.
+        """
+        if not self.connection.connected:
+            self.connection._connect()
+
+        request_headers = dict(headers)
+        sent_auth = self.connection._auth
+        if sent_auth:
+            request_headers.update(sent_auth)
+        else:
+            credentials = '%s:%s' % (self.connection.get_option('remote_user'), self.connection.get_option('password'))
+            request_headers['Authorization'] = 'Basic %s' % to_text(base64.b64encode(to_bytes(credentials)))
+        http_agent = self.connection.get_option('http_agent')
+        if http_agent:
+            request_headers['User-Agent'] = http_agent
+
+        pool = self.get_pool()
+        url = self.connection._url + path
+        method = (method or 'GET').upper()
+        self.connection._log_messages("send url '%s' with data '%s' and method '%s' over a keep-alive connection" % (url, data, method))
+        try:
+            status, reason, response_headers, body = pool.urlopen(method, path, data, request_headers)
+        except (socket.error, http_client.HTTPException) as exc:
+            raise ConnectionError('Could not connect to {0}: {1}'.format(url, to_text(exc)))
+        self.connection._log_messages("received response: '%s'" % body)
+
+        response_buffer = BytesIO(body)
+        if status >= 400:
+            response = HTTPError(url, status, reason, response_headers, response_buffer)
+            # Concurrent requests share the session, renew it only once
+            with self._auth_lock:
+                if status == 401 and sent_auth and self.connection._auth and self.connection._auth is not sent_auth:
+                    is_handled = True
+                else:
+                    is_handled = self.handle_httperror(response)
+            if is_handled is True:
+                if retries:
+                    return self.send_pooled(path, data, headers, method, retries=retries - 1)
+                raise response
+            if is_handled is False:
+                raise response
+            response = is_handled
+        else:
+            response = PooledResponse(url, status, reason, response_headers)
+            self.connection._auth = self.update_auth(response, response_buffer) or self.connection._auth
+
+        response_buffer.seek(0)
+        return response, response_buffer
+
+    def get_pool(self):
+        use_ssl = self.connection.get_option('use_ssl')
+        host = self.connection.get_option('host')
+        port = self.connection.get_option('port') or (443 if use_ssl else 80)
+        key = '%s:%s' % (host, port)
+
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                ssl_context = None
+                if use_ssl:
+                    ssl_context = self._build_ssl_context()
+                pool = ConnectionPool(host, port,
+                                      ssl_context=ssl_context,
+                                      timeout=self.connection.get_option('persistent_command_timeout'),
+                                      maxsize=self.get_option('pool_size'),
+                                      idle_timeout=self.get_option('pool_idle_timeout'),
+                                      max_requests=self.get_option('pool_max_requests'))
+                self._pools[key] = pool
+        return pool
+
+    def _build_ssl_context(self):
+        context = ssl.create_default_context(cafile=self.connection.get_option('ca_path'))
+        if not self.connection.get_option('validate_certs'):
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        client_cert = self.connection.get_option('client_cert')
+        if client_cert:
+            context.load_cert_chain(client_cert, self.connection.get_option('client_key'))
+        return context
+
+    def get_pool_stats(self):
+        """Return the keep-alive pool statistics of every host"""
+        with self._pools_lock:
+            return dict((key, pool.get_stats()) for key, pool in self._pools.items())
+
     def get(self, command):
         return self.send_request(path=command, data=None, method='get')
 
     def edit_config(self, requests):
         """Send a list of http requests to remote device and return results
+
+        Consecutive requests flagged as 'independent' are sent concurrently
+        when 'max_inflight' is greater than one and the requests go through
+        the keep-alive pool. Responses are returned in the order of the
+        requests.
         """
         if requests is None:
             raise ValueError("'requests' value is required")
 
+        max_inflight = self.get_option('max_inflight') or 1
+        if not self.use_pool():
+            # connection.send shares the session and the re-login on 401
+            # between its callers and is not thread safe
+            max_inflight = 1
         responses = list()
+        batch = list()
         for req in to_list(requests):
-            try:
-                response = self.send_request(**req)
-            except ConnectionError as exc:
-                raise ConnectionError(to_text(exc, errors='surrogate_then_replace'))
-            responses.append(response)
+            req = dict(req)
+            if req.pop('independent', False) and max_inflight > 1:
+                batch.append(req)
+                continue
+            if batch:
+                responses.extend(self._send_concurrent(batch, max_inflight))
+                batch = list()
+            responses.append(self._send_one(req))
+        if batch:
+            responses.extend(self._send_concurrent(batch, max_inflight))
+        return responses
+
+    def _send_one(self, req):
+        try:
+            return self.send_request(**req)
+        except ConnectionError as exc:
+            raise ConnectionError(to_text(exc, errors='surrogate_then_replace'))
+
+    def _send_concurrent(self, requests, max_inflight):
+        """Send requests with at most 'max_inflight' of them in flight.
+
+        Once a request fails no further request is started, and the error
+        of the first failed request (in request order) is raised.
+        """
+        responses = [None] * len(requests)
+        errors = {}
+        pending = deque(enumerate(requests))
+        lock = threading.Lock()
+
+        def worker():
+            while True:
+                with lock:
+                    if errors or not pending:
+                        return
+                    index, req = pending.popleft()
+                try:
+                    responses[index] = self._send_one(req)
+                except Exception as exc:
+                    with lock:
+                        errors[index] = exc
+
+        workers = [threading.Thread(target=worker) for dummy in range(min(max_inflight, len(requests)))]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+        if errors:
+            raise errors[min(errors)]
         return responses
 
     def get_capabilities(self):
         result = {}
-        result['rpc'] = []
+        result['rpc'] = ['get_pool_stats']
         result['network_api'] = 'sonic_rest'
 
         return json.dumps(result)
 
+    def logout(self):
+        with self._pools_lock:
+            for pool in self._pools.values():
+                pool.close()
+            self._pools = {}
+
+
+class PooledResponse(object):
+    """Minimal response object for requests sent through the pool"""
+
+    def __init__(self, url, code, reason, headers):
+        self.url = url
+        self.code = code
+        self.msg = reason
+        self.headers = headers
+
+    def getcode(self):
+        return self.code
+
+    def info(self):
+        return self.headers
+
+
+class ConnectionPool(object):
+    """Keep-alive HTTP/1.1 connections to a single host
+
+    Idle sockets are kept for reuse, up to 'maxsize' of them. A socket is
+    dropped once it has been idle for more than 'idle_timeout' seconds or
+    after it has carried 'max_requests' requests. A request failing on a
+    reused socket is resent on a fresh one only when its method is
+    idempotent, as the device may have already applied it.
+    """
+
+    def __init__(self, host, port, ssl_context=None, timeout=None, maxsize=4, idle_timeout=30, max_requests=100):
+        self.host = host
+        self.port = port
+        self.ssl_context = ssl_context
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self.max_requests = max_requests
+        self._idle = deque()
+        self._lock = threading.Lock()
+        self._stats = {
+            'requests': 0,
+            'connections_created': 0,
+            'connections_reused': 0,
+            'connections_discarded': 0,
+        }
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _new_connection(self):
+        if self.ssl_context:
+            conn = http_client.HTTPSConnection(self.host, self.port, timeout=self.timeout, context=self.ssl_context)
+        else:
+            conn = http_client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        self._count('connections_created')
+        return conn, 0
+
+    def _get_connection(self):
+        now = time.time()
+        with self._lock:
+            while self._idle:
+                conn, used, last_used = self._idle.pop()
+                if now - last_used <= self.idle_timeout:
+                    self._stats['connections_reused'] += 1
+                    return conn, used
+                conn.close()
+                self._stats['connections_discarded'] += 1
+        return self._new_connection()
+
+    def _put_connection(self, conn, used, reusable):
+        if reusable and used < self.max_requests:
+            with self._lock:
+                if len(self._idle) < self.maxsize:
+                    self._idle.append((conn, used, time.time()))
+                    return
+        conn.close()
+        self._count('connections_discarded')
+
+    def urlopen(self, method, path, body, headers):
+        """Send one request and return (status, reason, headers, body)"""
+        self._count('requests')
+        conn, used = self._get_connection()
+        try:
+            response = self._send(conn, method, path, body, headers)
+        except (socket.error, http_client.HTTPException):
+            conn.close()
+            self._count('connections_discarded')
+            if not used or method not in IDEMPOTENT_METHODS:
+                raise
+            # The device closed an idle socket, retry on a fresh one
+            conn, used = self._new_connection()
+            try:
+                response = self._send(conn, method, path, body, headers)
+            except (socket.error, http_client.HTTPException):
+                conn.close()
+                self._count('connections_discarded')
+                raise
+
+        status, reason, response_headers, data = response
+        reusable = (response_headers.get('Connection') or '').lower() != 'close'
+        self._put_connection(conn, used + 1, reusable)
+        return response
+
+    @staticmethod
+    def _send(conn, method, path, body, headers):
+        conn.request(method, path, body=body, headers=headers)
+        response = conn.getresponse()
+        data = response.read()
+        return response.status, response.reason, response.msg, data
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['idle_connections'] = len(self._idle)
+        return stats
+
+    def close(self):
+        with self._lock:
+            while self._idle:
+                conn, used, last_used = self._idle.pop()
+                conn.close()
+
 
 def handle_response(response, response_data, request_data):
     response_data = response_data.read()
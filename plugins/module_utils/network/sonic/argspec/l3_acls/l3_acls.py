@@ -219,5 +219,6 @@ class L3_aclsArgs(object):  # pylint: disable=R0903
             'choices': ['merged', 'replaced', 'overridden', 'deleted'],
             'default': 'merged',
             'type': 'str'
-        }
+        },
+        'chunk_size': {'default': 500, 'type': 'int'}
     }  # pylint: disable=C0301
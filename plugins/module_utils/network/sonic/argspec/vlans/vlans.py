@@ -50,5 +50,6 @@ class VlansArgs(object):  # pylint: disable=R0903
             'choices': ['merged', 'deleted', 'replaced', 'overridden'],
             'default': 'merged',
             'type': 'str'
-        }
+        },
+        'chunk_size': {'default': 500, 'type': 'int'}
     }
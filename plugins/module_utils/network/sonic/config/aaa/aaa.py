@@ -83,11 +83,12 @@ class Aaa(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_aaa_facts = self.get_aaa_facts()
-
         result['before'] = existing_aaa_facts
         if result['changed']:
-            result['after'] = changed_aaa_facts
+            if self._module.check_mode:
+                result['after'] = existing_aaa_facts
+            else:
+                result['after'] = self.get_aaa_facts()
 
         result['warnings'] = warnings
         return result
@@ -102,11 +102,12 @@ class Acl_interfaces(ConfigBase):
                     self._module.fail_json(msg=str(exc), code=exc.code)
             result['changed'] = True
 
-        changed_acl_interfaces_facts = self.get_acl_interfaces_facts()
-
         result['before'] = existing_acl_interfaces_facts
         if result['changed']:
-            result['after'] = changed_acl_interfaces_facts
+            if self._module.check_mode:
+                result['after'] = existing_acl_interfaces_facts
+            else:
+                result['after'] = self.get_acl_interfaces_facts()
 
         result['commands'] = commands
         result['warnings'] = warnings
@@ -95,11 +95,12 @@ class Bfd(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_bfd_facts = self.get_bfd_facts()
-
         result['before'] = existing_bfd_facts
         if result['changed']:
-            result['after'] = changed_bfd_facts
+            if self._module.check_mode:
+                result['after'] = existing_bfd_facts
+            else:
+                result['after'] = self.get_bfd_facts()
 
         result['warnings'] = warnings
         return result
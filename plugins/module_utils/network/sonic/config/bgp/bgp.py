@@ -93,11 +93,12 @@ class Bgp(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_bgp_facts = self.get_bgp_facts()
-
         result['before'] = existing_bgp_facts
         if result['changed']:
-            result['after'] = changed_bgp_facts
+            if self._module.check_mode:
+                result['after'] = existing_bgp_facts
+            else:
+                result['after'] = self.get_bgp_facts()
 
         result['warnings'] = warnings
         return result
@@ -106,11 +106,12 @@ class Bgp_af(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_bgp_af_facts = self.get_bgp_af_facts()
-
         result['before'] = existing_bgp_af_facts
         if result['changed']:
-            result['after'] = changed_bgp_af_facts
+            if self._module.check_mode:
+                result['after'] = existing_bgp_af_facts
+            else:
+                result['after'] = self.get_bgp_af_facts()
 
         result['warnings'] = warnings
         return result
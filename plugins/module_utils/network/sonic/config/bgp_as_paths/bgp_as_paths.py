@@ -86,11 +86,12 @@ class Bgp_as_paths(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_bgp_as_paths_facts = self.get_bgp_as_paths_facts()
-
         result['before'] = existing_bgp_as_paths_facts
         if result['changed']:
-            result['after'] = changed_bgp_as_paths_facts
+            if self._module.check_mode:
+                result['after'] = existing_bgp_as_paths_facts
+            else:
+                result['after'] = self.get_bgp_as_paths_facts()
 
         result['warnings'] = warnings
         return result
@@ -98,11 +98,12 @@ class Bgp_communities(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_bgp_communities_facts = self.get_bgp_communities_facts()
-
         result['before'] = existing_bgp_communities_facts
         if result['changed']:
-            result['after'] = changed_bgp_communities_facts
+            if self._module.check_mode:
+                result['after'] = existing_bgp_communities_facts
+            else:
+                result['after'] = self.get_bgp_communities_facts()
 
         result['warnings'] = warnings
         return result
@@ -160,6 +160,7 @@ class Bgp_neighbors(ConfigBase):
 
     def __init__(self, module):
         super(Bgp_neighbors, self).__init__(module)
+        self._have_index = None
 
     def get_bgp_neighbors_facts(self):
         """ Get the 'facts' (the current configuration)
@@ -192,11 +193,12 @@ class Bgp_neighbors(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_bgp_facts = self.get_bgp_neighbors_facts()
-
         result['before'] = existing_bgp_facts
         if result['changed']:
-            result['after'] = changed_bgp_facts
+            if self._module.check_mode:
+                result['after'] = existing_bgp_facts
+            else:
+                result['after'] = self.get_bgp_neighbors_facts()
 
         result['warnings'] = warnings
         return result
@@ -482,23 +484,51 @@ class Bgp_neighbors(ConfigBase):
         payload = {'openconfig-network-instance:peer-groups': {'peer-group': bgp_peer_group_list}}
         return payload, requests
 
+    def get_have_index(self, have):
+        """Get the index of the peer groups, peer group address families
+        and neighbors in have. The index is built once for a given have,
+        which is not modified while the requests are built.
+        """
+        if self._have_index is None or self._have_index[0] is not have:
+            self._have_index = (have, self.build_have_index(have))
+        return self._have_index[1]
+
+    @staticmethod
+    def build_have_index(have):
+        """Index the peer groups by (bgp_as, vrf_name, name), their address
+        families by (bgp_as, vrf_name, name, afi, safi) and the neighbors by
+        (bgp_as, vrf_name, neighbor). The first match is kept for duplicates.
+        """
+        index = {'peer_group': {}, 'af': {}, 'neighbor': {}}
+        seen_vrfs = set()
+        for conf in have:
+            vrf_key = (conf['bgp_as'], conf['vrf_name'])
+            # Only the first entry of a BGP instance is looked up
+            if vrf_key in seen_vrfs:
+                continue
+            seen_vrfs.add(vrf_key)
+
+            for peer_group in conf.get('peer_group') or []:
+                pg_key = vrf_key + (peer_group['name'],)
+                if pg_key in index['peer_group']:
+                    continue
+                index['peer_group'][pg_key] = peer_group
+                for af in (peer_group.get('address_family') or {}).get('afis') or []:
+                    index['af'].setdefault(pg_key + (af['afi'], af['safi']), af)
+
+            for neighbor in conf.get('neighbors') or []:
+                index['neighbor'].setdefault(vrf_key + (neighbor['neighbor'],), neighbor)
+
+        return index
+
     def find_pg(self, have, bgp_as, vrf_name, peergroup):
-        mat_dict = next((m_peer for m_peer in have if m_peer['bgp_as'] == bgp_as and m_peer['vrf_name'] == vrf_name), None)
-        if mat_dict and mat_dict.get("peer_group", None) is not None:
-            mat_pg = next((m for m in mat_dict['peer_group'] if m["name"] == peergroup['name']), None)
-            return mat_pg
+        return self.get_have_index(have)['peer_group'].get((bgp_as, vrf_name, peergroup['name']))
 
     def find_af(self, have, bgp_as, vrf_name, peergroup, afi, safi):
-        mat_pg = self.find_pg(have, bgp_as, vrf_name, peergroup)
-        if mat_pg and mat_pg['address_family'].get('afis', None) is not None:
-            mat_af = next((af for af in mat_pg['address_family']['afis'] if af['afi'] == afi and af['safi'] == safi), None)
-            return mat_af
+        return self.get_have_index(have)['af'].get((bgp_as, vrf_name, peergroup['name'], afi, safi))
 
     def find_nei(self, have, bgp_as, vrf_name, neighbor):
-        mat_dict = next((m_neighbor for m_neighbor in have if m_neighbor['bgp_as'] == bgp_as and m_neighbor['vrf_name'] == vrf_name), None)
-        if mat_dict and mat_dict.get("neighbors", None) is not None:
-            mat_neighbor = next((m for m in mat_dict['neighbors'] if m["neighbor"] == neighbor['neighbor']), None)
-            return mat_neighbor
+        return self.get_have_index(have)['neighbor'].get((bgp_as, vrf_name, neighbor['neighbor']))
 
     def build_bgp_neighbors_payload(self, cmd, have, bgp_as, vrf_name):
         bgp_neighbor_list = []
@@ -646,7 +676,9 @@ class Bgp_neighbors(ConfigBase):
 
     def get_delete_specific_bgp_peergroup_param_request(self, vrf_name, cmd, want_match):
         requests = []
-        want_peer_group = want_match.get('peer_group', None)
+        want_peer_group = {}
+        for cfg in want_match.get('peer_group') or []:
+            want_peer_group.setdefault(cfg['name'], cfg)
         for each in cmd['peer_group']:
             if each:
                 name = each.get('name', None)
@@ -676,9 +708,7 @@ class Bgp_neighbors(ConfigBase):
                         enforce_first_as is None and enforce_multihop is None and not local_address and not local_as and override_capability
                         is None and passive is None and not shutdown_msg and solo is None and strict_capability_match is None and not ttl_security and
                         not address_family):
-                    want_pg_match = None
-                    if want_peer_group:
-                        want_pg_match = next((cfg for cfg in want_peer_group if cfg['name'] == name), None)
+                    want_pg_match = want_peer_group.get(name)
                     if want_pg_match:
                         keys = ['remote_as', 'timers', 'advertisement_interval', 'bfd', 'capability', 'auth_pwd', 'pg_description',
                                 'disable_connected_check', 'dont_negotiate_capability', 'ebgp_multihop', 'enforce_first_as', 'enforce_multihop',
@@ -880,7 +910,9 @@ class Bgp_neighbors(ConfigBase):
 
     def get_delete_specific_bgp_param_request(self, vrf_name, cmd, want_match):
         requests = []
-        want_neighbors = want_match.get('neighbors', None)
+        want_neighbors = {}
+        for cfg in want_match.get('neighbors') or []:
+            want_neighbors.setdefault(cfg['neighbor'], cfg)
         for each in cmd['neighbors']:
             if each:
                 neighbor = each.get('neighbor', None)
@@ -912,9 +944,7 @@ class Bgp_neighbors(ConfigBase):
                         ebgp_multihop and enforce_first_as is None and enforce_multihop is None and not local_address and not local_as and
                         override_capability is None and passive is None and not port and not shutdown_msg and solo is None and strict_capability_match
                         is None and not ttl_security and v6only is None):
-                    want_nei_match = None
-                    if want_neighbors:
-                        want_nei_match = next(cfg for cfg in want_neighbors if cfg['neighbor'] == neighbor)
+                    want_nei_match = want_neighbors.get(neighbor)
                     if want_nei_match:
                         keys = ['remote_as', 'peer_group', 'timers', 'advertisement_interval', 'bfd', 'capability', 'auth_pwd', 'nbr_description',
                                 'disable_connected_check', 'dont_negotiate_capability', 'ebgp_multihop', 'enforce_first_as', 'enforce_multihop',
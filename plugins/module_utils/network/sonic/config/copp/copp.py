@@ -118,11 +118,12 @@ class Copp(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_copp_facts = self.get_copp_facts()
-
         result['before'] = existing_copp_facts
         if result['changed']:
-            result['after'] = changed_copp_facts
+            if self._module.check_mode:
+                result['after'] = existing_copp_facts
+            else:
+                result['after'] = self.get_copp_facts()
 
         result['warnings'] = warnings
         return result
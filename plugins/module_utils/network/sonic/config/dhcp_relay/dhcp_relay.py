@@ -117,11 +117,12 @@ class Dhcp_relay(ConfigBase):
                     self._module.fail_json(msg=str(exc), code=exc.code)
             result['changed'] = True
 
-        changed_dhcp_relay_facts = self.get_dhcp_relay_facts()
-
         result['before'] = existing_dhcp_relay_facts
         if result['changed']:
-            result['after'] = changed_dhcp_relay_facts
+            if self._module.check_mode:
+                result['after'] = existing_dhcp_relay_facts
+            else:
+                result['after'] = self.get_dhcp_relay_facts()
 
         result['commands'] = commands
         result['warnings'] = warnings
@@ -37,7 +37,9 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     get_diff,
     update_states,
-    normalize_interface_name
+    normalize_interface_name,
+    get_port_breakout_mode,
+    get_speed_from_breakout_mode,
 )
 from ansible.module_utils._text import to_native
 from ansible.module_utils.connection import ConnectionError
@@ -57,6 +59,8 @@ GET = 'get'
 PATCH = 'patch'
 DELETE = 'delete'
 url = 'data/openconfig-interfaces:interfaces/interface=%s'
+port_list_url = 'data/sonic-port:sonic-port/PORT/PORT_LIST'
+breakout_cfg_url = 'data/sonic-port-breakout:sonic-port-breakout/BREAKOUT_CFG/BREAKOUT_CFG_LIST'
 
 
 class Interfaces(ConfigBase):
@@ -78,6 +82,8 @@ class Interfaces(ConfigBase):
 
     def __init__(self, module):
         super(Interfaces, self).__init__(module)
+        # Default port speed per interface name, filled on first use
+        self._default_speeds = None
 
     def get_interfaces_facts(self):
         """ Get the 'facts' (the current configuration)
@@ -112,11 +118,12 @@ class Interfaces(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_interfaces_facts = self.get_interfaces_facts()
-
         result['before'] = existing_interfaces_facts
         if result['changed']:
-            result['after'] = changed_interfaces_facts
+            if self._module.check_mode:
+                result['after'] = existing_interfaces_facts
+            else:
+                result['after'] = self.get_interfaces_facts()
 
         result['warnings'] = warnings
         return result
@@ -292,6 +299,13 @@ class Interfaces(ConfigBase):
         if not configs:
             return requests
 
+        # The common config requests of different interfaces have no
+        # ordering dependency and can be sent concurrently by the httpapi
+        # plugin. The FEC, speed and autoneg requests of an interface are
+        # applied in order by the device and are sent serially after them.
+        common_requests = []
+        ethernet_requests = []
+
         # Create URL and payload
         for conf in configs:
             name = conf["name"]
@@ -309,23 +323,92 @@ class Interfaces(ConfigBase):
                         loopback_create_request = build_interfaces_create_request(name)
                         requests.append(loopback_create_request)
 
-                config_request = self.build_create_common_config_request(conf)
-                if config_request:
-                    requests.append(config_request)
+                common_request = self.build_create_common_config_request(conf)
+                if common_request:
+                    if not self.delete_flag:
+                        common_request['independent'] = True
+                    common_requests.append(common_request)
+
+                intf_requests = [
+                    self.build_create_fec_request(conf),
+                    self.build_create_speed_request(conf),
+                    self.build_create_autoneg_request(conf)
+                ]
+                if self.delete_flag:
+                    common_requests.extend(request for request in intf_requests if request)
+                else:
+                    ethernet_requests.extend(request for request in intf_requests if request)
 
-                fec_request = self.build_create_fec_request(conf)
-                if fec_request:
-                    requests.append(fec_request)
+        requests.extend(common_requests)
+        requests.extend(ethernet_requests)
+        return requests
 
-                speed_request = self.build_create_speed_request(conf)
-                if speed_request:
-                    requests.append(speed_request)
+    def get_default_intf_speed(self, intf_name):
+        """Return the default speed of an interface.
 
-                autoneg_request = self.build_create_autoneg_request(conf)
-                if autoneg_request:
-                    requests.append(autoneg_request)
+        The default speed table derived from the breakout configuration is
+        consulted first; the device is only probed, once per interface,
+        for interfaces the table does not cover.
+        """
+        if self._default_speeds is None:
+            self._default_speeds = self.build_default_speed_table()
 
-        return requests
+        intf_speed = self._default_speeds.get(intf_name)
+        if intf_speed is None:
+            intf_speed = self.retrieve_default_intf_speed(intf_name)
+            self._default_speeds[intf_name] = intf_speed
+
+        return intf_speed
+
+    def build_default_speed_table(self):
+        """Map interface names to the speed of their port's breakout mode.
+
+        A port falls back to its breakout speed when its configured speed
+        is removed. Ports are matched to BREAKOUT_CFG_LIST entries through
+        their standard name alias (Eth1/1 or Eth1/1/2 for port 1/1).
+        """
+        requests = [{"path": port_list_url, "method": GET}, {"path": breakout_cfg_url, "method": GET}]
+        try:
+            response = edit_config(self._module, to_request(self._module, requests))
+        except ConnectionError:
+            # Not supported by the device, probe each interface instead
+            return {}
+
+        port_list = []
+        breakout_list = []
+        if len(response) > 1:
+            if response[0] and isinstance(response[0][1], dict):
+                port_list = response[0][1].get('sonic-port:PORT_LIST', [])
+            if response[1] and isinstance(response[1][1], dict):
+                breakout_list = response[1][1].get('sonic-port-breakout:BREAKOUT_CFG_LIST', [])
+
+        breakout_speeds = {}
+        for breakout in breakout_list:
+            port = breakout.get('port')
+            if not port:
+                continue
+            # Same mode as sonic_port_breakout reports for the port
+            mode = get_port_breakout_mode(self._module, port, breakout.get('brkout_mode'))
+            if mode:
+                breakout_speeds[self.get_breakout_port_key(port)] = get_speed_from_breakout_mode(mode)
+
+        default_speeds = {}
+        for port in port_list:
+            ifname = port.get('ifname')
+            alias = port.get('alias')
+            if ifname and alias:
+                speed = breakout_speeds.get(self.get_breakout_port_key(alias))
+                if speed:
+                    default_speeds[ifname] = speed
+
+        return default_speeds
+
+    @staticmethod
+    def get_breakout_port_key(name):
+        """Return the 'slot/port' key of a port or breakout sub-port name"""
+        if name.startswith('Eth'):
+            name = name[3:]
+        return '/'.join(name.split('/')[:2])
 
     def retrieve_default_intf_speed(self, intf_name):
 
@@ -366,7 +449,7 @@ class Interfaces(ConfigBase):
                      (intf.get('mtu') is None or intf.get('mtu') == 9100) and
                      (intf.get('fec') is None or intf.get('fec') == 'FEC_DISABLED') and
                      (intf.get('speed') is None or
-                         intf.get('speed') == self.retrieve_default_intf_speed(intf['name'])) and
+                         intf.get('speed') == self.get_default_intf_speed(intf['name'])) and
                      (intf.get('auto_negotiate') is None or intf.get('auto_negotiate') is False) and
                      (intf.get('advertised_speed') is None or not intf.get('advertised_speed')))):
                 return True
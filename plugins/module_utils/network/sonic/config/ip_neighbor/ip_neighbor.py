@@ -124,11 +124,12 @@ class Ip_neighbor(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_ip_neighbor_facts = self.get_ip_neighbor_facts()
-
         result['before'] = existing_ip_neighbor_facts
         if result['changed']:
-            result['after'] = changed_ip_neighbor_facts
+            if self._module.check_mode:
+                result['after'] = existing_ip_neighbor_facts
+            else:
+                result['after'] = self.get_ip_neighbor_facts()
 
         result['warnings'] = warnings
         return result
@@ -27,8 +27,13 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     remove_empties,
     validate_config
 )
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import Facts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.l2_acls.l2_acls import L2_aclsArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_acls.l2_acls import L2_aclsFacts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.acl_utils import AclRule
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.spec_utils import normalize_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    get_chunk_size,
+    get_chunks,
     update_states
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
@@ -80,6 +85,11 @@ ethertype_value_to_payload_map = {
 pcp_traffic_to_value_map = {v: k for k, v in pcp_value_to_traffic_map.items()}
 
 
+class L2AclRule(AclRule):
+    """Normalized L2 ACL rule"""
+    __slots__ = tuple(sorted(L2_aclsArgs.argument_spec['config']['options']['rules']['options']))
+
+
 class L2_acls(ConfigBase):
     """
     The sonic_l2_acls class
@@ -101,18 +111,28 @@ class L2_acls(ConfigBase):
 
     def __init__(self, module):
         super(L2_acls, self).__init__(module)
+        self._chunk_size = get_chunk_size(module)
 
     def get_l2_acls_facts(self):
-        """ Get the 'facts' (the current configuration)
+        """ Get the current configuration, with the rules built as
+        L2AclRule records directly from the device response
 
         :rtype: A dictionary
-        :returns: The current configuration as a dictionary
+        :returns: The current configuration as a dictionary keyed by ACL name
         """
-        facts, _warnings = Facts(self._module).get_facts(self.gather_subset, self.gather_network_resources)
-        l2_acls_facts = facts['ansible_network_resources'].get('l2_acls')
-        if not l2_acls_facts:
-            return []
-        return l2_acls_facts
+        # Only the ACLs specified in the task need to be read from the device
+        self._module._sonic_l2_acl_targets = self.get_acl_targets()
+        return L2_aclsFacts(self._module).get_l2_acl_records(L2AclRule)
+
+    def get_acl_targets(self):
+        """Get the names of the ACLs specified in the task, or None
+        if the configuration of all ACLs is required
+        """
+        config = self._module.params['config']
+        if self._module.params['state'] == 'overridden' or not config:
+            return None
+
+        return [acl['name'] for acl in config]
 
     def execute_module(self):
         """ Execute the module
@@ -134,11 +154,12 @@ class L2_acls(ConfigBase):
 
             result['changed'] = True
 
-        changed_l2_acls_facts = self.get_l2_acls_facts()
-
-        result['before'] = existing_l2_acls_facts
+        result['before'] = self._convert_dict_to_config_list(existing_l2_acls_facts)
         if result['changed']:
-            result['after'] = changed_l2_acls_facts
+            if self._module.check_mode:
+                result['after'] = result['before']
+            else:
+                result['after'] = self._convert_dict_to_config_list(self.get_l2_acls_facts())
 
         result['commands'] = commands
         result['warnings'] = warnings
@@ -213,7 +234,7 @@ class L2_acls(ConfigBase):
         del_requests = []
         requests = []
 
-        have_dict = self._convert_config_list_to_dict(have)
+        have_dict = have
         want_dict = self._convert_config_list_to_dict(want)
         have_acl_names = set(have_dict.keys())
         want_acl_names = set(want_dict.keys())
@@ -244,12 +265,14 @@ class L2_acls(ConfigBase):
 
             have_seq_nums = set(have_acl['rules'].keys())
             want_seq_nums = set(want_acl['rules'].keys())
+            del_seq_nums = []
+            add_rules = {}
 
             if state in ('replaced', 'overridden'):
                 # Delete non-modified rules
                 for seq_num in have_seq_nums.difference(want_seq_nums):
                     rule_del_commands.append({'sequence_num': seq_num})
-                    del_requests.append(self.get_delete_l2_acl_rule_request(acl_name, seq_num))
+                    del_seq_nums.append(seq_num)
 
             for seq_num in want_seq_nums.intersection(have_seq_nums):
                 # Replace existing rules
@@ -261,15 +284,18 @@ class L2_acls(ConfigBase):
                         )
 
                     rule_del_commands.append({'sequence_num': seq_num})
-                    del_requests.append(self.get_delete_l2_acl_rule_request(acl_name, seq_num))
+                    del_seq_nums.append(seq_num)
 
-                    rule_add_commands.append(want_acl['rules'][seq_num])
-                    add_requests.append(self.get_create_l2_acl_rule_request(acl_name, seq_num, want_acl['rules'][seq_num]))
+                    rule_add_commands.append(want_acl['rules'][seq_num].to_dict())
+                    add_rules[seq_num] = want_acl['rules'][seq_num]
 
             # Add new rules
             for seq_num in want_seq_nums.difference(have_seq_nums):
-                rule_add_commands.append(want_acl['rules'][seq_num])
-                add_requests.append(self.get_create_l2_acl_rule_request(acl_name, seq_num, want_acl['rules'][seq_num]))
+                rule_add_commands.append(want_acl['rules'][seq_num].to_dict())
+                add_rules[seq_num] = want_acl['rules'][seq_num]
+
+            del_requests.extend(self.get_delete_l2_acl_rules_requests(acl_name, del_seq_nums, have_seq_nums))
+            add_requests.extend(self.get_create_l2_acl_rules_requests(acl_name, add_rules))
 
             if rule_del_commands:
                 acl_del_command['rules'] = rule_del_commands
@@ -296,8 +322,8 @@ class L2_acls(ConfigBase):
             if want_seq_nums:
                 acl_add_command['rules'] = []
                 for seq_num in want_seq_nums:
-                    acl_add_command['rules'].append(want_acl['rules'][seq_num])
-                    add_requests.append(self.get_create_l2_acl_rule_request(acl_name, seq_num, want_acl['rules'][seq_num]))
+                    acl_add_command['rules'].append(want_acl['rules'][seq_num].to_dict())
+                add_requests.extend(self.get_create_l2_acl_rules_requests(acl_name, want_acl['rules']))
 
             add_commands.append(acl_add_command)
 
@@ -322,11 +348,11 @@ class L2_acls(ConfigBase):
         requests = []
 
         if not want:
-            for acl in have:
-                commands.append({'name': acl['name']})
-                requests.append(self.get_delete_l2_acl_request(acl['name']))
+            for acl_name in have:
+                commands.append({'name': acl_name})
+                requests.append(self.get_delete_l2_acl_request(acl_name))
         else:
-            have_dict = self._convert_config_list_to_dict(have)
+            have_dict = have
             want_dict = self._convert_config_list_to_dict(want)
             have_acl_names = set(have_dict.keys())
             want_acl_names = set(want_dict.keys())
@@ -353,9 +379,10 @@ class L2_acls(ConfigBase):
 
                 # Delete existing rules
                 # When state is deleted, options other than sequence_num are not considered
-                for seq_num in want_seq_nums.intersection(have_seq_nums):
+                del_seq_nums = want_seq_nums.intersection(have_seq_nums)
+                for seq_num in del_seq_nums:
                     rule_del_commands.append({'sequence_num': seq_num})
-                    requests.append(self.get_delete_l2_acl_rule_request(acl_name, seq_num))
+                requests.extend(self.get_delete_l2_acl_rules_requests(acl_name, del_seq_nums, have_seq_nums))
 
                 if rule_del_commands:
                     acl_del_command['rules'] = rule_del_commands
@@ -388,28 +415,41 @@ class L2_acls(ConfigBase):
         payload = {'description': remark}
         return {'path': url, 'method': PATCH, 'data': payload}
 
-    def get_create_l2_acl_rule_request(self, acl_name, seq_num, rule):
-        """Get request to create a rule with given sequence number
-        and configuration in the specified L2 ACL
+    def get_create_l2_acl_rules_requests(self, acl_name, rules):
+        """Get requests to create the given rules in the specified L2 ACL,
+        with up to 'chunk_size' rules in a single request
+
+        :param rules: dict of rule configuration keyed by sequence number
         """
+        requests = []
         url = self.l2_acl_rule_path.format(acl_name=acl_name)
-        payload = {
-            'openconfig-acl:acl-entry': [{
-                'sequence-id': seq_num,
+        entries = [self.get_l2_acl_rule_payload(seq_num, rules[seq_num]) for seq_num in sorted(rules)]
+        for chunk in get_chunks(entries, self._chunk_size):
+            payload = {'openconfig-acl:acl-entry': chunk}
+            requests.append({'path': url, 'method': POST, 'data': payload, 'independent': True})
+
+        return requests
+
+    @staticmethod
+    def get_l2_acl_rule_payload(seq_num, rule):
+        """Get the 'acl-entry' payload for a rule with given sequence number
+        and configuration
+        """
+        entry = {
+            'sequence-id': seq_num,
+            'config': {
+                'sequence-id': seq_num
+            },
+            'l2': {
+                'config': {}
+            },
+            'actions': {
                 'config': {
-                    'sequence-id': seq_num
-                },
-                'l2': {
-                    'config': {}
-                },
-                'actions': {
-                    'config': {
-                        'forwarding-action': action_value_to_payload_map[rule['action']]
-                    }
+                    'forwarding-action': action_value_to_payload_map[rule['action']]
                 }
-            }]
+            }
         }
-        rule_l2_config = payload['openconfig-acl:acl-entry'][0]['l2']['config']
+        rule_l2_config = entry['l2']['config']
 
         if rule['source'].get('host'):
             rule_l2_config['source-mac'] = rule['source']['host']
@@ -446,9 +486,9 @@ class L2_acls(ConfigBase):
                 rule_l2_config['pcp-mask'] = rule['pcp']['mask']
 
         if rule.get('remark'):
-            payload['openconfig-acl:acl-entry'][0]['config']['description'] = rule['remark']
+            entry['config']['description'] = rule['remark']
 
-        return {'path': url, 'method': POST, 'data': payload}
+        return entry
 
     def get_delete_l2_acl_request(self, acl_name):
         """Get request to delete L2 ACL with specified name"""
@@ -468,6 +508,19 @@ class L2_acls(ConfigBase):
         url += '/acl-entry={0}'.format(seq_num)
         return {'path': url, 'method': DELETE}
 
+    def get_delete_l2_acl_rules_requests(self, acl_name, seq_nums, have_seq_nums):
+        """Get requests to delete the rules with given sequence numbers
+        in the specified L2 ACL. All the rules are deleted with a single
+        request when none of the existing rules is retained.
+        """
+        if not seq_nums:
+            return []
+        if set(seq_nums) == set(have_seq_nums):
+            url = self.l2_acl_rule_path.format(acl_name=acl_name)
+            return [{'path': url, 'method': DELETE}]
+
+        return [self.get_delete_l2_acl_rule_request(acl_name, seq_num) for seq_num in sorted(seq_nums)]
+
     def validate_and_normalize_config(self, config_list):
         """Validate and normalize the given config"""
         # Remove empties and validate the config with argument spec
@@ -561,6 +614,22 @@ class L2_acls(ConfigBase):
             config_dict[acl_name]['rules'] = {}
             if config.get('rules'):
                 for rule in config['rules']:
-                    config_dict[acl_name]['rules'][rule['sequence_num']] = rule
+                    config_dict[acl_name]['rules'][rule['sequence_num']] = L2AclRule(rule)
 
         return config_dict
+
+    @staticmethod
+    def _convert_dict_to_config_list(config_dict):
+        config_list = []
+        for acl_name, acl in config_dict.items():
+            config = {'name': acl_name}
+            if acl['remark']:
+                config['remark'] = acl['remark']
+            if acl['rules']:
+                config['rules'] = [rule.to_dict() for rule in acl['rules'].values()]
+            config_list.append(config)
+
+        if config_list:
+            config_list = normalize_config(L2_aclsArgs.argument_spec, {'config': config_list}, remove_empties=True)['config']
+
+        return config_list
@@ -13,8 +13,6 @@ created
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-import json
-
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.cfg.base import (
     ConfigBase
 )
@@ -33,6 +31,9 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     to_request,
     edit_config
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.vlan_utils import (
+    VlanRangeSet
+)
 from ansible.module_utils._text import to_native
 from ansible.module_utils.connection import ConnectionError
 import copy
@@ -107,11 +108,12 @@ class L2_interfaces(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_l2_interfaces_facts = self.get_l2_interfaces_facts()
-
         result['before'] = existing_l2_interfaces_facts
         if result['changed']:
-            result['after'] = changed_l2_interfaces_facts
+            if self._module.check_mode:
+                result['after'] = existing_l2_interfaces_facts
+            else:
+                result['after'] = self.get_l2_interfaces_facts()
 
         result['warnings'] = warnings
         return result
@@ -265,39 +267,27 @@ class L2_interfaces(ConfigBase):
         if match_trunk:
             match_trunk_vlans = match_trunk.get('allowed_vlans', [])
             if conf_allowed_vlans and match_trunk_vlans:
-                vlan_id_list = ""
-                conf_vlan_index = 0
+                match_vlan_set = VlanRangeSet.from_allowed_vlans(match_trunk_vlans)
+                delete_vlan_set = VlanRangeSet()
                 pop_list = []
-                for each_allowed_vlan in conf_allowed_vlans:
-                    vlan_id = each_allowed_vlan.get('vlan')
-                    if not vlan_id:
-                        pop_list.insert(0, conf_vlan_index)
-                        conf_vlan_index += 1
-                        continue
-                    if self.input_vlan_id_in_device_config(vlan_id, match_trunk_vlans):
-                        if '-' in vlan_id:
-                            vlan_id_fmt = vlan_id.replace('-', '..')
-                        else:
-                            vlan_id_fmt = vlan_id
-
-                        if vlan_id_list:
-                            vlan_id_list += ",{0}".format(vlan_id_fmt)
-                        else:
-                            vlan_id_list = vlan_id_fmt
+                for conf_vlan_index, each_allowed_vlan in enumerate(conf_allowed_vlans):
+                    vlan_set = VlanRangeSet.from_values([each_allowed_vlan.get('vlan')])
+                    common_vlan_set = vlan_set & match_vlan_set
+                    if common_vlan_set:
+                        delete_vlan_set = delete_vlan_set | common_vlan_set
                     else:
-                        # defer popping of unconfigured vlans until completion of the outer loop.
+                        # defer popping of unconfigured vlans until completion of the loop.
                         pop_list.insert(0, conf_vlan_index)
 
-                    conf_vlan_index += 1
-
-                if vlan_id_list:
+                if delete_vlan_set:
                     key = intf_key
                     if name.startswith('PortChannel'):
                         key = port_chnl_key
 
+                    # Only the configured portion of the requested vlans is deleted
                     url = "data/openconfig-interfaces:interfaces/interface={0}/{1}/".format(name, key)
                     url += "openconfig-vlan:switched-vlan/config/"
-                    url += "trunk-vlans=" + vlan_id_list.replace(',', '%2C')
+                    url += "trunk-vlans=" + '%2C'.join(delete_vlan_set.to_ranges('..'))
 
                     request = {"path": url, "method": method}
                     requests.append(request)
@@ -444,187 +434,32 @@ class L2_interfaces(ConfigBase):
         return requests
 
     def build_create_payload(self, conf, matched):
-        payload_url = '{"openconfig-vlan:config":{ '
-        access_payload = ''
-        trunk_payload = ''
+        vlan_config = {}
         if conf.get('access'):
-            access_vlan_id = conf['access']['vlan']
-            access_payload = '"access-vlan": {0}'.format(access_vlan_id)
+            vlan_config['access-vlan'] = conf['access']['vlan']
         if conf.get('trunk') and conf['trunk'].get('allowed_vlans'):
-            trunk_payload = '"trunk-vlans": ['
-            cnt = 0
-            pop_list = []
-            conf_vlan_index = 0
-            match_trunk_vlans = []
-            match_trunk = {}
-            if matched:
-                match_trunk = matched.get('trunk')
-            if match_trunk:
-                match_trunk_vlans = match_trunk.get('allowed_vlans', [])
-
-            for each_allowed_vlan in conf['trunk']['allowed_vlans']:
-                vlan_val = each_allowed_vlan['vlan']
-                # The following idempotency handling is required because of
-                # vlan trunk ranges. A configured range can contain a vlan or
-                # range that has been requested for configuration in the
-                # executing playbook. In this case, the requested vlan or range will
-                # not be removed during "get_diff" processing because the subset
-                # vlan or range value will not match the value of a larger
-                # configured range in which it is contained.
-                #
-                # Don't request configuration of any vlans or ranges that are already
-                # configured on the target device.
-                if match_trunk_vlans:
-                    if self.vlan_or_range_is_already_configured(vlan_val, match_trunk_vlans):
-                        # Defer popping of already configured vlan values until
-                        # completion of the loop.
-                        pop_list.insert(0, conf_vlan_index)
-                        conf_vlan_index += 1
-                        continue
-
-                if '-' in vlan_val:
-                    request_vlan_val = '"{0}"'.format(vlan_val.replace("-", ".."))
-                else:
-                    request_vlan_val = vlan_val
-                conf_vlan_index += 1
-
-                # The specified vlan or range is not already fully configured
-                # on the target device, so include it in the request.
-                if cnt > 0:
-                    trunk_payload += ','
-                trunk_payload += request_vlan_val
-                cnt = cnt + 1
-
-            if cnt:
+            match_vlan_set = VlanRangeSet()
+            if matched and matched.get('trunk'):
+                match_vlan_set = VlanRangeSet.from_allowed_vlans(matched['trunk'].get('allowed_vlans'))
+
+            # A requested vlan or range can be contained in the configured
+            # ranges without matching any of them as a string, in which case
+            # "get_diff" processing keeps it. Only the vlans that are not
+            # configured yet on the target device are requested.
+            conf_allowed_vlans = conf['trunk']['allowed_vlans']
+            add_vlan_set = VlanRangeSet.from_allowed_vlans(conf_allowed_vlans) - match_vlan_set
+            if add_vlan_set:
                 # Remove from the list of "invocation" configured vlans any
                 # vlans or ranges that are already configured on the target
                 # device. This enables correct reporting of the vlans that
                 # are actually being configured on the device.
-                for pop_list_index in pop_list:
-                    conf['trunk']['allowed_vlans'].pop(pop_list_index)
-                trunk_payload += ']'
-            else:
-                trunk_payload = ''
+                conf['trunk']['allowed_vlans'] = [
+                    each_allowed_vlan for each_allowed_vlan in conf_allowed_vlans
+                    if not VlanRangeSet.from_values([each_allowed_vlan['vlan']]) <= match_vlan_set
+                ]
+                vlan_config['trunk-vlans'] = add_vlan_set.to_payload()
 
-        if access_payload == '' and trunk_payload == '':
+        if not vlan_config:
             return ''
 
-        if access_payload != '':
-            payload_url += access_payload
-        if trunk_payload != '':
-            if access_payload != '':
-                payload_url += ','
-            payload_url += trunk_payload
-
-        payload_url += '}}'
-
-        ret_payload = json.loads(payload_url)
-        return ret_payload
-
-    def get_range_bounds(self, range_val):
-        """Assume an input range value that is a string containing either
-        a single integer value or a range string with bounds separated by
-        a "-' character or "..".
-        Return integer values for the lower and upper bounds of the
-        input range string.
-        """
-
-        range_bounds = []
-        if '-' in range_val:
-            range_bounds = range_val.split("-")
-        elif '..' in range_val:
-            range_bounds = range_val.split("..")
-        if range_bounds:
-            range_lower = int(range_bounds[0])
-            range_upper = int(range_bounds[1])
-        else:
-            range_lower = range_upper = int(range_val)
-
-        return range_lower, range_upper
-
-    def vlan_range_subset(self, subset, superset):
-        """Vlan range string subset check:
-
-        Determine what portion of the range or vlan specified by the input
-        "subset" string is a subset of the range specified by the input
-        "superset" string. If any portion of the input subset is contained
-        in the input superset, return a string specifying the contained
-        portion as either a single vlan or a range string in the form
-        "<lower bound>..<upper bound>". If no portion of the input subset
-        string is contained in the input superset string, return an empty
-        string.
-        """
-
-        subset_lower, subset_upper = self.get_range_bounds(subset)
-        superset_lower, superset_upper = self.get_range_bounds(superset)
-
-        # Check for a subset fully contained in the superset.
-        if subset_lower >= superset_lower and subset_upper <= superset_upper:
-            return subset
-
-        # Check for a subset lower bound contained in the superset.
-        if subset_lower >= superset_lower and subset_lower <= superset_upper:
-            if subset_lower == superset_upper:
-                # The subset portion is a single vlan.
-                return str(subset_lower)
-            return "{0}..{1}".format(str(subset_lower), str(superset_upper))
-
-        # Check for a subset upper bound contained in the superset.
-        if subset_upper <= superset_upper and subset_upper >= superset_lower:
-            if superset_lower == subset_upper:
-                return str(subset_upper)
-            return "{0}..{1}".format(str(superset_lower), str(subset_upper))
-
-        # None of the subset is contained in the superset.
-        return ""
-
-    def vlan_or_range_is_already_configured(self, input_vlan_val, match_trunk_vlans):
-        """ Determine if the trunk vlan or range specified by input_vlan_val
-            is already fully configured on the target device.
-
-        :param input_val: a string containing either a single vlan (integer)
-                          value or a range in the form "x-y" or "x..y".
-        :param match_trunk_vlans: the current trunk vlan configuration for the interface on
-                        which adding of the input_vlan_val trunk vlan(s) has been requested:
-                        specified as a list of individual vlan dictionaries.
-        :rtype: bool
-        :returns: True if the vlan or range is aleady configured on the device; False if
-                  the vlan or range is not already configured.
-        """
-        if not input_vlan_val or not match_trunk_vlans:
-            return False
-        input_range_lower, input_range_upper = self.get_range_bounds(input_vlan_val)
-
-        for match_trunk_vlan in match_trunk_vlans:
-            cfg_trunk_vlan_val = match_trunk_vlan.get('vlan')
-            if not cfg_trunk_vlan_val:
-                continue
-            overlap_vlans = self.vlan_range_subset(input_vlan_val, cfg_trunk_vlan_val)
-            if overlap_vlans:
-                overlap_range_lower, overlap_range_upper = self.get_range_bounds(overlap_vlans)
-                if overlap_range_lower == input_range_lower and overlap_range_upper == input_range_upper:
-                    return True
-        return False
-
-    def input_vlan_id_in_device_config(self, input_vlan_id, match_trunk_vlans):
-        """ Determine if any portion of the trunk vlan or range specified by input_vlan_id
-            is configured on the target device.
-
-        :param input_vlan_id: a string containing either a single vlan (integer)
-                              value or a range in the form "x-y" or "x..y".
-        :param match_trunk_vlans: the current trunk vlan configuration for the interface on
-                        which adding of the input_vlan_val trunk vlan(s) has been requested:
-                        specified as a list of individual vlan dictionaries.
-        :rtype: bool
-        :returns: True if any portion of the vlan or range is aleady configured on the
-                  device; False if the vlan or range is not already configured.
-        """
-        for match_trunk_vlan in match_trunk_vlans:
-            cfg_vlan_id = match_trunk_vlan.get('vlan')
-            if not cfg_vlan_id:
-                continue
-            vlan_id = self.vlan_range_subset(input_vlan_id,
-                                             cfg_vlan_id)
-            if vlan_id:
-                return True
-        return False
+        return {'openconfig-vlan:config': vlan_config}
@@ -27,8 +27,13 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     remove_empties,
     validate_config
 )
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import Facts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.l3_acls.l3_acls import L3_aclsArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_acls.l3_acls import L3_aclsFacts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.acl_utils import AclRule
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.spec_utils import normalize_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    get_chunk_size,
+    get_chunks,
     update_states
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
@@ -107,6 +112,11 @@ protocol_number_to_payload_map = {
 dscp_name_to_value_map = {v: k for k, v in dscp_value_to_name_map.items()}
 
 
+class L3AclRule(AclRule):
+    """Normalized L3 ACL rule"""
+    __slots__ = tuple(sorted(L3_aclsArgs.argument_spec['config']['options']['acls']['options']['rules']['options']))
+
+
 class L3_acls(ConfigBase):
     """
     The sonic_l3_acls class
@@ -128,18 +138,37 @@ class L3_acls(ConfigBase):
 
     def __init__(self, module):
         super(L3_acls, self).__init__(module)
+        self._chunk_size = get_chunk_size(module)
 
     def get_l3_acls_facts(self):
-        """ Get the 'facts' (the current configuration)
+        """ Get the current configuration, with the rules built as
+        L3AclRule records directly from the device response
 
         :rtype: A dictionary
-        :returns: The current configuration as a dictionary
+        :returns: The current configuration as a dictionary keyed by
+                  address family and ACL name
         """
-        facts, _warnings = Facts(self._module).get_facts(self.gather_subset, self.gather_network_resources)
-        l3_acls_facts = facts['ansible_network_resources'].get('l3_acls')
-        if not l3_acls_facts:
-            return []
-        return l3_acls_facts
+        # Only the ACLs specified in the task need to be read from the device
+        self._module._sonic_l3_acl_targets = self.get_acl_targets()
+        return L3_aclsFacts(self._module).get_l3_acl_records(L3AclRule)
+
+    def get_acl_targets(self):
+        """Get the (address_family, name) pairs of the ACLs specified
+        in the task, or None if the configuration of all ACLs is required
+        """
+        config = self._module.params['config']
+        if self._module.params['state'] == 'overridden' or not config:
+            return None
+
+        acl_targets = []
+        for conf in config:
+            # All ACLs of a type are deleted when no ACL name is specified
+            if not conf.get('acls'):
+                return None
+            for acl in conf['acls']:
+                acl_targets.append((conf['address_family'], acl['name']))
+
+        return acl_targets
 
     def execute_module(self):
         """ Execute the module
@@ -161,11 +190,12 @@ class L3_acls(ConfigBase):
 
             result['changed'] = True
 
-        changed_l3_acls_facts = self.get_l3_acls_facts()
-
-        result['before'] = existing_l3_acls_facts
+        result['before'] = self._convert_dict_to_config_list(existing_l3_acls_facts)
         if result['changed']:
-            result['after'] = changed_l3_acls_facts
+            if self._module.check_mode:
+                result['after'] = result['before']
+            else:
+                result['after'] = self._convert_dict_to_config_list(self.get_l3_acls_facts())
 
         result['commands'] = commands
         result['warnings'] = warnings
@@ -240,7 +270,7 @@ class L3_acls(ConfigBase):
         del_requests = []
         requests = []
 
-        have_dict = self._convert_config_list_to_dict(have)
+        have_dict = have
         want_dict = self._convert_config_list_to_dict(want)
 
         for acl_type in ('ipv4', 'ipv6'):
@@ -276,12 +306,14 @@ class L3_acls(ConfigBase):
 
                 have_seq_nums = set(have_acl['rules'].keys())
                 want_seq_nums = set(want_acl['rules'].keys())
+                del_seq_nums = []
+                add_rules = {}
 
                 if state in ('replaced', 'overridden'):
                     # Delete non-modified rules
                     for seq_num in have_seq_nums.difference(want_seq_nums):
                         rule_del_commands.append({'sequence_num': seq_num})
-                        del_requests.append(self.get_delete_l3_acl_rule_request(acl_type, acl_name, seq_num))
+                        del_seq_nums.append(seq_num)
 
                 for seq_num in want_seq_nums.intersection(have_seq_nums):
                     # Replace existing rules
@@ -293,15 +325,18 @@ class L3_acls(ConfigBase):
                             )
 
                         rule_del_commands.append({'sequence_num': seq_num})
-                        del_requests.append(self.get_delete_l3_acl_rule_request(acl_type, acl_name, seq_num))
+                        del_seq_nums.append(seq_num)
 
-                        rule_add_commands.append(want_acl['rules'][seq_num])
-                        add_requests.append(self.get_create_l3_acl_rule_request(acl_type, acl_name, seq_num, want_acl['rules'][seq_num]))
+                        rule_add_commands.append(want_acl['rules'][seq_num].to_dict())
+                        add_rules[seq_num] = want_acl['rules'][seq_num]
 
                 # Add new rules
                 for seq_num in want_seq_nums.difference(have_seq_nums):
-                    rule_add_commands.append(want_acl['rules'][seq_num])
-                    add_requests.append(self.get_create_l3_acl_rule_request(acl_type, acl_name, seq_num, want_acl['rules'][seq_num]))
+                    rule_add_commands.append(want_acl['rules'][seq_num].to_dict())
+                    add_rules[seq_num] = want_acl['rules'][seq_num]
+
+                del_requests.extend(self.get_delete_l3_acl_rules_requests(acl_type, acl_name, del_seq_nums, have_seq_nums))
+                add_requests.extend(self.get_create_l3_acl_rules_requests(acl_type, acl_name, add_rules))
 
                 if rule_del_commands:
                     acl_del_command['rules'] = rule_del_commands
@@ -328,8 +363,8 @@ class L3_acls(ConfigBase):
                 if want_seq_nums:
                     acl_add_command['rules'] = []
                     for seq_num in want_seq_nums:
-                        acl_add_command['rules'].append(want_acl['rules'][seq_num])
-                        add_requests.append(self.get_create_l3_acl_rule_request(acl_type, acl_name, seq_num, want_acl['rules'][seq_num]))
+                        acl_add_command['rules'].append(want_acl['rules'][seq_num].to_dict())
+                    add_requests.extend(self.get_create_l3_acl_rules_requests(acl_type, acl_name, want_acl['rules']))
 
                 acl_type_add_commands.append(acl_add_command)
 
@@ -360,20 +395,16 @@ class L3_acls(ConfigBase):
         requests = []
 
         if not want:
-            for config in have:
-                if not config.get('acls'):
-                    continue
-
+            for acl_type in ('ipv4', 'ipv6'):
                 acl_type_commands = []
-                acl_type = config['address_family']
-                for acl in config['acls']:
-                    acl_type_commands.append({'name': acl['name']})
-                    requests.append(self.get_delete_l3_acl_request(acl_type, acl['name']))
+                for acl_name in have.get(acl_type, {}):
+                    acl_type_commands.append({'name': acl_name})
+                    requests.append(self.get_delete_l3_acl_request(acl_type, acl_name))
 
                 if acl_type_commands:
                     commands.append({'address_family': acl_type, 'acls': acl_type_commands})
         else:
-            have_dict = self._convert_config_list_to_dict(have)
+            have_dict = have
             want_dict = self._convert_config_list_to_dict(want)
 
             for acl_type in ('ipv4', 'ipv6'):
@@ -409,9 +440,10 @@ class L3_acls(ConfigBase):
 
                     # Delete existing rules
                     # When state is deleted, options other than sequence_num are not considered
-                    for seq_num in want_seq_nums.intersection(have_seq_nums):
+                    del_seq_nums = want_seq_nums.intersection(have_seq_nums)
+                    for seq_num in del_seq_nums:
                         rule_del_commands.append({'sequence_num': seq_num})
-                        requests.append(self.get_delete_l3_acl_rule_request(acl_type, acl_name, seq_num))
+                    requests.extend(self.get_delete_l3_acl_rules_requests(acl_type, acl_name, del_seq_nums, have_seq_nums))
 
                     if rule_del_commands:
                         acl_del_command['rules'] = rule_del_commands
@@ -447,32 +479,44 @@ class L3_acls(ConfigBase):
         payload = {'description': remark}
         return {'path': url, 'method': PATCH, 'data': payload}
 
-    def get_create_l3_acl_rule_request(self, acl_type, acl_name, seq_num, rule):
-        """Get request to create a rule with given sequence number
-        and configuration in the specified L3 ACL
+    def get_create_l3_acl_rules_requests(self, acl_type, acl_name, rules):
+        """Get requests to create the given rules in the specified L3 ACL,
+        with up to 'chunk_size' rules in a single request
+
+        :param rules: dict of rule configuration keyed by sequence number
         """
+        requests = []
         url = self.l3_acl_rule_path.format(acl_name=acl_name, acl_type=acl_type_to_payload_map[acl_type])
-        payload = {
-            'openconfig-acl:acl-entry': [{
-                'sequence-id': seq_num,
+        entries = [self.get_l3_acl_rule_payload(acl_type, seq_num, rules[seq_num]) for seq_num in sorted(rules)]
+        for chunk in get_chunks(entries, self._chunk_size):
+            payload = {'openconfig-acl:acl-entry': chunk}
+            requests.append({'path': url, 'method': POST, 'data': payload, 'independent': True})
+
+        return requests
+
+    def get_l3_acl_rule_payload(self, acl_type, seq_num, rule):
+        """Get the 'acl-entry' payload for a rule with given sequence number
+        and configuration in an L3 ACL of the specified type
+        """
+        entry = {
+            'sequence-id': seq_num,
+            'config': {
+                'sequence-id': seq_num
+            },
+            acl_type: {
+                'config': {}
+            },
+            'transport': {
+                'config': {}
+            },
+            'actions': {
                 'config': {
-                    'sequence-id': seq_num
-                },
-                acl_type: {
-                    'config': {}
-                },
-                'transport': {
-                    'config': {}
-                },
-                'actions': {
-                    'config': {
-                        'forwarding-action': action_value_to_payload_map[rule['action']]
-                    }
+                    'forwarding-action': action_value_to_payload_map[rule['action']]
                 }
-            }]
+            }
         }
-        rule_l3_config = payload['openconfig-acl:acl-entry'][0][acl_type]['config']
-        rule_l4_config = payload['openconfig-acl:acl-entry'][0]['transport']['config']
+        rule_l3_config = entry[acl_type]['config']
+        rule_l4_config = entry['transport']['config']
 
         if rule['protocol'].get('number') is not None:
             protocol = rule['protocol']['number']
@@ -519,7 +563,7 @@ class L3_acls(ConfigBase):
                         rule_l4_config['tcp-flags'] = tcp_flag_list
 
         if rule.get('vlan_id') is not None:
-            payload['openconfig-acl:acl-entry'][0]['l2'] = {
+            entry['l2'] = {
                 'config': {
                     'vlanid': rule['vlan_id']
                 }
@@ -534,9 +578,9 @@ class L3_acls(ConfigBase):
                     rule_l3_config['dscp'] = dscp_name_to_value_map[dscp_opt]
 
         if rule.get('remark'):
-            payload['openconfig-acl:acl-entry'][0]['config']['description'] = rule['remark']
+            entry['config']['description'] = rule['remark']
 
-        return {'path': url, 'method': POST, 'data': payload}
+        return entry
 
     def get_delete_l3_acl_request(self, acl_type, acl_name):
         """Get request to delete L3 ACL with specified type and name"""
@@ -556,6 +600,19 @@ class L3_acls(ConfigBase):
         url += '/acl-entry={0}'.format(seq_num)
         return {'path': url, 'method': DELETE}
 
+    def get_delete_l3_acl_rules_requests(self, acl_type, acl_name, seq_nums, have_seq_nums):
+        """Get requests to delete the rules with given sequence numbers
+        in the specified L3 ACL. All the rules are deleted with a single
+        request when none of the existing rules is retained.
+        """
+        if not seq_nums:
+            return []
+        if set(seq_nums) == set(have_seq_nums):
+            url = self.l3_acl_rule_path.format(acl_name=acl_name, acl_type=acl_type_to_payload_map[acl_type])
+            return [{'path': url, 'method': DELETE}]
+
+        return [self.get_delete_l3_acl_rule_request(acl_type, acl_name, seq_num) for seq_num in sorted(seq_nums)]
+
     def validate_and_normalize_config(self, config_list):
         """Validate and normalize the given config"""
         # Remove empties and validate the config with argument spec
@@ -696,10 +753,30 @@ class L3_acls(ConfigBase):
                     config_dict[acl_type][acl_name]['rules'] = {}
                     if acl.get('rules'):
                         for rule in acl['rules']:
-                            config_dict[acl_type][acl_name]['rules'][rule['sequence_num']] = rule
+                            config_dict[acl_type][acl_name]['rules'][rule['sequence_num']] = L3AclRule(rule)
 
         return config_dict
 
+    @staticmethod
+    def _convert_dict_to_config_list(config_dict):
+        config_list = []
+        for acl_type in ('ipv4', 'ipv6'):
+            acls = []
+            for acl_name, acl in config_dict.get(acl_type, {}).items():
+                config = {'name': acl_name}
+                if acl['remark']:
+                    config['remark'] = acl['remark']
+                if acl['rules']:
+                    config['rules'] = [rule.to_dict() for rule in acl['rules'].values()]
+                acls.append(config)
+            if acls:
+                config_list.append({'address_family': acl_type, 'acls': acls})
+
+        if config_list:
+            config_list = normalize_config(L3_aclsArgs.argument_spec, {'config': config_list}, remove_empties=True)['config']
+
+        return config_list
+
     @staticmethod
     def _convert_port_dict_to_payload_format(port_dict):
         payload = None
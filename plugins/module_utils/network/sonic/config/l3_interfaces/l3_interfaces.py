@@ -89,11 +89,12 @@ class L3_interfaces(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_l3_interfaces_facts = self.get_l3_interfaces_facts()
-
         result['before'] = existing_l3_interfaces_facts
         if result['changed']:
-            result['after'] = changed_l3_interfaces_facts
+            if self._module.check_mode:
+                result['after'] = existing_l3_interfaces_facts
+            else:
+                result['after'] = self.get_l3_interfaces_facts()
 
         result['warnings'] = warnings
         return result
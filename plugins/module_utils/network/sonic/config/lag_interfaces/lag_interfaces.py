@@ -113,11 +113,12 @@ class Lag_interfaces(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_lag_interfaces_facts = self.get_lag_interfaces_facts()
-
         result['before'] = existing_lag_interfaces_facts
         if result['changed']:
-            result['after'] = changed_lag_interfaces_facts
+            if self._module.check_mode:
+                result['after'] = existing_lag_interfaces_facts
+            else:
+                result['after'] = self.get_lag_interfaces_facts()
 
         result['warnings'] = warnings
         return result
@@ -96,11 +96,12 @@ class Lldp_global(ConfigBase):
                     self._module.fail_json(msg=str(exc), code=exc.code)
             result['changed'] = True
 
-        changed_lldp_global_facts = self.get_lldp_global_facts()
-
         result['before'] = existing_lldp_global_facts
         if result['changed']:
-            result['after'] = changed_lldp_global_facts
+            if self._module.check_mode:
+                result['after'] = existing_lldp_global_facts
+            else:
+                result['after'] = self.get_lldp_global_facts()
 
         result['commands'] = commands
         result['warnings'] = warnings
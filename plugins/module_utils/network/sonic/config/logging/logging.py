@@ -98,11 +98,12 @@ class Logging(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_logging_facts = self.get_logging_facts()
-
         result['before'] = existing_logging_facts
         if result['changed']:
-            result['after'] = changed_logging_facts
+            if self._module.check_mode:
+                result['after'] = existing_logging_facts
+            else:
+                result['after'] = self.get_logging_facts()
 
         result['warnings'] = warnings
         return result
@@ -90,11 +90,12 @@ class Mclag(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_mclag_facts = self.get_mclag_facts()
-
         result['before'] = existing_mclag_facts
         if result['changed']:
-            result['after'] = changed_mclag_facts
+            if self._module.check_mode:
+                result['after'] = existing_mclag_facts
+            else:
+                result['after'] = self.get_mclag_facts()
 
         result['warnings'] = warnings
         return result
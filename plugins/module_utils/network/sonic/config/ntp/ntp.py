@@ -97,11 +97,12 @@ class Ntp(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_ntp_facts = self.get_ntp_facts()
-
         result['before'] = existing_ntp_facts
         if result['changed']:
-            result['after'] = changed_ntp_facts
+            if self._module.check_mode:
+                result['after'] = existing_ntp_facts
+            else:
+                result['after'] = self.get_ntp_facts()
 
         result['warnings'] = warnings
         return result
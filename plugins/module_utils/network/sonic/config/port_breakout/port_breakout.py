@@ -83,11 +83,12 @@ class Port_breakout(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_port_breakout_facts = self.get_port_breakout_facts()
-
         result['before'] = existing_port_breakout_facts
         if result['changed']:
-            result['after'] = changed_port_breakout_facts
+            if self._module.check_mode:
+                result['after'] = existing_port_breakout_facts
+            else:
+                result['after'] = self.get_port_breakout_facts()
 
         result['warnings'] = warnings
         return result
@@ -229,10 +230,16 @@ class Port_breakout(ConfigBase):
         return requests
 
     def get_all_breakout_mode(self, have):
+        """Return the breakout mode of each port in have, as found by
+        get_port_breakout_mode. The modes the facts just found are reused.
+        """
+        component_modes = getattr(self._module, '_sonic_breakout_modes', {})
         new_have = []
         for cfg in have:
             name = cfg['name']
-            mode = get_breakout_mode(self._module, name)
+            if name not in component_modes:
+                component_modes[name] = get_breakout_mode(self._module, name)
+            mode = component_modes[name]
             if mode:
                 new_have.append({'name': name, 'mode': mode})
         return new_have
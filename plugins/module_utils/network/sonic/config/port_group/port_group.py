@@ -101,11 +101,12 @@ class Port_group(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_port_group_facts = self.get_port_group_facts()
-
         result['before'] = existing_port_group_facts
         if result['changed']:
-            result['after'] = changed_port_group_facts
+            if self._module.check_mode:
+                result['after'] = existing_port_group_facts
+            else:
+                result['after'] = self.get_port_group_facts()
 
         result['warnings'] = warnings
         return result
@@ -110,11 +110,12 @@ openconfig-routing-policy-ext:extended-prefixes/extended-prefix={},{},{}'
             result['changed'] = True
         result['commands'] = commands
 
-        changed_prefix_lists_facts = self.get_prefix_lists_facts()
-
         result['before'] = existing_prefix_lists_facts
         if result['changed']:
-            result['after'] = changed_prefix_lists_facts
+            if self._module.check_mode:
+                result['after'] = existing_prefix_lists_facts
+            else:
+                result['after'] = self.get_prefix_lists_facts()
 
         result['warnings'] = warnings
         return result
@@ -85,11 +85,12 @@ class Radius_server(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_radius_server_facts = self.get_radius_server_facts()
-
         result['before'] = existing_radius_server_facts
         if result['changed']:
-            result['after'] = changed_radius_server_facts
+            if self._module.check_mode:
+                result['after'] = existing_radius_server_facts
+            else:
+                result['after'] = self.get_radius_server_facts()
 
         result['warnings'] = warnings
         return result
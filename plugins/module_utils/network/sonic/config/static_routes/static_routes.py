@@ -85,17 +85,18 @@ class Static_routes(ConfigBase):
         if commands and len(requests) > 0:
             if not self._module.check_mode:
                 try:
-                    edit_config(self._module, to_request(self._module, requests))
+                    edit_config(self._module, to_request(self._module, requests), coalesce=True)
                 except ConnectionError as exc:
                     self._module.fail_json(msg=str(exc), code=exc.code)
             result['changed'] = True
         result['commands'] = commands
 
-        changed_static_routes_facts = self.get_static_routes_facts()
-
         result['before'] = existing_static_routes_facts
         if result['changed']:
-            result['after'] = changed_static_routes_facts
+            if self._module.check_mode:
+                result['after'] = existing_static_routes_facts
+            else:
+                result['after'] = self.get_static_routes_facts()
 
         result['warnings'] = warnings
         return result
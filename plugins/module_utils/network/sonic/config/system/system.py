@@ -85,11 +85,12 @@ class System(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_system_facts = self.get_system_facts()
-
         result['before'] = existing_system_facts
         if result['changed']:
-            result['after'] = changed_system_facts
+            if self._module.check_mode:
+                result['after'] = existing_system_facts
+            else:
+                result['after'] = self.get_system_facts()
 
         result['warnings'] = warnings
         return result
@@ -85,11 +85,12 @@ class Tacacs_server(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_tacacs_server_facts = self.get_tacacs_server_facts()
-
         result['before'] = existing_tacacs_server_facts
         if result['changed']:
-            result['after'] = changed_tacacs_server_facts
+            if self._module.check_mode:
+                result['after'] = existing_tacacs_server_facts
+            else:
+                result['after'] = self.get_tacacs_server_facts()
 
         result['warnings'] = warnings
         return result
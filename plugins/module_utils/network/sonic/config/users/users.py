@@ -92,13 +92,14 @@ class Users(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_users_facts = []
-        if not auth_error:
-            changed_users_facts = self.get_users_facts()
-
         result['before'] = existing_users_facts
         if result['changed']:
-            result['after'] = changed_users_facts
+            if self._module.check_mode:
+                result['after'] = existing_users_facts
+            elif auth_error:
+                result['after'] = []
+            else:
+                result['after'] = self.get_users_facts()
 
         result['warnings'] = warnings
         return result
@@ -22,12 +22,13 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import Facts
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    get_chunk_size,
     get_diff,
     update_states,
     remove_empties_from_list,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.interfaces_util import (
-    build_interfaces_create_request,
+    build_interfaces_bulk_create_requests,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
@@ -57,6 +58,7 @@ class Vlans(ConfigBase):
 
     def __init__(self, module):
         super(Vlans, self).__init__(module)
+        self._chunk_size = get_chunk_size(module)
 
     def get_vlans_facts(self):
         """ Get the 'facts' (the current configuration)
@@ -90,11 +92,12 @@ class Vlans(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_vlans_facts = self.get_vlans_facts()
-
         result['before'] = existing_vlans_facts
         if result['changed']:
-            result['after'] = changed_vlans_facts
+            if self._module.check_mode:
+                result['after'] = existing_vlans_facts
+            else:
+                result['after'] = self.get_vlans_facts()
 
         result['warnings'] = warnings
         return result
@@ -232,21 +235,12 @@ class Vlans(ConfigBase):
         requests = []
         if not configs:
             return requests
+        interfaces = []
         for vlan in configs:
             vlan_id = vlan.get("vlan_id")
             interface_name = "Vlan" + str(vlan_id)
             description = vlan.get("description", None)
-            request = build_interfaces_create_request(interface_name=interface_name)
-            requests.append(request)
-            if description:
-                requests.append(self.get_modify_vlan_config_attr(interface_name, 'description', description))
+            interfaces.append({"name": interface_name, "description": description})
 
+        requests = build_interfaces_bulk_create_requests(interfaces, self._chunk_size)
         return requests
-
-    def get_modify_vlan_config_attr(self, intf_name, attr_name, attr_value):
-        url = "data/openconfig-interfaces:interfaces/interface={}/config"
-        payload = {"openconfig-interfaces:config": {"name": intf_name, attr_name: attr_value}}
-        method = "PATCH"
-        request = {"path": url.format(intf_name), "method": method, "data": payload}
-
-        return request
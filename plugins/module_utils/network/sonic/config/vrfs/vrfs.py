@@ -86,17 +86,18 @@ class Vrfs(ConfigBase):
         if commands and len(requests) > 0:
             if not self._module.check_mode:
                 try:
-                    edit_config(self._module, to_request(self._module, requests))
+                    edit_config(self._module, to_request(self._module, requests), coalesce=True)
                 except ConnectionError as exc:
                     self._module.fail_json(msg=str(exc), code=exc.code)
             result['changed'] = True
         result['commands'] = commands
 
-        changed_vrf_interfaces_facts = self.get_vrf_facts()
-
         result['before'] = existing_vrf_interfaces_facts
         if result['changed']:
-            result['after'] = changed_vrf_interfaces_facts
+            if self._module.check_mode:
+                result['after'] = existing_vrf_interfaces_facts
+            else:
+                result['after'] = self.get_vrf_facts()
 
         result['warnings'] = warnings
         return result
@@ -88,11 +88,12 @@ class Vxlans(ConfigBase):
             result['changed'] = True
         result['commands'] = commands
 
-        changed_vxlans_facts = self.get_vxlans_facts()
-
         result['before'] = existing_vxlans_facts
         if result['changed']:
-            result['after'] = changed_vxlans_facts
+            if self._module.check_mode:
+                result['after'] = existing_vxlans_facts
+            else:
+                result['after'] = self.get_vxlans_facts()
 
         result['warnings'] = warnings
         return result
@@ -23,6 +23,7 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     edit_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.aaa.aaa import AaaArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.spec_utils import get_generated_spec, normalize_config
 
 GET = "get"
 
@@ -34,16 +35,7 @@ class AaaFacts(object):
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
         self.argument_spec = AaaArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_generated_spec(AaaArgs, subspec, options)
 
     def get_aaa(self):
         """Get aaa details available in chassis"""
@@ -73,7 +65,7 @@ class AaaFacts(object):
         objs = self.render_config(self.generated_spec, data)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = normalize_config(self.argument_spec, {'config': objs})
             facts['aaa'] = params['config']
 
         ansible_facts['ansible_network_resources'].update(facts)
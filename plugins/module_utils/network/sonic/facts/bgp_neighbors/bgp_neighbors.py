@@ -13,19 +13,12 @@ based on the configuration.
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-from copy import deepcopy
-
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
-    utils,
-)
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
-    remove_empties_from_list
-)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.bgp_neighbors.bgp_neighbors import Bgp_neighborsArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.spec_utils import get_generated_spec, normalize_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils import (
     get_all_bgp_neighbors,
     get_from_params_map,
-    get_peergroups,
+    get_bgp_snapshot,
 )
 
 
@@ -73,16 +66,7 @@ class Bgp_neighborsFacts(object):
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
         self.argument_spec = Bgp_neighborsArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_generated_spec(Bgp_neighborsArgs, subspec, options)
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for BGP
@@ -109,8 +93,8 @@ class Bgp_neighborsFacts(object):
         ansible_facts['ansible_network_resources'].pop('bgp_neighbors', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
-            facts['bgp_neighbors'] = remove_empties_from_list(params['config'])
+            params = normalize_config(self.argument_spec, {'config': objs}, remove_empties=True)
+            facts['bgp_neighbors'] = params['config']
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
 
@@ -129,6 +113,7 @@ class Bgp_neighborsFacts(object):
 
     def filter_neighbors_data(self, data):
         filtered_data = []
+        all_peergroups = get_bgp_snapshot(self._module).get_peergroups()
         for conf in data:
             vrf_name = conf['vrf_name']
             tmp = {}
@@ -139,7 +124,7 @@ class Bgp_neighborsFacts(object):
 
             tmp['vrf_name'] = vrf_name
             tmp['bgp_as'] = bgp_as
-            peergroup = get_peergroups(self._module, vrf_name)
+            peergroup = all_peergroups.get(vrf_name)
             if peergroup:
                 tmp['peer_group'] = peergroup
             fil_neighbors = []
@@ -12,85 +12,249 @@ calls the appropriate facts gathering function
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+from ansible.module_utils.common._collections_compat import Mapping
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.facts.facts import FactsArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import RequestCache
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.facts.facts import (
     FactsBase,
 )
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlans.vlans import VlansFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.interfaces.interfaces import InterfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_interfaces.l2_interfaces import L2_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_interfaces.l3_interfaces import L3_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lag_interfaces.lag_interfaces import Lag_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp.bgp import BgpFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_af.bgp_af import Bgp_afFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_neighbors.bgp_neighbors import Bgp_neighborsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_neighbors_af.bgp_neighbors_af import Bgp_neighbors_afFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_as_paths.bgp_as_paths import Bgp_as_pathsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_communities.bgp_communities import Bgp_communitiesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_ext_communities.bgp_ext_communities import (
-    Bgp_ext_communitiesFacts,
-)
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mclag.mclag import MclagFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.prefix_lists.prefix_lists import Prefix_listsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vrfs.vrfs import VrfsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vxlans.vxlans import VxlansFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.users.users import UsersFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.port_breakout.port_breakout import Port_breakoutFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.aaa.aaa import AaaFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.tacacs_server.tacacs_server import Tacacs_serverFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.system.system import SystemFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.radius_server.radius_server import Radius_serverFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.static_routes.static_routes import Static_routesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ntp.ntp import NtpFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.logging.logging import LoggingFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ip_neighbor.ip_neighbor import Ip_neighborFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.port_group.port_group import Port_groupFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.dhcp_relay.dhcp_relay import Dhcp_relayFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.acl_interfaces.acl_interfaces import Acl_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_acls.l2_acls import L2_aclsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_acls.l3_acls import L3_aclsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lldp_global.lldp_global import Lldp_globalFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bfd.bfd import BfdFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.copp.copp import CoppFacts
+
+
+class _LazyFactsMap(Mapping):
+    """Read-only map of resource names to their facts classes.
+
+    Each facts class is imported by its loader the first time it is
+    looked up, so a resource module only imports the facts it gathers
+    instead of all of them. The loaders import the classes explicitly
+    so that they are still found when the module is packaged.
+    """
+
+    def __init__(self, loaders):
+        self._loaders = loaders
+        self._classes = {}
+
+    def __getitem__(self, key):
+        facts_class = self._classes.get(key)
+        if facts_class is None:
+            facts_class = self._classes[key] = self._loaders[key]()
+        return facts_class
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self):
+        return len(self._loaders)
+
+
+def _load_vlans():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlans.vlans import VlansFacts
+    return VlansFacts
+
+
+def _load_interfaces():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.interfaces.interfaces import InterfacesFacts
+    return InterfacesFacts
+
+
+def _load_l2_interfaces():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_interfaces.l2_interfaces import L2_interfacesFacts
+    return L2_interfacesFacts
+
+
+def _load_l3_interfaces():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_interfaces.l3_interfaces import L3_interfacesFacts
+    return L3_interfacesFacts
+
+
+def _load_lag_interfaces():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lag_interfaces.lag_interfaces import Lag_interfacesFacts
+    return Lag_interfacesFacts
+
+
+def _load_bgp():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp.bgp import BgpFacts
+    return BgpFacts
+
+
+def _load_bgp_af():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_af.bgp_af import Bgp_afFacts
+    return Bgp_afFacts
+
+
+def _load_bgp_neighbors():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_neighbors.bgp_neighbors import Bgp_neighborsFacts
+    return Bgp_neighborsFacts
+
+
+def _load_bgp_neighbors_af():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_neighbors_af.bgp_neighbors_af import Bgp_neighbors_afFacts
+    return Bgp_neighbors_afFacts
+
+
+def _load_bgp_as_paths():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_as_paths.bgp_as_paths import Bgp_as_pathsFacts
+    return Bgp_as_pathsFacts
+
+
+def _load_bgp_communities():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_communities.bgp_communities import Bgp_communitiesFacts
+    return Bgp_communitiesFacts
+
+
+def _load_bgp_ext_communities():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_ext_communities.bgp_ext_communities import (
+        Bgp_ext_communitiesFacts,
+    )
+    return Bgp_ext_communitiesFacts
+
+
+def _load_mclag():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mclag.mclag import MclagFacts
+    return MclagFacts
+
+
+def _load_prefix_lists():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.prefix_lists.prefix_lists import Prefix_listsFacts
+    return Prefix_listsFacts
+
+
+def _load_vrfs():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vrfs.vrfs import VrfsFacts
+    return VrfsFacts
+
+
+def _load_vxlans():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vxlans.vxlans import VxlansFacts
+    return VxlansFacts
+
+
+def _load_users():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.users.users import UsersFacts
+    return UsersFacts
+
+
+def _load_system():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.system.system import SystemFacts
+    return SystemFacts
+
+
+def _load_port_breakout():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.port_breakout.port_breakout import Port_breakoutFacts
+    return Port_breakoutFacts
+
+
+def _load_aaa():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.aaa.aaa import AaaFacts
+    return AaaFacts
+
+
+def _load_tacacs_server():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.tacacs_server.tacacs_server import Tacacs_serverFacts
+    return Tacacs_serverFacts
+
+
+def _load_radius_server():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.radius_server.radius_server import Radius_serverFacts
+    return Radius_serverFacts
+
+
+def _load_static_routes():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.static_routes.static_routes import Static_routesFacts
+    return Static_routesFacts
+
+
+def _load_ntp():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ntp.ntp import NtpFacts
+    return NtpFacts
+
+
+def _load_logging():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.logging.logging import LoggingFacts
+    return LoggingFacts
+
+
+def _load_ip_neighbor():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ip_neighbor.ip_neighbor import Ip_neighborFacts
+    return Ip_neighborFacts
+
+
+def _load_port_group():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.port_group.port_group import Port_groupFacts
+    return Port_groupFacts
+
+
+def _load_dhcp_relay():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.dhcp_relay.dhcp_relay import Dhcp_relayFacts
+    return Dhcp_relayFacts
+
+
+def _load_acl_interfaces():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.acl_interfaces.acl_interfaces import Acl_interfacesFacts
+    return Acl_interfacesFacts
+
+
+def _load_l2_acls():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_acls.l2_acls import L2_aclsFacts
+    return L2_aclsFacts
+
+
+def _load_l3_acls():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_acls.l3_acls import L3_aclsFacts
+    return L3_aclsFacts
+
+
+def _load_lldp_global():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lldp_global.lldp_global import Lldp_globalFacts
+    return Lldp_globalFacts
+
+
+def _load_bfd():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bfd.bfd import BfdFacts
+    return BfdFacts
+
+
+def _load_copp():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.copp.copp import CoppFacts
+    return CoppFacts
 
 
 FACT_LEGACY_SUBSETS = {}
-FACT_RESOURCE_SUBSETS = dict(
-    vlans=VlansFacts,
-    interfaces=InterfacesFacts,
-    l2_interfaces=L2_interfacesFacts,
-    l3_interfaces=L3_interfacesFacts,
-    lag_interfaces=Lag_interfacesFacts,
-    bgp=BgpFacts,
-    bgp_af=Bgp_afFacts,
-    bgp_neighbors=Bgp_neighborsFacts,
-    bgp_neighbors_af=Bgp_neighbors_afFacts,
-    bgp_as_paths=Bgp_as_pathsFacts,
-    bgp_communities=Bgp_communitiesFacts,
-    bgp_ext_communities=Bgp_ext_communitiesFacts,
-    mclag=MclagFacts,
-    prefix_lists=Prefix_listsFacts,
-    vrfs=VrfsFacts,
-    vxlans=VxlansFacts,
-    users=UsersFacts,
-    system=SystemFacts,
-    port_breakout=Port_breakoutFacts,
-    aaa=AaaFacts,
-    tacacs_server=Tacacs_serverFacts,
-    radius_server=Radius_serverFacts,
-    static_routes=Static_routesFacts,
-    ntp=NtpFacts,
-    logging=LoggingFacts,
-    ip_neighbor=Ip_neighborFacts,
-    port_group=Port_groupFacts,
-    dhcp_relay=Dhcp_relayFacts,
-    acl_interfaces=Acl_interfacesFacts,
-    l2_acls=L2_aclsFacts,
-    l3_acls=L3_aclsFacts,
-    lldp_global=Lldp_globalFacts,
-    bfd=BfdFacts,
-    copp=CoppFacts
-)
+FACT_RESOURCE_SUBSETS = _LazyFactsMap(dict(
+    vlans=_load_vlans,
+    interfaces=_load_interfaces,
+    l2_interfaces=_load_l2_interfaces,
+    l3_interfaces=_load_l3_interfaces,
+    lag_interfaces=_load_lag_interfaces,
+    bgp=_load_bgp,
+    bgp_af=_load_bgp_af,
+    bgp_neighbors=_load_bgp_neighbors,
+    bgp_neighbors_af=_load_bgp_neighbors_af,
+    bgp_as_paths=_load_bgp_as_paths,
+    bgp_communities=_load_bgp_communities,
+    bgp_ext_communities=_load_bgp_ext_communities,
+    mclag=_load_mclag,
+    prefix_lists=_load_prefix_lists,
+    vrfs=_load_vrfs,
+    vxlans=_load_vxlans,
+    users=_load_users,
+    system=_load_system,
+    port_breakout=_load_port_breakout,
+    aaa=_load_aaa,
+    tacacs_server=_load_tacacs_server,
+    radius_server=_load_radius_server,
+    static_routes=_load_static_routes,
+    ntp=_load_ntp,
+    logging=_load_logging,
+    ip_neighbor=_load_ip_neighbor,
+    port_group=_load_port_group,
+    dhcp_relay=_load_dhcp_relay,
+    acl_interfaces=_load_acl_interfaces,
+    l2_acls=_load_l2_acls,
+    l3_acls=_load_l3_acls,
+    lldp_global=_load_lldp_global,
+    bfd=_load_bfd,
+    copp=_load_copp
+))
 
 
 class Facts(FactsBase):
@@ -102,6 +266,7 @@ class Facts(FactsBase):
 
     def __init__(self, module):
         super(Facts, self).__init__(module)
+        self.request_cache = None
 
     def get_facts(self, legacy_facts_type=None, resource_facts_type=None, data=None):
         """ Collect the facts for sonic
@@ -114,7 +279,15 @@ class Facts(FactsBase):
         """
         netres_choices = FactsArgs.argument_spec['gather_network_resources'].get('choices', [])
         if self.VALID_RESOURCE_SUBSETS:
-            self.get_network_resources_facts(FACT_RESOURCE_SUBSETS, resource_facts_type, data)
+            # Resources reading the same tree (e.g. openconfig-interfaces)
+            # share the response within this invocation
+            prev_cache = getattr(self._module, '_sonic_request_cache', None)
+            self.request_cache = RequestCache()
+            self._module._sonic_request_cache = self.request_cache
+            try:
+                self.get_network_resources_facts(FACT_RESOURCE_SUBSETS, resource_facts_type, data)
+            finally:
+                self._module._sonic_request_cache = prev_cache
 
         if self.VALID_LEGACY_GATHER_SUBSETS:
             self.get_network_legacy_facts(FACT_LEGACY_SUBSETS, legacy_facts_type)
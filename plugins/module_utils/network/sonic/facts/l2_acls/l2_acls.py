@@ -15,15 +15,12 @@ __metaclass__ = type
 
 from copy import deepcopy
 
-from ansible.module_utils.connection import ConnectionError
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
-    utils,
-)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.l2_acls.l2_acls import L2_aclsArgs
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
-    to_request,
-    edit_config
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.acl_utils import (
+    get_acl_sets,
+    get_all_acl_sets
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.spec_utils import get_generated_spec, normalize_config
 
 ETHERTYPE_FORMAT = '0x{:04x}'
 
@@ -66,16 +63,7 @@ class L2_aclsFacts(object):
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
         self.argument_spec = L2_aclsArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_generated_spec(L2_aclsArgs, subspec, options)
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for l2_acls
@@ -100,8 +88,8 @@ class L2_aclsFacts(object):
         ansible_facts['ansible_network_resources'].pop('l2_acls', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
-            facts['l2_acls'] = utils.remove_empties({'config': params['config']})['config']
+            params = normalize_config(self.argument_spec, {'config': objs}, remove_empties=True)
+            facts['l2_acls'] = params['config']
 
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -122,115 +110,142 @@ class L2_aclsFacts(object):
         config['rules'] = conf['rules']
 
         for rule in config['rules']:
-            if ":" in rule['action']:
-                rule['action'] = rule['action'].split(":")[-1]
-            rule['action'] = action_payload_to_value_map[rule['action']]
-
-            rule['source'] = {}
-            rule['destination'] = {}
-            if rule.get('l2') is None:
-                rule['source']['any'] = True
-                rule['destination']['any'] = True
-                continue
-
-            l2_config = rule.pop('l2')
-            if l2_config.get('source-mac') and l2_config.get('source-mac-mask'):
-                if l2_config['source-mac-mask'].lower() == 'ff:ff:ff:ff:ff:ff':
-                    rule['source']['host'] = l2_config['source-mac'].lower()
-                else:
-                    rule['source']['address'] = l2_config['source-mac'].lower()
-                    rule['source']['address_mask'] = l2_config['source-mac-mask'].lower()
-            elif l2_config.get('source-mac'):
+            self.render_rule(rule)
+
+        return config
+
+    @staticmethod
+    def render_rule(rule):
+        """Render, in place, an ACL rule returned by get_acl_rule"""
+        if ":" in rule['action']:
+            rule['action'] = rule['action'].split(":")[-1]
+        rule['action'] = action_payload_to_value_map[rule['action']]
+
+        rule['source'] = {}
+        rule['destination'] = {}
+        if rule.get('l2') is None:
+            rule['source']['any'] = True
+            rule['destination']['any'] = True
+            return rule
+
+        l2_config = rule.pop('l2')
+        if l2_config.get('source-mac') and l2_config.get('source-mac-mask'):
+            if l2_config['source-mac-mask'].lower() == 'ff:ff:ff:ff:ff:ff':
                 rule['source']['host'] = l2_config['source-mac'].lower()
             else:
-                rule['source']['any'] = True
+                rule['source']['address'] = l2_config['source-mac'].lower()
+                rule['source']['address_mask'] = l2_config['source-mac-mask'].lower()
+        elif l2_config.get('source-mac'):
+            rule['source']['host'] = l2_config['source-mac'].lower()
+        else:
+            rule['source']['any'] = True
 
-            if l2_config.get('destination-mac') and l2_config.get('destination-mac-mask'):
-                if l2_config['destination-mac-mask'].lower() == 'ff:ff:ff:ff:ff:ff':
-                    rule['destination']['host'] = l2_config['destination-mac'].lower()
-                else:
-                    rule['destination']['address'] = l2_config['destination-mac'].lower()
-                    rule['destination']['address_mask'] = l2_config['destination-mac-mask'].lower()
-            elif l2_config.get('destination-mac'):
+        if l2_config.get('destination-mac') and l2_config.get('destination-mac-mask'):
+            if l2_config['destination-mac-mask'].lower() == 'ff:ff:ff:ff:ff:ff':
                 rule['destination']['host'] = l2_config['destination-mac'].lower()
             else:
-                rule['destination']['any'] = True
-
-            if l2_config.get('ethertype'):
-                ethertype = l2_config['ethertype']
-                rule['ethertype'] = {}
-                if isinstance(ethertype, str):
-                    ethertype = ethertype.split(':')[-1]
-                    if ethertype in ethertype_payload_to_protocol_map:
-                        rule['ethertype'][ethertype_payload_to_protocol_map[ethertype]] = True
-                    else:
-                        rule['ethertype']['value'] = ethertype_payload_to_value_map[ethertype]
+                rule['destination']['address'] = l2_config['destination-mac'].lower()
+                rule['destination']['address_mask'] = l2_config['destination-mac-mask'].lower()
+        elif l2_config.get('destination-mac'):
+            rule['destination']['host'] = l2_config['destination-mac'].lower()
+        else:
+            rule['destination']['any'] = True
+
+        if l2_config.get('ethertype'):
+            ethertype = l2_config['ethertype']
+            rule['ethertype'] = {}
+            if isinstance(ethertype, str):
+                ethertype = ethertype.split(':')[-1]
+                if ethertype in ethertype_payload_to_protocol_map:
+                    rule['ethertype'][ethertype_payload_to_protocol_map[ethertype]] = True
                 else:
-                    ethertype = ETHERTYPE_FORMAT.format(ethertype)
-                    if ethertype in ethertype_payload_to_protocol_map:
-                        rule['ethertype'][ethertype_payload_to_protocol_map[ethertype]] = True
-                    else:
-                        rule['ethertype']['value'] = ethertype
-
-            if l2_config.get('openconfig-acl-ext:vlanid'):
-                rule['vlan_id'] = l2_config['openconfig-acl-ext:vlanid']
-            if l2_config.get('openconfig-acl-ext:vlan-tag-format') == 'openconfig-acl-ext:MULTI_TAGGED':
-                rule['vlan_tag_format'] = {'multi_tagged': True}
-
-            if l2_config.get('openconfig-acl-ext:dei') is not None:
-                rule['dei'] = l2_config['openconfig-acl-ext:dei']
-
-            if l2_config.get('openconfig-acl-ext:pcp') is not None:
-                rule['pcp'] = {}
-                if l2_config.get('openconfig-acl-ext:pcp-mask') is not None:
-                    rule['pcp']['value'] = l2_config['openconfig-acl-ext:pcp']
-                    rule['pcp']['mask'] = l2_config['openconfig-acl-ext:pcp-mask']
+                    rule['ethertype']['value'] = ethertype_payload_to_value_map[ethertype]
+            else:
+                ethertype = ETHERTYPE_FORMAT.format(ethertype)
+                if ethertype in ethertype_payload_to_protocol_map:
+                    rule['ethertype'][ethertype_payload_to_protocol_map[ethertype]] = True
                 else:
-                    rule['pcp']['traffic_type'] = pcp_value_to_traffic_map[l2_config['openconfig-acl-ext:pcp']]
+                    rule['ethertype']['value'] = ethertype
 
-        return config
+        if l2_config.get('openconfig-acl-ext:vlanid'):
+            rule['vlan_id'] = l2_config['openconfig-acl-ext:vlanid']
+        if l2_config.get('openconfig-acl-ext:vlan-tag-format') == 'openconfig-acl-ext:MULTI_TAGGED':
+            rule['vlan_tag_format'] = {'multi_tagged': True}
 
-    def get_l2_acls(self):
-        """Get all l2 acl configurations available in chassis"""
-        acls_path = 'data/openconfig-acl:acl/acl-sets'
-        method = 'GET'
-        request = [{'path': acls_path, 'method': method}]
+        if l2_config.get('openconfig-acl-ext:dei') is not None:
+            rule['dei'] = l2_config['openconfig-acl-ext:dei']
+
+        if l2_config.get('openconfig-acl-ext:pcp') is not None:
+            rule['pcp'] = {}
+            if l2_config.get('openconfig-acl-ext:pcp-mask') is not None:
+                rule['pcp']['value'] = l2_config['openconfig-acl-ext:pcp']
+                rule['pcp']['mask'] = l2_config['openconfig-acl-ext:pcp-mask']
+            else:
+                rule['pcp']['traffic_type'] = pcp_value_to_traffic_map[l2_config['openconfig-acl-ext:pcp']]
+
+        return rule
 
-        try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            self._module.fail_json(msg=str(exc), code=exc.code)
+    def get_l2_acl_sets(self):
+        """Get the L2 ACL sets from the REST response
 
-        acls = []
-        if response[0][1].get('openconfig-acl:acl-sets'):
-            acls = response[0][1]['openconfig-acl:acl-sets'].get('acl-set', [])
+        If the module has set '_sonic_l2_acl_targets' to a list of
+        ACL names, only those ACLs are read.
+        """
+        acl_targets = getattr(self._module, '_sonic_l2_acl_targets', None)
+        if acl_targets is None:
+            acls = get_all_acl_sets(self._module)
+        else:
+            acls = get_acl_sets(self._module, [(acl_name, 'ACL_L2') for acl_name in acl_targets])
+
+        return [acl for acl in acls if acl['config'].get('type') in ('ACL_L2', 'openconfig-acl:ACL_L2')]
+
+    @staticmethod
+    def get_acl_rule(acl_entry):
+        """Get an ACL rule, to be rendered by render_rule, from an ACL entry"""
+        acl_rule = {}
+
+        acl_entry_config = acl_entry['config']
+        acl_rule['sequence_num'] = acl_entry_config['sequence-id']
+        acl_rule['remark'] = acl_entry_config.get('description')
 
+        acl_rule['action'] = acl_entry['actions']['config']['forwarding-action']
+        acl_rule['l2'] = acl_entry.get('l2', {}).get('config', {})
+
+        return acl_rule
+
+    def get_l2_acls(self):
+        """Get l2 acl configurations available in chassis"""
         l2_acls_configs = []
-        for acl in acls:
+        for acl in self.get_l2_acl_sets():
             acl_config = {}
-            acl_rules = []
 
             config = acl['config']
-            if config.get('type') not in ('ACL_L2', 'openconfig-acl:ACL_L2'):
-                continue
-
             acl_config['name'] = config['name']
             acl_config['remark'] = config.get('description')
-            acl_config['rules'] = acl_rules
 
             acl_entries = acl.get('acl-entries', {}).get('acl-entry', [])
-            for acl_entry in acl_entries:
-                acl_rule = {}
+            acl_config['rules'] = [self.get_acl_rule(acl_entry) for acl_entry in acl_entries]
 
-                acl_entry_config = acl_entry['config']
-                acl_rule['sequence_num'] = acl_entry_config['sequence-id']
-                acl_rule['remark'] = acl_entry_config.get('description')
+            l2_acls_configs.append(acl_config)
 
-                acl_rule['action'] = acl_entry['actions']['config']['forwarding-action']
-                acl_rule['l2'] = acl_entry.get('l2', {}).get('config', {})
+        return l2_acls_configs
 
-                acl_rules.append(acl_rule)
+    def get_l2_acl_records(self, rule_class):
+        """Get the l2 acl configurations with each rule built as a
+        rule_class record straight from its ACL entry, without the
+        normalized facts
 
-            l2_acls_configs.append(acl_config)
+        :rtype: dictionary
+        :returns: {name: {'remark': remark, 'rules': {sequence_num: record}}}
+        """
+        l2_acls = {}
+        for acl in self.get_l2_acl_sets():
+            rules = {}
+            for acl_entry in acl.get('acl-entries', {}).get('acl-entry', []):
+                rule = self.render_rule(self.get_acl_rule(acl_entry))
+                rules[rule['sequence_num']] = rule_class(rule)
 
-        return l2_acls_configs
+            config = acl['config']
+            l2_acls[config['name']] = {'remark': config.get('description') or None, 'rules': rules}
+
+        return l2_acls
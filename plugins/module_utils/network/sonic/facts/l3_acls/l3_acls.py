@@ -15,21 +15,22 @@ __metaclass__ = type
 
 from copy import deepcopy
 
-from ansible.module_utils.connection import ConnectionError
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
-    utils,
-)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.l3_acls.l3_acls import L3_aclsArgs
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
-    to_request,
-    edit_config
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.acl_utils import (
+    get_acl_sets,
+    get_all_acl_sets
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.spec_utils import get_generated_spec, normalize_config
 
 IPV4_HOST_MASK = '/32'
 IPV6_HOST_MASK = '/128'
 L4_PORT_START = 0
 L4_PORT_END = 65535
 
+acl_type_to_payload_map = {
+    'ipv4': 'ACL_IPV4',
+    'ipv6': 'ACL_IPV6'
+}
 action_payload_to_value_map = {
     'ACCEPT': 'permit',
     'DISCARD': 'discard',
@@ -87,16 +88,7 @@ class L3_aclsFacts(object):
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
         self.argument_spec = L3_aclsArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_generated_spec(L3_aclsArgs, subspec, options)
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for l3_acls
@@ -121,8 +113,8 @@ class L3_aclsFacts(object):
         ansible_facts['ansible_network_resources'].pop('l3_acls', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
-            facts['l3_acls'] = utils.remove_empties({'config': params['config']})['config']
+            params = normalize_config(self.argument_spec, {'config': objs}, remove_empties=True)
+            facts['l3_acls'] = params['config']
 
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -144,130 +136,141 @@ class L3_aclsFacts(object):
 
         for acl in config['acls']:
             for rule in acl['rules']:
-                rule['source'] = {}
-                rule['destination'] = {}
-                rule['protocol'] = {}
-                rule['protocol_options'] = {}
-
-                if ":" in rule['action']:
-                    rule['action'] = rule['action'].split(":")[-1]
-                rule['action'] = action_payload_to_value_map[rule['action']]
-
-                l2_config = rule.pop('l2', None)
-                l3_config = rule.pop('l3', None)
-                l4_config = rule.pop('l4', None)
-                if l3_config is None:
-                    if is_ipv4:
-                        rule['protocol']['name'] = 'ip'
-                    else:
-                        rule['protocol']['name'] = 'ipv6'
-
-                    rule['source']['any'] = True
-                    rule['destination']['any'] = True
-                    continue
-
-                protocol = l3_config.get('protocol')
-                if protocol is not None:
-                    if isinstance(protocol, str):
-                        protocol = protocol.replace('openconfig-packet-match-types:', '')
-                        protocol = protocol_payload_to_value_map[protocol]
-                        if isinstance(protocol, str):
-                            rule['protocol']['name'] = protocol
-                        else:
-                            rule['protocol']['number'] = protocol
-                    else:
-                        protocol = protocol_number_to_name_map.get(protocol, protocol)
-                        if isinstance(protocol, str):
-                            rule['protocol']['name'] = protocol
-                        else:
-                            rule['protocol']['number'] = protocol
+                self.render_rule(rule, is_ipv4)
+
+        return config
+
+    def render_rule(self, rule, is_ipv4):
+        """Render, in place, an ACL rule returned by get_acl_rule"""
+        rule['source'] = {}
+        rule['destination'] = {}
+        rule['protocol'] = {}
+        rule['protocol_options'] = {}
+
+        if ":" in rule['action']:
+            rule['action'] = rule['action'].split(":")[-1]
+        rule['action'] = action_payload_to_value_map[rule['action']]
+
+        l2_config = rule.pop('l2', None)
+        l3_config = rule.pop('l3', None)
+        l4_config = rule.pop('l4', None)
+        if l3_config is None:
+            if is_ipv4:
+                rule['protocol']['name'] = 'ip'
+            else:
+                rule['protocol']['name'] = 'ipv6'
+
+            rule['source']['any'] = True
+            rule['destination']['any'] = True
+            return rule
+
+        protocol = l3_config.get('protocol')
+        if protocol is not None:
+            if isinstance(protocol, str):
+                protocol = protocol.replace('openconfig-packet-match-types:', '')
+                protocol = protocol_payload_to_value_map[protocol]
+                if isinstance(protocol, str):
+                    rule['protocol']['name'] = protocol
                 else:
-                    if is_ipv4:
-                        rule['protocol']['name'] = 'ip'
-                    else:
-                        rule['protocol']['name'] = 'ipv6'
-
-                rule['source'] = self._convert_ip_addr_to_spec_fmt(l3_config.get('source-address'), is_ipv4)
-                rule['destination'] = self._convert_ip_addr_to_spec_fmt(l3_config.get('destination-address'), is_ipv4)
-                if protocol in ('tcp', 'udp'):
-                    rule['source']['port_number'] = self._convert_l4_port_to_spec_fmt(l4_config.get('source-port'))
-                    rule['destination']['port_number'] = self._convert_l4_port_to_spec_fmt(l4_config.get('destination-port'))
-
-                if protocol in ('icmp', 'icmpv6'):
-                    rule['protocol_options'][protocol] = {
-                        'code': l4_config.get('openconfig-acl-ext:icmp-code'),
-                        'type': l4_config.get('openconfig-acl-ext:icmp-type')
-                    }
-                elif protocol == 'tcp':
-                    rule['protocol_options']['tcp'] = {}
-                    if l4_config.get('openconfig-acl-ext:tcp-session-established'):
-                        rule['protocol_options']['tcp']['established'] = True
-                    else:
-                        for flag in l4_config.get('tcp-flags', []):
-                            flag = flag.split(':')[-1].replace('TCP_', '').lower()
-                            rule['protocol_options']['tcp'][flag] = True
-
-                dscp = l3_config.get('dscp')
-                if dscp in dscp_value_to_name_map:
-                    rule['dscp'] = {dscp_value_to_name_map[dscp]: True}
+                    rule['protocol']['number'] = protocol
+            else:
+                protocol = protocol_number_to_name_map.get(protocol, protocol)
+                if isinstance(protocol, str):
+                    rule['protocol']['name'] = protocol
                 else:
-                    rule['dscp'] = {'value': dscp}
+                    rule['protocol']['number'] = protocol
+        else:
+            if is_ipv4:
+                rule['protocol']['name'] = 'ip'
+            else:
+                rule['protocol']['name'] = 'ipv6'
+
+        rule['source'] = self._convert_ip_addr_to_spec_fmt(l3_config.get('source-address'), is_ipv4)
+        rule['destination'] = self._convert_ip_addr_to_spec_fmt(l3_config.get('destination-address'), is_ipv4)
+        if protocol in ('tcp', 'udp'):
+            rule['source']['port_number'] = self._convert_l4_port_to_spec_fmt(l4_config.get('source-port'))
+            rule['destination']['port_number'] = self._convert_l4_port_to_spec_fmt(l4_config.get('destination-port'))
+
+        if protocol in ('icmp', 'icmpv6'):
+            rule['protocol_options'][protocol] = {
+                'code': l4_config.get('openconfig-acl-ext:icmp-code'),
+                'type': l4_config.get('openconfig-acl-ext:icmp-type')
+            }
+        elif protocol == 'tcp':
+            rule['protocol_options']['tcp'] = {}
+            if l4_config.get('openconfig-acl-ext:tcp-session-established'):
+                rule['protocol_options']['tcp']['established'] = True
+            else:
+                for flag in l4_config.get('tcp-flags', []):
+                    flag = flag.split(':')[-1].replace('TCP_', '').lower()
+                    rule['protocol_options']['tcp'][flag] = True
 
-                rule['vlan_id'] = l2_config.get('openconfig-acl-ext:vlanid')
+        dscp = l3_config.get('dscp')
+        if dscp in dscp_value_to_name_map:
+            rule['dscp'] = {dscp_value_to_name_map[dscp]: True}
+        else:
+            rule['dscp'] = {'value': dscp}
 
-        return config
+        rule['vlan_id'] = l2_config.get('openconfig-acl-ext:vlanid')
 
-    def get_l3_acls(self):
-        """Get all l3 acl configurations available in chassis"""
-        acls_path = 'data/openconfig-acl:acl/acl-sets'
-        method = 'GET'
-        request = [{'path': acls_path, 'method': method}]
+        return rule
 
-        try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            self._module.fail_json(msg=str(exc), code=exc.code)
+    def get_l3_acl_sets(self):
+        """Get the L3 ACL sets from the REST response, as
+        (address_family, acl) pairs
 
-        acls = []
-        if response[0][1].get('openconfig-acl:acl-sets'):
-            acls = response[0][1]['openconfig-acl:acl-sets'].get('acl-set', [])
+        If the module has set '_sonic_l3_acl_targets' to a list of
+        (address_family, name) pairs, only those ACLs are read.
+        """
+        acl_targets = getattr(self._module, '_sonic_l3_acl_targets', None)
+        if acl_targets is None:
+            acls = get_all_acl_sets(self._module)
+        else:
+            acls = get_acl_sets(self._module, [(acl_name, acl_type_to_payload_map[acl_type]) for acl_type, acl_name in acl_targets])
 
+        l3_acl_sets = []
+        for acl in acls:
+            acl_type = acl['config'].get('type')
+            if acl_type in ('ACL_IPV4', 'openconfig-acl:ACL_IPV4'):
+                l3_acl_sets.append(('ipv4', acl))
+            elif acl_type in ('ACL_IPV6', 'openconfig-acl:ACL_IPV6'):
+                l3_acl_sets.append(('ipv6', acl))
+
+        return l3_acl_sets
+
+    @staticmethod
+    def get_acl_rule(acl_entry, is_ipv4):
+        """Get an ACL rule, to be rendered by render_rule, from an ACL entry"""
+        acl_rule = {}
+
+        acl_entry_config = acl_entry['config']
+        acl_rule['sequence_num'] = acl_entry_config['sequence-id']
+        acl_rule['remark'] = acl_entry_config.get('description')
+
+        acl_rule['action'] = acl_entry['actions']['config']['forwarding-action']
+        acl_rule['l2'] = acl_entry.get('l2', {}).get('config', {})
+        if is_ipv4:
+            acl_rule['l3'] = acl_entry.get('ipv4', {}).get('config', {})
+        else:
+            acl_rule['l3'] = acl_entry.get('ipv6', {}).get('config', {})
+        acl_rule['l4'] = acl_entry.get('transport', {}).get('config', {})
+
+        return acl_rule
+
+    def get_l3_acls(self):
+        """Get l3 acl configurations available in chassis"""
         ipv4_acls_configs = []
         ipv6_acls_configs = []
-        for acl in acls:
-            is_ipv4 = False
+        for address_family, acl in self.get_l3_acl_sets():
+            is_ipv4 = bool(address_family == 'ipv4')
             acl_config = {}
-            acl_rules = []
 
             config = acl['config']
-            if config.get('type') in ('ACL_IPV4', 'openconfig-acl:ACL_IPV4'):
-                is_ipv4 = True
-            elif config.get('type') in ('ACL_IPV6', 'openconfig-acl:ACL_IPV6'):
-                is_ipv4 = False
-            else:
-                continue
-
             acl_config['name'] = config['name']
             acl_config['remark'] = config.get('description')
-            acl_config['rules'] = acl_rules
 
             acl_entries = acl.get('acl-entries', {}).get('acl-entry', [])
-            for acl_entry in acl_entries:
-                acl_rule = {}
-
-                acl_entry_config = acl_entry['config']
-                acl_rule['sequence_num'] = acl_entry_config['sequence-id']
-                acl_rule['remark'] = acl_entry_config.get('description')
-
-                acl_rule['action'] = acl_entry['actions']['config']['forwarding-action']
-                acl_rule['l2'] = acl_entry.get('l2', {}).get('config', {})
-                if is_ipv4:
-                    acl_rule['l3'] = acl_entry.get('ipv4', {}).get('config', {})
-                else:
-                    acl_rule['l3'] = acl_entry.get('ipv6', {}).get('config', {})
-                acl_rule['l4'] = acl_entry.get('transport', {}).get('config', {})
-
-                acl_rules.append(acl_rule)
+            acl_config['rules'] = [self.get_acl_rule(acl_entry, is_ipv4) for acl_entry in acl_entries]
 
             if is_ipv4:
                 ipv4_acls_configs.append(acl_config)
@@ -282,6 +285,27 @@ class L3_aclsFacts(object):
 
         return l3_acls_configs
 
+    def get_l3_acl_records(self, rule_class):
+        """Get the l3 acl configurations with each rule built as a
+        rule_class record straight from its ACL entry, without the
+        normalized facts
+
+        :rtype: dictionary
+        :returns: {address_family: {name: {'remark': remark, 'rules': {sequence_num: record}}}}
+        """
+        l3_acls = {}
+        for address_family, acl in self.get_l3_acl_sets():
+            is_ipv4 = bool(address_family == 'ipv4')
+            rules = {}
+            for acl_entry in acl.get('acl-entries', {}).get('acl-entry', []):
+                rule = self.render_rule(self.get_acl_rule(acl_entry, is_ipv4), is_ipv4)
+                rules[rule['sequence_num']] = rule_class(rule)
+
+            config = acl['config']
+            l3_acls.setdefault(address_family, {})[config['name']] = {'remark': config.get('description') or None, 'rules': rules}
+
+        return l3_acls
+
     @staticmethod
     def _convert_ip_addr_to_spec_fmt(ip_addr, is_ipv4=False):
         spec_fmt = {}
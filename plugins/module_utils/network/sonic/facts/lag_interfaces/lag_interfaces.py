@@ -13,12 +13,8 @@ based on the configuration.
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-from copy import deepcopy
-
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
-    utils,
-)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.lag_interfaces.lag_interfaces import Lag_interfacesArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.spec_utils import get_generated_spec, normalize_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
     edit_config
@@ -35,16 +31,7 @@ class Lag_interfacesFacts(object):
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
         self.argument_spec = Lag_interfacesArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_generated_spec(Lag_interfacesArgs, subspec, options)
 
     def get_all_portchannels(self):
         """Get all the interfaces available in chassis"""
@@ -67,8 +54,9 @@ class Lag_interfacesFacts(object):
             else:
                 portchannel_list = []
             if portchannel_list:
+                member_pc_names = set(d["name"] for d in portchannel_members_list)
                 for i in portchannel_list:
-                    if not any(d["name"] == i["name"] for d in portchannel_members_list):
+                    if i["name"] not in member_pc_names:
                         portchannel_members_list.append({'ifname': None, 'name': i['name']})
         if data:
             return portchannel_members_list
@@ -84,6 +72,7 @@ class Lag_interfacesFacts(object):
         :returns: facts
         """
         objs = []
+        objs_by_name = {}
         if not data:
             data = self.get_all_portchannels()
         # operate on a collection of resource x
@@ -92,11 +81,11 @@ class Lag_interfacesFacts(object):
                 obj = self.render_config(self.generated_spec, conf)
                 obj = self.transform_config(obj)
                 if obj:
-                    self.merge_portchannels(objs, obj)
+                    self.merge_portchannels(objs, obj, objs_by_name)
         facts = {}
         if objs:
             facts['lag_interfaces'] = []
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = normalize_config(self.argument_spec, {'config': objs})
             for cfg in params['config']:
                 facts['lag_interfaces'].append(cfg)
         ansible_facts['ansible_network_resources'].update(facts)
@@ -116,19 +105,21 @@ class Lag_interfacesFacts(object):
             trans_cfg['members'] = {'interfaces': interfaces}
         return trans_cfg
 
-    def merge_portchannels(self, configs, conf):
-        if len(configs) == 0:
-            configs.append(conf)
+    def merge_portchannels(self, configs, conf, configs_by_name):
+        """Add a member row to the portchannel it belongs to in configs.
+
+        configs_by_name indexes the first entry of configs for each
+        portchannel name so that grouping the member rows takes one pass.
+        """
+        new_interfaces = None
+        if conf.get('members') and conf['members'].get('interfaces'):
+            new_interfaces = conf['members']['interfaces']
+
+        matched = None
+        if new_interfaces:
+            matched = configs_by_name.get(conf['name'])
+        if matched and matched.get('members'):
+            matched['members']['interfaces'].extend(new_interfaces)
         else:
-            new_interface = None
-            if conf.get('members') and conf['members'].get('interfaces'):
-                new_interface = conf['members']['interfaces'][0]
-            else:
-                configs.append(conf)
-            if new_interface:
-                matched = next((cfg for cfg in configs if cfg['name'] == conf['name']), None)
-                if matched and matched.get('members'):
-                    ext_interfaces = matched.get('members').get('interfaces', [])
-                    ext_interfaces.append(new_interface)
-                else:
-                    configs.append(conf)
+            configs.append(conf)
+            configs_by_name.setdefault(conf['name'], conf)
@@ -11,18 +11,15 @@ based on the configuration.
 """
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
-from copy import deepcopy
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
-    utils,
-)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.port_breakout.port_breakout import Port_breakoutArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.spec_utils import get_generated_spec, normalize_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
     edit_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
-    get_breakout_mode,
+    get_port_breakout_mode,
 )
 from ansible.module_utils.connection import ConnectionError
 
@@ -36,16 +33,7 @@ class Port_breakoutFacts(object):
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
         self.argument_spec = Port_breakoutArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_generated_spec(Port_breakoutArgs, subspec, options)
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for port_breakout
@@ -75,7 +63,7 @@ class Port_breakoutFacts(object):
         facts = {}
         if objs:
             facts['port_breakout'] = []
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = normalize_config(self.argument_spec, {'config': objs})
             if params:
                 facts['port_breakout'].extend(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
@@ -107,16 +95,16 @@ class Port_breakoutFacts(object):
         if "sonic-port-breakout:BREAKOUT_CFG_LIST" in response[0][1]:
             raw_port_breakout_list = response[0][1].get("sonic-port-breakout:BREAKOUT_CFG_LIST", [])
 
+        # The modes may have changed since the last read, e.g. before a
+        # change, so they are not taken from a previous read
+        self._module._sonic_breakout_modes = {}
         for port_breakout in raw_port_breakout_list:
             name = port_breakout.get('port', None)
-            mode = port_breakout.get('brkout_mode', None)
-            if name and mode:
-                if '[' in mode:
-                    mode = mode[:mode.index('[')]
-                norm_port_breakout = {'name': name, 'mode': mode}
-                mode = get_breakout_mode(self._module, name)
-                if mode:
-                    norm_port_breakout['mode'] = mode
-                port_breakout_list.append(norm_port_breakout)
+            brkout_mode = port_breakout.get('brkout_mode', None)
+            if name and brkout_mode:
+                mode = get_port_breakout_mode(self._module, name, brkout_mode)
+                if not mode:
+                    mode = brkout_mode.split('[')[0]
+                port_breakout_list.append({'name': name, 'mode': mode})
 
         return port_breakout_list
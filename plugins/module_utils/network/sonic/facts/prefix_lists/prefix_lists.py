@@ -14,17 +14,12 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
-from copy import deepcopy
-
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
-    utils,
-)
-
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils \
     import (
         remove_empties_from_list
     )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.prefix_lists.prefix_lists import Prefix_listsArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.spec_utils import get_generated_spec, normalize_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
     edit_config
@@ -90,16 +85,7 @@ class Prefix_listsFacts:
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
         self.argument_spec = Prefix_listsArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = get_generated_spec(Prefix_listsArgs, subspec, options)
 
     def get_all_prefix_sets(self):
         '''Execute a REST "GET" API to fetch all of the current prefix list configuration
@@ -151,8 +137,7 @@ class Prefix_listsFacts:
         ansible_facts['ansible_network_resources'].pop('prefix_lists', None)
         facts = {}
         if prefix_sets:
-            params = utils.validate_config(self.argument_spec,
-                                           {'config': remove_empties_from_list(prefix_sets)})
+            params = normalize_config(self.argument_spec, {'config': remove_empties_from_list(prefix_sets)})
             facts['prefix_lists'] = params['config']
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -31,6 +31,7 @@ __metaclass__ = type
 
 import json
 import re
+from copy import deepcopy
 
 from ansible.module_utils._text import to_text
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
@@ -40,9 +41,16 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 from ansible.module_utils.connection import Connection, ConnectionError
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import NetworkConfig, ConfigLine
 
+try:
+    from urllib import unquote
+except ImportError:
+    from urllib.parse import unquote
+
 _DEVICE_CONFIGS = {}
 STANDARD_ETH_REGEXP = r"Eth\d+(/\d+)+"
 PATTERN = re.compile(STANDARD_ETH_REGEXP)
+COALESCE_MAX_REQUESTS = 100
+PATH_SEGMENT_PATTERN = re.compile(r"^[A-Za-z_][\w.-]*(:[A-Za-z_][\w.-]*)?(=[^=]+)?$")
 
 
 def get_connection(module):
@@ -125,7 +133,7 @@ def run_commands(module, commands, check_rc=True):
         module.fail_json(msg=to_text(exc))
 
 
-def edit_config(module, commands, skip_code=None):
+def edit_config(module, commands, skip_code=None, coalesce=False):
     connection = get_connection(module)
 
     # Start: This is to convert interface name from Eth1/1 to Eth1%2f1
@@ -136,12 +144,260 @@ def edit_config(module, commands, skip_code=None):
             if url:
                 request["path"] = update_url(url)
     # End
-    return connection.edit_config(commands)
+    cache = getattr(module, "_sonic_request_cache", None)
+    if cache is not None:
+        if cache.is_cacheable(commands):
+            return cache.edit_config(connection, commands)
+        cache.clear()
+    if not RequestCache.is_cacheable(commands):
+        # The BGP snapshot kept outside of facts gathering is now stale
+        module._sonic_bgp_snapshot = None
+
+    # Coalescing is opt-in: merged requests are applied as a single
+    # payload, which only suits requests that do not depend on their order
+    if not coalesce:
+        return connection.edit_config(commands)
+
+    requests, counts = coalesce_requests(commands)
+    saved = sum(counts) - len(counts)
+    if not saved:
+        return connection.edit_config(commands)
+
+    module._sonic_requests_saved = getattr(module, "_sonic_requests_saved", 0) + saved
+    responses = connection.edit_config(requests)
+
+    # Return one response per original request
+    ret_responses = []
+    for response, count in zip(responses, counts):
+        ret_responses.extend([response] * count)
+    return ret_responses
+
+
+class RequestCache(object):
+    """Cache of GET responses keyed by (path, method)
+
+    A cache is made active for a module by setting it as the module's
+    '_sonic_request_cache' attribute; edit_config then serves repeated
+    GET requests from it. Any other request clears the cache.
+    """
+
+    def __init__(self):
+        self._responses = {}
+        self._shared = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(request):
+        return (request["path"], request["method"].lower())
+
+    @staticmethod
+    def is_cacheable(requests):
+        return all(type(request) is dict and str(request.get("method")).lower() == "get" for request in requests)
+
+    def edit_config(self, connection, requests):
+        responses = []
+        missed = []
+        for request in requests:
+            response = self._responses.get(self._key(request))
+            if response is None:
+                self.misses += 1
+                missed.append(request)
+            else:
+                self.hits += 1
+                # Callers may modify the response, hand out a copy
+                response = deepcopy(response)
+            responses.append(response)
+
+        if missed:
+            fetched = iter(connection.edit_config(missed))
+            for index, request in enumerate(requests):
+                if responses[index] is None:
+                    responses[index] = next(fetched)
+                    self._responses[self._key(request)] = deepcopy(responses[index])
+        return responses
+
+    def get_shared(self, key, factory):
+        """Return the object stored under 'key', creating it by calling
+        'factory' on first use. Fact collectors use it to share data
+        derived from the cached responses.
+        """
+        if key not in self._shared:
+            self._shared[key] = factory()
+        return self._shared[key]
+
+    def clear(self):
+        self._responses = {}
+        self._shared = {}
+
+    def get_stats(self):
+        return {"hits": self.hits, "misses": self.misses}
+
+
+def get_requests_saved(module):
+    """Return the number of requests saved by coalescing in edit_config"""
+    return getattr(module, "_sonic_requests_saved", 0)
+
+
+def coalesce_requests(requests):
+    """Merge consecutive PATCH requests into a single request when they
+    target the same path, or when a request targets a path below the path
+    of the previous one.
+
+    :returns: the list of requests to send, and for each of them the
+              number of original requests it replaces
+    """
+    ret_requests = []
+    counts = []
+    for request in requests:
+        if (ret_requests and counts[-1] < COALESCE_MAX_REQUESTS and
+                _is_coalescible(request) and _is_coalescible(ret_requests[-1])):
+            merged = _merge_requests(ret_requests[-1], request)
+            if merged:
+                ret_requests[-1] = merged
+                counts[-1] += 1
+                continue
+        ret_requests.append(request)
+        counts.append(1)
+    return ret_requests, counts
+
+
+def _is_coalescible(request):
+    return (type(request) is dict and str(request.get("method")).lower() == "patch" and
+            isinstance(request.get("data"), dict) and len(request["data"]) == 1)
+
+
+def _merge_requests(first, second):
+    """Return a single request equivalent to sending 'first' and then
+    'second', or None if they cannot be merged
+    """
+    first_path = first["path"].rstrip("/")
+    second_path = second["path"].rstrip("/")
+    if second_path == first_path:
+        suffix = []
+    elif second_path.startswith(first_path + "/"):
+        suffix = second_path[len(first_path) + 1:].split("/")
+        if not all(PATH_SEGMENT_PATTERN.match(segment) for segment in suffix):
+            return None
+    else:
+        return None
+
+    data = deepcopy(first["data"])
+    root_key = next(iter(data))
+    second_key, second_value = next(iter(second["data"].items()))
+
+    if not suffix:
+        if root_key != second_key or not _merge_payload(data, second["data"]):
+            return None
+    else:
+        # The payload of 'first' must be rooted at the last node of its path
+        if root_key.split(":")[-1] != first_path.split("/")[-1].split("=")[0].split(":")[-1]:
+            return None
+        node = data[root_key]
+        if "=" in first_path.split("/")[-1]:
+            # 'first' targets a single list entry
+            if not isinstance(node, list) or len(node) != 1:
+                return None
+            node = node[0]
+        for segment in suffix[:-1]:
+            node = _get_payload_child(node, segment)
+            if node is None:
+                return None
+
+        name = suffix[-1].split("=")[0]
+        if name.split(":")[-1] != second_key.split(":")[-1] or not isinstance(node, dict):
+            return None
+        if not _merge_payload(node, {name: second_value}):
+            return None
+
+    merged = dict(first)
+    merged["data"] = data
+    merged["independent"] = bool(first.get("independent") and second.get("independent"))
+    return merged
+
+
+def _get_payload_child(node, segment):
+    """Return the payload node addressed by a single path segment,
+    creating containers that are not yet present
+    """
+    if not isinstance(node, dict):
+        return None
+    name, sep, keys = segment.partition("=")
+    if not sep:
+        return node.setdefault(name, {})
+
+    key_values = set(unquote(key) for key in keys.split(","))
+    entries = node.get(name)
+    if not isinstance(entries, list):
+        return None
+    matched = [entry for entry in entries if isinstance(entry, dict) and key_values <= set(
+        str(value) for value in entry.values() if not isinstance(value, (dict, list)))]
+    if len(matched) != 1:
+        return None
+    return matched[0]
+
+
+def _merge_payload(target, source):
+    """Deep merge 'source' into 'target' the way a later PATCH overrides
+    an earlier one. Returns False if a list cannot be merged safely.
+    """
+    for key, value in source.items():
+        if key not in target:
+            target[key] = value
+        elif isinstance(target[key], dict) and isinstance(value, dict):
+            if not _merge_payload(target[key], value):
+                return False
+        elif isinstance(target[key], list) and isinstance(value, list):
+            for entry in value:
+                if not _merge_list_entry(target[key], entry):
+                    return False
+        else:
+            target[key] = value
+    return True
+
+
+def _merge_list_entry(entries, entry):
+    """Merge an openconfig style list entry (key leaves at the top level,
+    other leaves under 'config') into a list of entries.
+    """
+    if not isinstance(entry, dict) or not isinstance(entry.get("config"), dict):
+        return False
+    entry_keys = dict((key, value) for key, value in entry.items() if not isinstance(value, (dict, list)))
+    if not entry_keys:
+        return False
+    for existing in entries:
+        if not isinstance(existing, dict) or not isinstance(existing.get("config"), dict):
+            return False
+        existing_keys = dict((key, value) for key, value in existing.items() if not isinstance(value, (dict, list)))
+        if existing_keys == entry_keys:
+            return _merge_payload(existing, entry)
+        if set(existing_keys) != set(entry_keys):
+            return False
+    entries.append(entry)
+    return True
+
+
+def get_pool_stats(module):
+    """Return the keep-alive pool statistics of the httpapi connection,
+    keyed by host. An empty dict is returned when pooling is not in use.
+    """
+    capabilities = get_capabilities(module)
+    if 'get_pool_stats' not in capabilities.get('rpc', []):
+        return {}
+
+    connection = get_connection(module)
+    try:
+        return connection.get_pool_stats()
+    except ConnectionError as exc:
+        module.fail_json(msg=to_text(exc, errors="surrogate_then_replace"))
 
 
 def update_url(url):
-    match = re.search(STANDARD_ETH_REGEXP, url)
     ret_url = url
+    # Most paths hold no standard interface name, skip the scan for them
+    if 'Eth' not in url:
+        return ret_url
+    match = PATTERN.search(url)
     if match:
         interface_name = match.group()
         interface_name = interface_name.replace("/", "%2f")
@@ -150,5 +406,5 @@ def update_url(url):
 
 
 def to_request(module, requests):
-    transform = ComplexList(dict(path=dict(key=True), method=dict(), data=dict(type='dict')), module)
+    transform = ComplexList(dict(path=dict(key=True), method=dict(), data=dict(type='dict'), independent=dict(type='bool')), module)
     return transform(to_list(requests))
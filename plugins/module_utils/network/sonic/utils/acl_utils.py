@@ -0,0 +1,206 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2024 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+ACL set reads and ACL rule records shared by the sonic ACL resource modules
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import re
+
+from ansible.module_utils.connection import ConnectionError
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
+    to_request,
+    edit_config
+)
+
+try:
+    from urllib import quote
+except ImportError:
+    from urllib.parse import quote
+
+ACL_SETS_PATH = 'data/openconfig-acl:acl/acl-sets'
+ACL_SET_PATH = ACL_SETS_PATH + '/acl-set={acl_name},{acl_type}'
+# Above this number of ACLs, a single read of all the ACL sets is
+# cheaper than a read per ACL
+MAX_ACL_SET_READS = 10
+
+
+def get_all_acl_sets(module):
+    """Get all the ACL sets configured in chassis"""
+    request = [{'path': ACL_SETS_PATH, 'method': 'GET'}]
+    try:
+        response = edit_config(module, to_request(module, request))
+    except ConnectionError as exc:
+        module.fail_json(msg=str(exc), code=exc.code)
+
+    acls = []
+    if response[0][1].get('openconfig-acl:acl-sets'):
+        acls = response[0][1]['openconfig-acl:acl-sets'].get('acl-set', [])
+
+    return acls
+
+
+def get_acl_sets(module, acl_targets):
+    """Get the ACL sets with given (name, type) pairs, the type being
+    the payload value (e.g. 'ACL_L2'). ACLs that are not configured are
+    skipped.
+    """
+    if len(acl_targets) > MAX_ACL_SET_READS:
+        acl_targets = set(acl_targets)
+        return [acl for acl in get_all_acl_sets(module)
+                if (acl['config'].get('name'), acl['config'].get('type', '').split(':')[-1]) in acl_targets]
+
+    acls = []
+    for acl_name, acl_type in acl_targets:
+        acl_path = ACL_SET_PATH.format(acl_name=quote(acl_name, safe=''), acl_type=acl_type)
+        request = [{'path': acl_path, 'method': 'GET'}]
+        try:
+            response = edit_config(module, to_request(module, request))
+        except ConnectionError as exc:
+            if re.search("code.*404", str(exc)):
+                # 'code': 404, 'error-message': 'Resource not found'
+                continue
+            module.fail_json(msg=str(exc), code=exc.code)
+
+        if response[0][1].get('openconfig-acl:acl-set'):
+            acls.extend(response[0][1]['openconfig-acl:acl-set'])
+
+    return acls
+
+
+def freeze_rule_option(value):
+    """Return a hashable, read-only form of an ACL rule option value.
+
+    As with remove_empties, None is returned for an empty value so
+    that rules rendered from the device and rules specified in the
+    task compare equal.
+    """
+    if isinstance(value, dict):
+        value = AclRuleOptions(value)
+        return value if value else None
+    if value in ('', [], ()):
+        return None
+    return value
+
+
+def thaw_rule_option(value):
+    """Return the plain form of a value returned by freeze_rule_option"""
+    if isinstance(value, AclRuleOptions):
+        return value.to_dict()
+    return value
+
+
+class AclRuleOptions(object):
+    """Read-only mapping holding a nested option of an ACL rule
+    (e.g. source, protocol_options).
+
+    It supports the subset of the dict interface used to build
+    request payloads, and is hashable so that rules can be compared
+    by their hash first.
+    """
+
+    __slots__ = ('_options', '_hash')
+
+    def __init__(self, options):
+        self._options = {}
+        for key, value in options.items():
+            value = freeze_rule_option(value)
+            if value is not None:
+                self._options[key] = value
+        self._hash = hash(frozenset(self._options.items()))
+
+    def get(self, key, default=None):
+        return self._options.get(key, default)
+
+    def __getitem__(self, key):
+        return self._options[key]
+
+    def __contains__(self, key):
+        return key in self._options
+
+    def __iter__(self):
+        return iter(self._options)
+
+    def __len__(self):
+        return len(self._options)
+
+    def keys(self):
+        return self._options.keys()
+
+    def values(self):
+        return self._options.values()
+
+    def items(self):
+        return self._options.items()
+
+    def __eq__(self, other):
+        return isinstance(other, AclRuleOptions) and self._hash == other._hash and self._options == other._options
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return 'AclRuleOptions(%r)' % (self.to_dict(),)
+
+    def to_dict(self):
+        return dict((key, thaw_rule_option(value)) for key, value in self._options.items())
+
+
+class AclRule(object):
+    """Base class of the ACL rule records.
+
+    Subclasses list the rule options in __slots__. Each option holds
+    its normalized value (nested options as AclRuleOptions), or None
+    if it is not set. Records compare equal when all their options
+    are equal, and the comparison is short-circuited by a hash that
+    is computed once.
+    """
+
+    __slots__ = ('_hash',)
+
+    def __init__(self, rule):
+        for name in type(self).__slots__:
+            setattr(self, name, freeze_rule_option(rule.get(name)))
+        self._hash = hash(self._values())
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in type(self).__slots__)
+
+    def get(self, name, default=None):
+        value = getattr(self, name, None) if name in type(self).__slots__ else None
+        return default if value is None else value
+
+    def __getitem__(self, name):
+        value = self.get(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self._hash == other._hash and self._values() == other._values()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.to_dict())
+
+    def to_dict(self):
+        """Return the rule as a dict of the options that are set"""
+        rule = {}
+        for name in type(self).__slots__:
+            value = getattr(self, name)
+            if value is not None:
+                rule[name] = thaw_rule_option(value)
+        return rule
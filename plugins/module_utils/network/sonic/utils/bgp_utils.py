@@ -13,6 +13,7 @@ based on the configuration.
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+from copy import deepcopy
 
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     normalize_interface_name,
@@ -33,6 +34,72 @@ network_instance_path = '/data/openconfig-network-instance:network-instances/net
 protocol_bgp_path = 'protocols/protocol=BGP,bgp/bgp'
 
 
+class BgpSnapshot(object):
+    """BGP configuration of all the VRFs, shared by the BGP fact collectors
+
+    Each part of the configuration (VRF list, BGP globals, neighbors,
+    peer groups and table connections) is read from the device on first
+    use only. Callers get a copy of the data, which they are free to
+    modify.
+    """
+
+    def __init__(self, module):
+        self._module = module
+        self._parts = {}
+
+    def _get_part(self, name, reader):
+        if name not in self._parts:
+            self._parts[name] = reader()
+        return deepcopy(self._parts[name])
+
+    def get_vrfs(self):
+        """Get the names of all the VRFs"""
+        return self._get_part('vrfs', lambda: get_all_vrfs(self._module))
+
+    def get_globals(self):
+        """Get the BGP globals of the VRFs with BGP configured"""
+        return self._get_part('globals', lambda: get_all_bgp_globals(self._module, self.get_vrfs()))
+
+    def get_neighbors(self):
+        """Get the BGP AS and neighbors of the VRFs with BGP configured"""
+        return self._get_part('neighbors', lambda: read_all_bgp_neighbors(self._module, self.get_vrfs()))
+
+    def get_peergroups(self):
+        """Get the peer groups of the VRFs with BGP configured,
+        keyed by VRF name
+        """
+        return self._get_part('peergroups', lambda: get_all_peergroups(
+            self._module, [conf['vrf_name'] for conf in self.get_neighbors()]))
+
+    def get_table_connections(self, vrf_names):
+        """Get the raw 'table-connections' response of the given VRFs,
+        keyed by VRF name. Only the VRFs not read before are read from
+        the device.
+        """
+        request_path = '%s={vrf_name}/table-connections' % (network_instance_path)
+        responses = self._parts.setdefault('table_connections', {})
+        missing_vrf_names = [vrf_name for vrf_name in vrf_names if vrf_name not in responses]
+        responses.update(get_vrfs_responses(self._module, missing_vrf_names, request_path))
+        return dict((vrf_name, deepcopy(responses[vrf_name])) for vrf_name in vrf_names)
+
+
+def get_bgp_snapshot(module):
+    """Get the BGP snapshot shared by the fact collectors of the facts
+    gathering in progress. Outside of facts gathering, the snapshot is
+    kept as the module's '_sonic_bgp_snapshot' attribute until
+    edit_config sends a request other than a GET.
+    """
+    cache = getattr(module, '_sonic_request_cache', None)
+    if cache is not None:
+        return cache.get_shared('bgp_snapshot', lambda: BgpSnapshot(module))
+
+    snapshot = getattr(module, '_sonic_bgp_snapshot', None)
+    if snapshot is None:
+        snapshot = BgpSnapshot(module)
+        module._sonic_bgp_snapshot = snapshot
+    return snapshot
+
+
 def get_all_vrfs(module):
     """Get all VRF configurations available in chassis"""
     all_vrfs = []
@@ -52,16 +119,40 @@ def get_all_vrfs(module):
     return all_vrfs
 
 
-def get_peergroups(module, vrf_name):
-    peer_groups = []
-    request_path = '%s=%s/protocols/protocol=BGP,bgp/bgp/peer-groups' % (network_instance_path, vrf_name)
-    request = {"path": request_path, "method": GET}
+def get_vrfs_responses(module, vrf_names, path_format):
+    """Get the responses of a GET request per VRF, keyed by VRF name.
+
+    The requests are sent with a single edit_config call and flagged as
+    independent, so that they are sent concurrently when the connection
+    allows it.
+
+    :param path_format: request path, with a '{vrf_name}' placeholder
+    """
+    if not vrf_names:
+        return {}
+
+    requests = [{"path": path_format.format(vrf_name=vrf_name), "method": GET, "independent": True} for vrf_name in vrf_names]
     try:
-        response = edit_config(module, to_request(module, request))
+        response = edit_config(module, to_request(module, requests))
     except ConnectionError as exc:
         module.fail_json(msg=str(exc), code=exc.code)
 
-    resp = response[0][1]
+    return dict((vrf_name, resp[1]) for vrf_name, resp in zip(vrf_names, response))
+
+
+def get_peergroups(module, vrf_name):
+    return get_all_peergroups(module, [vrf_name])[vrf_name]
+
+
+def get_all_peergroups(module, vrf_names):
+    """Get the peer groups of the given VRFs, keyed by VRF name"""
+    request_path = '%s={vrf_name}/%s/peer-groups' % (network_instance_path, protocol_bgp_path)
+    responses = get_vrfs_responses(module, vrf_names, request_path)
+    return dict((vrf_name, parse_peergroups(responses[vrf_name])) for vrf_name in vrf_names)
+
+
+def parse_peergroups(resp):
+    peer_groups = []
     if 'openconfig-network-instance:peer-groups' in resp:
         data = resp['openconfig-network-instance:peer-groups']
         if 'peer-group' in data:
@@ -285,17 +376,12 @@ def get_all_bgp_af_redistribute(module, vrfs, af_redis_params_map):
     """Get all BGP Global Address Family Redistribute configurations available in chassis"""
     all_af_redis_data = []
     ret_redis_data = []
+    responses = get_bgp_snapshot(module).get_table_connections(vrfs)
     for vrf_name in vrfs:
         af_redis_data = {}
-        request_path = '%s=%s/table-connections' % (network_instance_path, vrf_name)
-        request = {"path": request_path, "method": GET}
-        try:
-            response = edit_config(module, to_request(module, request))
-        except ConnectionError as exc:
-            module.fail_json(msg=str(exc), code=exc.code)
-
-        if "openconfig-network-instance:table-connections" in response[0][1]:
-            af_redis_data.update({vrf_name: response[0][1]['openconfig-network-instance:table-connections']})
+        resp = responses[vrf_name]
+        if "openconfig-network-instance:table-connections" in resp:
+            af_redis_data.update({vrf_name: resp['openconfig-network-instance:table-connections']})
 
         if af_redis_data:
             all_af_redis_data.append(af_redis_data)
@@ -326,18 +412,14 @@ def get_all_bgp_af_redistribute(module, vrfs, af_redis_params_map):
 def get_all_bgp_globals(module, vrfs):
     """Get all BGP configurations available in chassis"""
     all_bgp_globals = []
+    get_path = '%s={vrf_name}/%s/global' % (network_instance_path, protocol_bgp_path)
+    responses = get_vrfs_responses(module, vrfs, get_path)
     for vrf_name in vrfs:
-        get_path = '%s=%s/%s/global' % (network_instance_path, vrf_name, protocol_bgp_path)
-        request = {"path": get_path, "method": GET}
-        try:
-            response = edit_config(module, to_request(module, request))
-        except ConnectionError as exc:
-            module.fail_json(msg=str(exc), code=exc.code)
-        for resp in response:
-            if "openconfig-network-instance:global" in resp[1]:
-                bgp_data = {'global': resp[1].get("openconfig-network-instance:global", {})}
-                bgp_data.update({'vrf_name': vrf_name})
-                all_bgp_globals.append(bgp_data)
+        resp = responses[vrf_name]
+        if "openconfig-network-instance:global" in resp:
+            bgp_data = {'global': resp.get("openconfig-network-instance:global", {})}
+            bgp_data.update({'vrf_name': vrf_name})
+            all_bgp_globals.append(bgp_data)
     return all_bgp_globals
 
 
@@ -447,8 +529,7 @@ def get_from_params_map(params_map, data):
 
 
 def get_bgp_data(module, global_params_map):
-    vrf_list = get_all_vrfs(module)
-    data = get_all_bgp_globals(module, vrf_list)
+    data = get_bgp_snapshot(module).get_globals()
 
     objs = []
     # operate on a collection of resource x
@@ -461,8 +542,7 @@ def get_bgp_data(module, global_params_map):
 
 
 def get_bgp_af_data(module, af_params_map):
-    vrf_list = get_all_vrfs(module)
-    data = get_all_bgp_globals(module, vrf_list)
+    data = get_bgp_snapshot(module).get_globals()
 
     objs = []
     # operate on a collection of resource x
@@ -507,23 +587,33 @@ def get_bgp_neighbors(module, vrf_name):
 
 
 def get_all_bgp_neighbors(module):
-    vrf_list = get_all_vrfs(module)
     """Get all BGP neighbor configurations available in chassis"""
+    return get_bgp_snapshot(module).get_neighbors()
+
+
+def read_all_bgp_neighbors(module, vrf_list):
+    """Read the BGP neighbor configurations of the given VRFs"""
     all_bgp_neighbors = []
 
+    as_path = '%s={vrf_name}/%s/global/config' % (network_instance_path, protocol_bgp_path)
+    as_responses = get_vrfs_responses(module, vrf_list, as_path)
+    bgp_as_map = {}
     for vrf_name in vrf_list:
-        neighbors_cfg = {}
-
-        bgp_as = get_bgp_as(module, vrf_name)
-        if bgp_as:
-            neighbors_cfg['bgp_as'] = bgp_as
-            neighbors_cfg['vrf_name'] = vrf_name
-        else:
-            continue
-
-        neighbors = get_bgp_neighbors(module, vrf_name)
-        if neighbors:
-            neighbors_cfg['neighbors'] = neighbors
+        resp = as_responses[vrf_name]
+        if "openconfig-network-instance:config" in resp:
+            bgp_as = resp['openconfig-network-instance:config'].get('as')
+            if bgp_as:
+                bgp_as_map[vrf_name] = bgp_as
+
+    bgp_vrfs = [vrf_name for vrf_name in vrf_list if vrf_name in bgp_as_map]
+    neighbors_path = '%s={vrf_name}/%s/neighbors' % (network_instance_path, protocol_bgp_path)
+    neighbors_responses = get_vrfs_responses(module, bgp_vrfs, neighbors_path)
+    for vrf_name in bgp_vrfs:
+        neighbors_cfg = {'bgp_as': bgp_as_map[vrf_name], 'vrf_name': vrf_name}
+
+        resp = neighbors_responses[vrf_name]
+        if "openconfig-network-instance:neighbors" in resp and resp['openconfig-network-instance:neighbors']:
+            neighbors_cfg['neighbors'] = resp['openconfig-network-instance:neighbors']
 
         if neighbors_cfg:
             all_bgp_neighbors.append(neighbors_cfg)
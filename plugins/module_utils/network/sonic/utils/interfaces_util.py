@@ -25,31 +25,41 @@
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-import traceback
-import json
-
-from ansible.module_utils._text import to_native
-
-try:
-    import jinja2
-    HAS_LIB = True
-except Exception as e:
-    HAS_LIB = False
-    ERR_MSG = to_native(e)
-    LIB_IMP_ERR = traceback.format_exc()
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    get_chunks,
+)
 
 
 # To create Loopback, VLAN interfaces
 def build_interfaces_create_request(interface_name):
     url = "data/openconfig-interfaces:interfaces"
     method = "PATCH"
-    payload_template = """{"openconfig-interfaces:interfaces": {"interface": [{"name": "{{interface_name}}", "config": {"name": "{{interface_name}}"}}]}}"""
-    input_data = {"interface_name": interface_name}
-    env = jinja2.Environment(autoescape=False)
-    t = env.from_string(payload_template)
-    intended_payload = t.render(input_data)
-    ret_payload = json.loads(intended_payload)
+    ret_payload = {"openconfig-interfaces:interfaces": {"interface": [{"name": interface_name, "config": {"name": interface_name}}]}}
     request = {"path": url,
                "method": method,
                "data": ret_payload}
     return request
+
+
+# To create Loopback, VLAN interfaces in bulk, 'chunk_size' interfaces per request
+def build_interfaces_bulk_create_requests(interfaces, chunk_size):
+    """Build requests that create the given interfaces
+
+    :param interfaces: list of dicts with the 'name' and optionally the
+                       'description' of each interface
+    :param chunk_size: maximum number of interfaces in a single request
+    """
+    url = "data/openconfig-interfaces:interfaces"
+    method = "PATCH"
+    requests = []
+    interface_list = []
+    for interface in interfaces:
+        intf_config = {"name": interface["name"]}
+        if interface.get("description"):
+            intf_config["description"] = interface["description"]
+        interface_list.append({"name": interface["name"], "config": intf_config})
+
+    for chunk in get_chunks(interface_list, chunk_size):
+        payload = {"openconfig-interfaces:interfaces": {"interface": chunk}}
+        requests.append({"path": url, "method": method, "data": payload})
+    return requests
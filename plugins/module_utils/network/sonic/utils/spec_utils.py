@@ -0,0 +1,360 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2024 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Argspec helpers shared by the sonic facts classes
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from copy import deepcopy
+
+from ansible.module_utils._text import to_native
+from ansible.module_utils.common.parameters import DEFAULT_TYPE_VALIDATORS
+from ansible.module_utils.common.validation import (
+    check_mutually_exclusive,
+    check_required_arguments,
+    check_required_by,
+    check_required_if,
+    check_required_one_of,
+    check_required_together,
+)
+from ansible.module_utils.parsing.convert_bool import BOOLEANS_FALSE, BOOLEANS_TRUE
+from ansible.module_utils.six import integer_types, string_types
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
+    utils,
+)
+
+
+class GeneratedSpec(dict):
+    """Read-only facts tree generated from an argspec.
+
+    A deepcopy of it is a plain, writable dict, which is what the
+    render_config methods of the facts classes start from.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('%s is read-only' % type(self).__name__)
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __deepcopy__(self, memo):
+        return dict((key, deepcopy(value, memo)) for key, value in self.items())
+
+    def copy(self):
+        return deepcopy(self)
+
+    def __reduce__(self):
+        return dict, (deepcopy(self),)
+
+
+def _freeze_spec(generated):
+    frozen = {}
+    for key, value in generated.items():
+        frozen[key] = _freeze_spec(value) if isinstance(value, dict) else deepcopy(value)
+    return GeneratedSpec(frozen)
+
+
+_generated_specs = {}
+
+
+def get_generated_spec(args_class, subspec='config', options='options'):
+    """Return the facts tree generated from the argspec of args_class.
+
+    The tree is generated once per (args_class, subspec, options) and
+    shared by all the facts class instances. It is read-only; use a
+    deepcopy of it to render a config.
+
+    :param args_class: the *Args class holding the argument_spec
+    :param subspec: the top level option holding the config, if any
+    :param options: the key of the suboptions of subspec, if any
+    :rtype: GeneratedSpec
+    """
+    key = (args_class, subspec, options)
+    generated_spec = _generated_specs.get(key)
+    if generated_spec is None:
+        spec = args_class.argument_spec
+        if subspec:
+            spec = spec[subspec][options] if options else spec[subspec]
+        generated_spec = _generated_specs.setdefault(key, _freeze_spec(utils.generate_dict(spec)))
+    return generated_spec
+
+
+# Options needing the full AnsibleModule argument handling
+_DELEGATED_OPTION_KEYS = ('aliases', 'deprecated_aliases', 'fallback', 'apply_defaults')
+
+
+class _DelegatedOption(Exception):
+    """Raised when an argspec uses one of _DELEGATED_OPTION_KEYS"""
+
+
+def _term_groups(terms):
+    # Same terms as the ansible checks, a group given as a string has a single term
+    return tuple(frozenset([group] if isinstance(group, string_types) else group) for group in terms or ())
+
+
+def _together_may_fail(groups, params):
+    return any(0 < len(group.intersection(params)) < len(group) for group in groups)
+
+
+def _one_of_may_fail(groups, params):
+    return any(group.isdisjoint(params) for group in groups)
+
+
+# The ansible checks, run after the types and choices, and the conditions
+# in which they can fail (None if they always have to run)
+_ADDITIONAL_CHECKS = (
+    ('required_together', check_required_together, _together_may_fail),
+    ('required_one_of', check_required_one_of, _one_of_may_fail),
+    ('required_if', check_required_if, None),
+    ('required_by', check_required_by, None),
+)
+
+
+# Values of these types are returned unchanged by the type checkers
+_CHECKED_TYPES = {
+    'str': string_types,
+    'int': integer_types,
+    'bool': bool,
+    'float': float,
+    'list': list,
+    'dict': dict,
+    'raw': object,
+}
+
+
+def _is_empty(value):
+    return value is None or (isinstance(value, (string_types, list, dict, tuple)) and not value)
+
+
+class _Option(object):
+    """Validation steps of one option of an argspec"""
+
+    __slots__ = ('name', 'skip_none', 'type_name', 'type_checker', 'checked_type', 'is_list', 'elements_name',
+                 'elements_checker', 'elements_checked_type', 'choices', 'suboptions')
+
+    def __init__(self, name, option, suboptions):
+        self.name = name
+        self.skip_none = not option.get('required') and option.get('default') is None
+        self.type_name = option.get('type') or 'str'
+        self.type_checker = DEFAULT_TYPE_VALIDATORS[self.type_name]
+        self.checked_type = _CHECKED_TYPES.get(self.type_name, ())
+        self.is_list = self.type_name == 'list'
+        self.elements_name = option.get('elements')
+        self.elements_checker = DEFAULT_TYPE_VALIDATORS[self.elements_name] if self.elements_name else None
+        self.elements_checked_type = _CHECKED_TYPES.get(self.elements_name, ())
+        self.choices = option.get('choices')
+        self.suboptions = suboptions
+
+    def convert(self, value, context):
+        """Return value converted to the type of the option"""
+        if self.is_list and isinstance(value, tuple):
+            value = list(value)
+        if not isinstance(value, self.checked_type):
+            try:
+                value = self.type_checker(value)
+            except (TypeError, ValueError) as exc:
+                raise ValueError("argument '%s' is of type %s%s and we were unable to convert to %s: %s"
+                                 % (self.name, type(value), _found_in(context), self.type_name, to_native(exc)))
+        if self.elements_checker is None:
+            # Not traversed below, copied so that the result does not share it with the input
+            return deepcopy(value) if isinstance(value, (list, dict)) and self.suboptions is None else value
+        if not self.is_list or not isinstance(value, list):
+            raise ValueError("Invalid type %s for option '%s'%s, elements value check is supported only with 'list' type"
+                             % (self.type_name, value, _found_in(context)))
+        elements = []
+        for element in value:
+            if isinstance(element, self.elements_checked_type):
+                elements.append(element)
+                continue
+            try:
+                elements.append(self.elements_checker(element))
+            except (TypeError, ValueError) as exc:
+                raise ValueError("Elements value for option '%s'%s is of type %s and we were unable to convert to %s: %s"
+                                 % (self.name, _found_in(context), type(element), self.elements_name, to_native(exc)))
+        return elements
+
+    def check_choices(self, params, context):
+        value = params[self.name]
+        if isinstance(value, list):
+            invalid = [item for item in value if item not in self.choices]
+            if invalid:
+                raise ValueError("value of %s must be one or more of: %s. Got no match for: %s%s"
+                                 % (self.name, ', '.join(to_native(choice) for choice in self.choices),
+                                    ', '.join(to_native(item) for item in invalid), _found_in(context)))
+            return
+        if value in self.choices:
+            return
+        # Same as AnsibleModule for booleans YAML made out of 'yes'/'no' choices
+        for text, booleans in (('False', BOOLEANS_FALSE), ('True', BOOLEANS_TRUE)):
+            if value == text:
+                overlap = booleans.intersection(self.choices)
+                if len(overlap) == 1:
+                    (params[self.name],) = overlap
+                    return
+        raise ValueError("value of %s must be one of: %s, got: %s%s"
+                         % (self.name, ', '.join(to_native(choice) for choice in self.choices), value, _found_in(context)))
+
+
+def _found_in(context):
+    return " found in '%s'" % ' -> '.join(context) if context else ''
+
+
+class OptionsValidator(object):
+    """Validation of the options of one level of an argspec.
+
+    The steps of the AnsibleModule argument validation (unsupported
+    options, mutually exclusive and required options, types and
+    elements, choices, the other required_* checks and defaults) are
+    precomputed from the argspec when the validator is built, and
+    applied to a copy of the parameters in a single pass, suboptions
+    included. The first error raises ValueError.
+    """
+
+    __slots__ = ('spec', 'names', 'options', 'pre_defaults', 'required', 'mutually_exclusive', 'exclusive_groups', 'checks')
+
+    def __init__(self, spec, checks=None):
+        checks = checks or {}
+        self.spec = spec
+        self.names = frozenset(spec)
+        self.options = tuple(self._build_option(name, option) for name, option in spec.items())
+        self.pre_defaults = tuple((name, option['default']) for name, option in spec.items() if option.get('default') is not None)
+        self.required = tuple(name for name, option in spec.items() if option.get('required'))
+        self.mutually_exclusive = checks.get('mutually_exclusive')
+        self.exclusive_groups = _term_groups(self.mutually_exclusive)
+        self.checks = tuple((check, checks[attr], may_fail, _term_groups(checks[attr]) if may_fail else None)
+                            for attr, check, may_fail in _ADDITIONAL_CHECKS if checks.get(attr) is not None)
+
+    @staticmethod
+    def _build_option(name, option):
+        for key in _DELEGATED_OPTION_KEYS:
+            if option.get(key):
+                raise _DelegatedOption(key)
+        suboptions = None
+        if option.get('options') is not None and (option.get('type') == 'dict' or option.get('elements') == 'dict'):
+            suboptions = OptionsValidator(option['options'], option)
+        return _Option(name, option, suboptions)
+
+    def validate(self, parameters, context=(), remove_empties=False):
+        """Return the validated copy of parameters
+
+        :param parameters: dict of options of this level
+        :param context: names of the options leading to this level
+        :param remove_empties: drop the empty values as netcommon remove_empties does
+        """
+        params = dict(parameters)
+        if not self.names.issuperset(params):
+            unsupported = sorted(name for name in params if name not in self.names)
+            raise ValueError('Unsupported parameters%s: %s. Supported parameters include: %s.'
+                             % (_found_in(context), ', '.join(unsupported), ', '.join(sorted(self.names))))
+        try:
+            # The ansible checks only run to report an error
+            if any(len(group.intersection(params)) > 1 for group in self.exclusive_groups):
+                check_mutually_exclusive(self.mutually_exclusive, params, list(context))
+            for name, default in self.pre_defaults:
+                if name not in params:
+                    params[name] = deepcopy(default)
+            if any(name not in params for name in self.required):
+                check_required_arguments(self.spec, params, list(context))
+        except TypeError as exc:
+            raise ValueError(to_native(exc))
+
+        for option in self.options:
+            if option.name not in params:
+                continue
+            value = params[option.name]
+            if value is not None or not option.skip_none:
+                params[option.name] = option.convert(value, context)
+            if option.choices is not None:
+                option.check_choices(params, context)
+
+        try:
+            for check, terms, may_fail, groups in self.checks:
+                if may_fail is None or may_fail(groups, params):
+                    check(terms, params, list(context))
+        except TypeError as exc:
+            raise ValueError(to_native(exc))
+
+        for option in self.options:
+            if option.name not in params:
+                params[option.name] = None
+            elif option.suboptions is not None and params[option.name] is not None:
+                params[option.name] = option.suboptions.validate_nested(option.name, params[option.name], context, remove_empties)
+
+        if remove_empties:
+            params = self._remove_empties(params)
+        return params
+
+    def validate_nested(self, name, value, context, remove_empties):
+        context = context + (name,)
+        if isinstance(value, dict):
+            return self.validate(value, context, remove_empties)
+        elements = []
+        for element in value:
+            if not isinstance(element, dict):
+                raise ValueError("value of '%s' must be of type dict or list of dicts" % name)
+            elements.append(self.validate(element, context, remove_empties))
+        return elements
+
+    def _remove_empties(self, params):
+        # Same result as netcommon remove_empties, suboptions are already done
+        result = {}
+        for option in self.options:
+            value = params[option.name]
+            if option.suboptions is None:
+                if isinstance(value, dict):
+                    value = utils.remove_empties(value)
+                elif isinstance(value, list) and value and all(isinstance(item, dict) for item in value):
+                    value = [utils.remove_empties(item) for item in value]
+            if not _is_empty(value):
+                result[option.name] = value
+        return result
+
+
+_options_validators = {}
+
+
+def get_options_validator(argument_spec):
+    """Return the OptionsValidator of argument_spec, or None if the
+    argspec uses options it does not handle (e.g. aliases). The
+    validator is built once per argspec.
+    """
+    entry = _options_validators.get(id(argument_spec))
+    if entry is None or entry[0] is not argument_spec:
+        try:
+            validator = OptionsValidator(argument_spec)
+        except _DelegatedOption:
+            validator = None
+        # The argspec is kept in the entry so that its id is not reused
+        entry = _options_validators.setdefault(id(argument_spec), (argument_spec, validator))
+    return entry[1]
+
+
+def normalize_config(argument_spec, data, remove_empties=False):
+    """Validate rendered facts against the module argspec.
+
+    Returns the same parameters as netcommon validate_config (types
+    converted, defaults set and missing options set to None) without
+    instantiating an AnsibleModule, and optionally with the empty
+    values removed as netcommon remove_empties does. Invalid data is
+    handed to validate_config, which fails the module through
+    fail_json with the AnsibleModule error message.
+
+    :param argument_spec: the module argspec
+    :param data: the parameters to validate, e.g. {'config': objs}
+    :param remove_empties: remove the empty values from the result
+    :rtype: dict
+    """
+    validator = get_options_validator(argument_spec)
+    if validator is not None:
+        try:
+            return validator.validate(data, remove_empties=remove_empties)
+        except ValueError:
+            pass
+
+    params = utils.validate_config(argument_spec, data)
+    return utils.remove_empties(params) if remove_empties else params
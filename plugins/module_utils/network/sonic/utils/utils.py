@@ -32,6 +32,12 @@ GET = 'get'
 
 intf_naming_mode = ""
 
+# Set to True to make get_diff() use the original nested-loop list matching
+# instead of the indexed one, e.g. to cross-check results.
+use_legacy_diff = False
+# Likewise for get_replaced_config().
+use_legacy_replaced = False
+
 
 def remove_matching_defaults(root, default_entry):
     if isinstance(root, list):
@@ -71,6 +77,227 @@ def get_diff(base_data, compare_with_data, test_keys=None, is_skeleton=None):
 
 
 def get_diff_dict(base_data, compare_with_data, test_keys=None, is_skeleton=None):
+    if use_legacy_diff:
+        return get_diff_dict_legacy(base_data, compare_with_data, test_keys, is_skeleton)
+
+    if is_skeleton is None:
+        is_skeleton = False
+
+    if test_keys is None:
+        test_keys = []
+
+    if not base_data:
+        return base_data
+
+    planned_set = set(base_data.keys())
+    discovered_set = set(compare_with_data.keys())
+    intersect_set = planned_set.intersection(discovered_set)
+    changed_dict = {}
+    added_set = planned_set - intersect_set
+    # Keys part of added are new and put into changed_dict
+    if added_set:
+        for key in added_set:
+            if is_skeleton:
+                changed_dict[key] = base_data[key]
+            elif base_data[key] is not None:
+                if isinstance(base_data[key], dict):
+                    val_dict = remove_empties(base_data[key])
+                    if val_dict:
+                        changed_dict[key] = val_dict
+                elif isinstance(base_data[key], list):
+                    val_list = remove_empties_from_list(base_data[key])
+                    if val_list:
+                        changed_dict[key] = val_list
+                else:
+                    changed_dict[key] = base_data[key]
+    for key in intersect_set:
+        value = base_data[key]
+        if isinstance(value, list):
+            p_list = value
+            d_list = compare_with_data[key]
+            if p_list and d_list:
+                changed_list = get_diff_list(key, p_list, d_list, test_keys, is_skeleton)
+                if changed_list:
+                    changed_dict.update({key: changed_list})
+            elif p_list and (not d_list):
+                changed_dict[key] = p_list
+        elif (isinstance(value, dict) and isinstance(compare_with_data[key], dict)):
+            dict_diff = get_diff_dict(value, compare_with_data[key], test_keys, is_skeleton)
+            if dict_diff:
+                changed_dict[key] = dict_diff
+        elif value is not None:
+            if not is_skeleton:
+                if compare_with_data[key] != value:
+                    changed_dict[key] = value
+    return changed_dict
+
+
+def get_diff_list(key, p_list, d_list, test_keys, is_skeleton):
+    """Diff the list stored under 'key' using a ListIndex over d_list.
+
+    Each p_list item is matched against the first d_list item the legacy
+    nested loop would have picked, without rescanning d_list per item.
+    """
+    keys_to_compare = next((test_key_item[key] for test_key_item in test_keys if key in test_key_item), None)
+    remaining_keys = [test_key_item for test_key_item in test_keys if key not in test_key_item]
+    index = ListIndex(d_list, keys_to_compare)
+    changed_list = []
+    for p_list_item in p_list:
+        matched = False
+        dict_diff = None
+        if isinstance(p_list_item, dict):
+            if keys_to_compare:
+                d_list_item = index.find_by_keys(p_list_item)
+                if d_list_item is not None:
+                    matched = True
+                    dict_diff = get_diff_dict(p_list_item, d_list_item, remaining_keys, is_skeleton)
+                    if dict_diff:
+                        for test_key in keys_to_compare:
+                            dict_diff.update({test_key: p_list_item[test_key]})
+            else:
+                for d_list_item in index.iter_dict_candidates(p_list_item):
+                    if not get_diff_dict(p_list_item, d_list_item, test_keys, is_skeleton):
+                        matched = True
+                        break
+        else:
+            matched = index.contains_value(p_list_item)
+
+        if not matched:
+            if is_skeleton:
+                changed_list.append(p_list_item)
+            else:
+                if isinstance(p_list_item, dict):
+                    val_dict = remove_empties(p_list_item)
+                    if val_dict is not None:
+                        changed_list.append(val_dict)
+                elif isinstance(p_list_item, list):
+                    val_list = remove_empties_from_list(p_list_item)
+                    if val_list is not None:
+                        changed_list.append(val_list)
+                else:
+                    if p_list_item is not None:
+                        changed_list.append(p_list_item)
+        elif dict_diff:
+            changed_list.append(dict_diff)
+    return changed_list
+
+
+def _freeze(value):
+    """Return a hashable equivalent of a dict/list structure."""
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    hash(value)
+    return value
+
+
+class ListIndex(object):
+    """Lookup structure over the 'have' side of a list diff.
+
+    Dict items are grouped by which of the test keys they carry, and each
+    group is hashed on demand by the test keys it shares with the item
+    being looked up. This reproduces the legacy matching rule (all test
+    keys present in both items are equal, and at least one is present)
+    while keeping the "first match in list order" semantics.
+    """
+
+    def __init__(self, d_list, keys_to_compare=None):
+        self._keys = tuple(keys_to_compare) if keys_to_compare else ()
+        self._dict_items = []
+        self._groups = {}
+        self._tables = {}
+        self._values = None
+        self._unhashable_values = None
+        self._frozen = None
+        self._d_list = d_list
+        for pos, item in enumerate(d_list):
+            if isinstance(item, dict):
+                self._dict_items.append(item)
+                signature = tuple(k for k in self._keys if k in item)
+                self._groups.setdefault(signature, []).append((pos, item))
+
+    def find_by_keys(self, p_item):
+        """Return the first dict item matching p_item on the test keys, or None."""
+        p_keys = [k for k in self._keys if k in p_item]
+        if not p_keys:
+            return None
+        best = None
+        for signature, members in self._groups.items():
+            common = tuple(k for k in p_keys if k in signature)
+            if not common:
+                continue
+            found = self._lookup(signature, common, members, p_item)
+            if found is not None and (best is None or found[0] < best[0]):
+                best = found
+        return best[1] if best else None
+
+    def _lookup(self, signature, common, members, p_item):
+        table_key = (signature, common)
+        table = self._tables.get(table_key)
+        if table is None:
+            table = {}
+            try:
+                for pos, item in members:
+                    table.setdefault(tuple(item[k] for k in common), (pos, item))
+            except TypeError:
+                table = False
+            self._tables[table_key] = table
+        if table is not False:
+            try:
+                return table.get(tuple(p_item[k] for k in common))
+            except TypeError:
+                pass
+        for pos, item in members:
+            if all(p_item[k] == item[k] for k in common):
+                return (pos, item)
+        return None
+
+    def iter_dict_candidates(self, p_item):
+        """Yield dict items to try for a key-less match, likeliest first.
+
+        An item equal to p_item almost always yields an empty diff, so it
+        is tried first; the remaining items follow in list order.
+        """
+        if self._frozen is None:
+            self._frozen = {}
+            for item in self._dict_items:
+                try:
+                    self._frozen.setdefault(_freeze(item), item)
+                except TypeError:
+                    pass
+        equal_item = None
+        try:
+            equal_item = self._frozen.get(_freeze(p_item))
+        except TypeError:
+            pass
+        if equal_item is not None:
+            yield equal_item
+        for item in self._dict_items:
+            if item is not equal_item:
+                yield item
+
+    def contains_value(self, p_item):
+        """Return True if a non-dict p_item is equal to any item of the list."""
+        if self._values is None:
+            self._values = set()
+            self._unhashable_values = []
+            for item in self._d_list:
+                if isinstance(item, dict):
+                    continue
+                try:
+                    self._values.add(item)
+                except TypeError:
+                    self._unhashable_values.append(item)
+        try:
+            if p_item in self._values:
+                return True
+        except TypeError:
+            pass
+        return any(p_item == item for item in self._unhashable_values)
+
+
+def get_diff_dict_legacy(base_data, compare_with_data, test_keys=None, is_skeleton=None):
     if is_skeleton is None:
         is_skeleton = False
 
@@ -127,7 +354,7 @@ def get_diff_dict(base_data, compare_with_data, test_keys=None, is_skeleton=None
                                             key_matched_cnt += 1
                                 if key_matched_cnt and key_matched_cnt == test_keys_present_cnt:
                                     remaining_keys = [test_key_item for test_key_item in test_keys if key not in test_key_item]
-                                    dict_diff = get_diff_dict(p_list_item, d_list_item, remaining_keys, is_skeleton)
+                                    dict_diff = get_diff_dict_legacy(p_list_item, d_list_item, remaining_keys, is_skeleton)
                                     matched = True
                                     if dict_diff:
                                         has_diff = True
@@ -135,7 +362,7 @@ def get_diff_dict(base_data, compare_with_data, test_keys=None, is_skeleton=None
                                             dict_diff.update({test_key: p_list_item[test_key]})
                                     break
                             else:
-                                dict_diff = get_diff_dict(p_list_item, d_list_item, test_keys, is_skeleton)
+                                dict_diff = get_diff_dict_legacy(p_list_item, d_list_item, test_keys, is_skeleton)
                                 if not dict_diff:
                                     matched = True
                                     break
@@ -165,7 +392,7 @@ def get_diff_dict(base_data, compare_with_data, test_keys=None, is_skeleton=None
             elif p_list and (not d_list):
                 changed_dict[key] = p_list
         elif (isinstance(value, dict) and isinstance(compare_with_data[key], dict)):
-            dict_diff = get_diff_dict(base_data[key], compare_with_data[key], test_keys, is_skeleton)
+            dict_diff = get_diff_dict_legacy(base_data[key], compare_with_data[key], test_keys, is_skeleton)
             if dict_diff:
                 changed_dict[key] = dict_diff
         elif value is not None:
@@ -343,6 +570,23 @@ def remove_empties_from_list(config_list):
     return ret_config
 
 
+def get_chunk_size(module):
+    """Return the 'chunk_size' option of the module, the maximum number
+    of entries created in a single request. The module fails when it is
+    not a positive number.
+    """
+    chunk_size = module.params['chunk_size']
+    if chunk_size < 1:
+        module.fail_json(msg="chunk_size must be greater than zero, got {0}".format(chunk_size))
+
+    return chunk_size
+
+
+def get_chunks(entries, chunk_size):
+    """Split a list of entries in lists of at most 'chunk_size' entries"""
+    return [entries[index:index + chunk_size] for index in range(0, len(entries), chunk_size)]
+
+
 def get_device_interface_naming_mode(module):
     intf_naming_mode = ""
     request = {"path": "data/sonic-device-metadata:sonic-device-metadata/DEVICE_METADATA/DEVICE_METADATA_LIST=localhost", "method": GET}
@@ -363,12 +607,16 @@ STANDARD_ETH_REGEXP = r"[e|E]th\s*\d+/\d+"
 NATIVE_ETH_REGEXP = r"[e|E]th*\d+$"
 NATIVE_MODE = "native"
 STANDARD_MODE = "standard"
+STANDARD_ETH_PATTERN = re.compile(STANDARD_ETH_REGEXP)
+NATIVE_ETH_PATTERN = re.compile(NATIVE_ETH_REGEXP)
+WHITESPACE_PATTERN = re.compile(r"\s+", flags=re.UNICODE)
+DIGIT_PATTERN = re.compile(r"\d")
 
 
 def find_intf_naming_mode(intf_name):
     ret_intf_naming_mode = NATIVE_MODE
 
-    if re.search(STANDARD_ETH_REGEXP, intf_name):
+    if STANDARD_ETH_PATTERN.search(intf_name):
         ret_intf_naming_mode = STANDARD_MODE
 
     return ret_intf_naming_mode
@@ -407,13 +655,29 @@ def normalize_interface_name_list(configs, module):
 
 
 def get_normalize_interface_name(intf_name, module):
+    # The naming mode of the device does not change during a module run,
+    # so the normalized (and validated) names are cached in the module.
+    intf_names = getattr(module, '_sonic_intf_names', None)
+    if intf_names is None:
+        intf_names = {}
+        if module is not None:
+            module._sonic_intf_names = intf_names
+
+    ret_intf_name = intf_names.get(intf_name)
+    if ret_intf_name is None:
+        ret_intf_name = intf_names[intf_name] = _normalize_interface_name(intf_name, module)
+
+    return ret_intf_name
+
+
+def _normalize_interface_name(intf_name, module):
     change_flag = False
     # remove the space in the given string
-    ret_intf_name = re.sub(r"\s+", "", intf_name, flags=re.UNICODE)
+    ret_intf_name = WHITESPACE_PATTERN.sub("", intf_name)
     ret_intf_name = ret_intf_name.capitalize()
 
     # serach the numeric charecter(digit)
-    match = re.search(r"\d", ret_intf_name)
+    match = DIGIT_PATTERN.search(ret_intf_name)
     if match:
         change_flag = True
         start_pos = match.start()
@@ -427,9 +691,9 @@ def get_normalize_interface_name(intf_name, module):
         if ret_intf_name.startswith("Management") or ret_intf_name.startswith("Mgmt"):
             name = "eth"
             intf_id = "0"
-        elif re.search(STANDARD_ETH_REGEXP, ret_intf_name):
+        elif STANDARD_ETH_PATTERN.search(ret_intf_name):
             name = "Eth"
-        elif re.search(NATIVE_ETH_REGEXP, ret_intf_name):
+        elif NATIVE_ETH_PATTERN.search(ret_intf_name):
             name = "Ethernet"
         elif name.startswith("Po"):
             name = "PortChannel"
@@ -459,6 +723,41 @@ def get_speed_from_breakout_mode(breakout_mode):
     return speed
 
 
+def get_breakout_mode_from_cfg(brkout_mode):
+    """Return the breakout mode described by a BREAKOUT_CFG_LIST 'brkout_mode'.
+
+    None is returned when the value does not tell the mode: it is
+    missing, unknown to this collection, or carries alternative speeds
+    in brackets (e.g. '1x100G[40G]', which the platform may run as
+    1x40G). The caller should then fall back to get_breakout_mode().
+    """
+    if not brkout_mode or '[' in brkout_mode:
+        return None
+    if get_speed_from_breakout_mode(brkout_mode):
+        return brkout_mode
+    return None
+
+
+def get_port_breakout_mode(module, name, brkout_mode):
+    """Return the breakout mode of a port from its BREAKOUT_CFG_LIST
+    'brkout_mode', reading its platform component only when that value
+    does not tell the mode.
+
+    The modes are kept in the module's '_sonic_breakout_modes' attribute,
+    so that the modules reading the same port agree on its mode.
+    """
+    breakout_modes = getattr(module, '_sonic_breakout_modes', None)
+    if breakout_modes is None:
+        breakout_modes = {}
+        module._sonic_breakout_modes = breakout_modes
+    if name not in breakout_modes:
+        mode = get_breakout_mode_from_cfg(brkout_mode)
+        if mode is None:
+            mode = get_breakout_mode(module, name)
+        breakout_modes[name] = mode
+    return breakout_modes[name]
+
+
 def get_breakout_mode(module, name):
     response = None
     mode = None
@@ -561,6 +860,186 @@ def get_replaced_config(new_conf, exist_conf, test_keys=None):
 
 def get_replaced_config_dict(new_conf, exist_conf, test_keys=None, key_set=None):
 
+    if use_legacy_replaced:
+        return get_replaced_config_dict_legacy(new_conf, exist_conf, test_keys, key_set)
+
+    replaced_conf = dict()
+
+    if test_keys is None:
+        test_keys = []
+    if key_set is None:
+        key_set = []
+
+    if not new_conf:
+        return replaced_conf
+
+    new_key_set = set(new_conf.keys())
+    exist_key_set = set(exist_conf.keys())
+
+    trival_new_key_set = set()
+    dict_list_new_key_set = set()
+    for key in new_key_set:
+        if new_conf[key] not in [None, [], {}]:
+            if isinstance(new_conf[key], (list, dict)):
+                dict_list_new_key_set.add(key)
+            else:
+                trival_new_key_set.add(key)
+
+    trival_exist_key_set = set()
+    dict_list_exist_key_set = set()
+    for key in exist_key_set:
+        if exist_conf[key] not in [None, [], {}]:
+            if isinstance(exist_conf[key], (list, dict)):
+                dict_list_exist_key_set.add(key)
+            else:
+                trival_exist_key_set.add(key)
+
+    common_trival_key_set = trival_new_key_set.intersection(trival_exist_key_set)
+
+    key_matched_cnt = 0
+    common_trival_key_matched = True
+    for key in common_trival_key_set:
+        if new_conf[key] == exist_conf[key]:
+            if key in key_set:
+                key_matched_cnt += 1
+        else:
+            if key not in key_set:
+                common_trival_key_matched = False
+
+    key_matched = (key_matched_cnt == len(key_set))
+    if key_matched:
+        extra_trival_new_key_set = trival_new_key_set - common_trival_key_set
+        extra_trival_exist_key_set = trival_exist_key_set - common_trival_key_set
+        if extra_trival_new_key_set or extra_trival_exist_key_set or \
+           not common_trival_key_matched:
+            # Replace whole dict.
+            replaced_conf = exist_conf
+            return replaced_conf
+    else:
+        replaced_conf = []
+        return replaced_conf
+
+    replace_whole_dict = False
+    replace_some_list = False
+    replace_some_dict = False
+    common_dict_list_key_set = dict_list_new_key_set.intersection(dict_list_exist_key_set)
+    for key in common_dict_list_key_set:
+
+        new_value = new_conf[key]
+        exist_value = exist_conf[key]
+
+        if (isinstance(new_value, list) and isinstance(exist_value, list)):
+            n_list = new_value
+            e_list = exist_value
+            t_keys = next((t_key_item[key] for t_key_item in test_keys if key in t_key_item), None)
+
+            replaced_list, not_dict_item, dict_no_key_item = get_replaced_list(key, n_list, e_list,
+                                                                               test_keys, t_keys)
+
+            if dict_no_key_item:
+                replaced_list = e_list
+
+            if not_dict_item:
+                n_set = set(n_list)
+                e_set = set(e_list)
+                diff_set = n_set.symmetric_difference(e_set)
+                if diff_set:
+                    replaced_conf[key] = e_list
+                    replace_some_list = True
+
+            elif replaced_list:
+                replaced_conf[key] = replaced_list
+                replace_some_list = True
+
+        elif (isinstance(new_value, dict) and isinstance(exist_value, dict)):
+            replaced_dict = get_replaced_config_dict(new_conf[key], exist_conf[key], test_keys)
+            if replaced_dict:
+                replaced_conf[key] = replaced_dict
+                replace_some_dict = True
+
+        elif (isinstance(new_value, (list, dict)) or isinstance(exist_value, (list, dict))):
+            # Replace whole dict.
+            replaced_conf = exist_conf
+            replace_whole_dict = True
+            break
+
+        else:
+            continue
+
+    if ((replace_some_dict or replace_some_list) and (not replace_whole_dict)):
+        for key in key_set:
+            replaced_conf[key] = exist_conf[key]
+
+    return replaced_conf
+
+
+def is_trivial_value(value):
+    return value not in [None, [], {}] and not isinstance(value, (list, dict))
+
+
+def get_replaced_list(key, n_list, e_list, test_keys, t_keys):
+    """Match the 'key' list entries of new and existing config for replacement.
+
+    Returns (replaced_list, not_dict_item, dict_no_key_item) as computed
+    by the legacy nested scan. When both lists hold only dicts and test
+    keys are configured, the existing entries are indexed by their test
+    key values so that each new entry is only compared with the entries
+    sharing those values.
+    """
+    replaced_list = list()
+    t_key_set = set(t_keys.keys()) if t_keys else set()
+    remaining_keys = [t_key_item for t_key_item in test_keys if key not in t_key_item]
+
+    all_dicts = all(isinstance(item, dict) for item in n_list) and all(isinstance(item, dict) for item in e_list)
+    if not all_dicts:
+        for n_item in n_list:
+            for e_item in e_list:
+                if (isinstance(n_item, dict) and isinstance(e_item, dict)):
+                    if not t_keys:
+                        return e_list, False, True
+                    replaced_dict = get_replaced_config_dict(n_item, e_item, remaining_keys, t_key_set)
+                    if replaced_dict:
+                        replaced_list.append(replaced_dict)
+                        break
+                else:
+                    return replaced_list, True, False
+        return replaced_list, False, False
+
+    if not t_keys:
+        return e_list, False, True
+
+    # Only entries whose test keys all hold equal scalar values can
+    # produce a non-empty replacement, see key_set handling in
+    # get_replaced_config_dict().
+    key_order = tuple(t_key_set)
+    index = {}
+    try:
+        for e_item in e_list:
+            if all(k in e_item and is_trivial_value(e_item[k]) for k in key_order):
+                index.setdefault(tuple(e_item[k] for k in key_order), []).append(e_item)
+    except TypeError:
+        index = None
+
+    for n_item in n_list:
+        if not all(k in n_item and is_trivial_value(n_item[k]) for k in key_order):
+            continue
+        candidates = e_list
+        if index is not None:
+            try:
+                candidates = index.get(tuple(n_item[k] for k in key_order), [])
+            except TypeError:
+                pass
+        for e_item in candidates:
+            replaced_dict = get_replaced_config_dict(n_item, e_item, remaining_keys, t_key_set)
+            if replaced_dict:
+                replaced_list.append(replaced_dict)
+                break
+
+    return replaced_list, False, False
+
+
+def get_replaced_config_dict_legacy(new_conf, exist_conf, test_keys=None, key_set=None):
+
     replaced_conf = dict()
 
     if test_keys is None:
@@ -642,8 +1121,8 @@ def get_replaced_config_dict(new_conf, exist_conf, test_keys=None, key_set=None)
                     if (isinstance(n_item, dict) and isinstance(e_item, dict)):
                         if t_keys:
                             remaining_keys = [t_key_item for t_key_item in test_keys if key not in t_key_item]
-                            replaced_dict = get_replaced_config_dict(n_item, e_item,
-                                                                     remaining_keys, t_key_set)
+                            replaced_dict = get_replaced_config_dict_legacy(n_item, e_item,
+                                                                            remaining_keys, t_key_set)
                         else:
                             dict_no_key_item = True
                             break
@@ -674,7 +1153,7 @@ def get_replaced_config_dict(new_conf, exist_conf, test_keys=None, key_set=None)
                 replace_some_list = True
 
         elif (isinstance(new_value, dict) and isinstance(exist_value, dict)):
-            replaced_dict = get_replaced_config_dict(new_conf[key], exist_conf[key], test_keys)
+            replaced_dict = get_replaced_config_dict_legacy(new_conf[key], exist_conf[key], test_keys)
             if replaced_dict:
                 replaced_conf[key] = replaced_dict
                 replace_some_dict = True
@@ -0,0 +1,151 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2024 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+VLAN set helpers shared by the sonic resource modules
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+from bisect import bisect_right
+
+
+class VlanRangeSet(object):
+    """A set of VLAN IDs kept as sorted, disjoint, non-adjacent intervals.
+
+    Trunk VLAN configuration is expressed as single VLANs and ranges
+    ("10", "10-20", "10..20" or comma separated lists of those). Storing
+    them as intervals keeps set operations proportional to the number of
+    ranges rather than the number of VLANs.
+    """
+
+    __slots__ = ('_intervals',)
+
+    def __init__(self, intervals=None):
+        self._intervals = self._normalize(intervals or [])
+
+    @classmethod
+    def from_values(cls, values):
+        """Build a set from VLAN values as found in 'allowed_vlans' entries.
+
+        :param values: iterable of int VLAN IDs or strings holding a VLAN,
+                       a range using "-" or "..", or a comma separated list
+        """
+        intervals = []
+        for value in values:
+            if value is None or value == '':
+                continue
+            if isinstance(value, int):
+                intervals.append((value, value))
+                continue
+            for item in str(value).replace('"', '').split(','):
+                item = item.strip()
+                if not item:
+                    continue
+                bounds = item.split('..') if '..' in item else item.split('-')
+                intervals.append((int(bounds[0]), int(bounds[-1])))
+        return cls(intervals)
+
+    @classmethod
+    def from_allowed_vlans(cls, allowed_vlans):
+        """Build a set from a list of {'vlan': <value>} dicts"""
+        return cls.from_values(item.get('vlan') for item in allowed_vlans or [] if item)
+
+    @staticmethod
+    def _normalize(intervals):
+        merged = []
+        for lower, upper in sorted((min(lo, hi), max(lo, hi)) for lo, hi in intervals):
+            if merged and lower <= merged[-1][1] + 1:
+                if upper > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], upper)
+            else:
+                merged.append((lower, upper))
+        return merged
+
+    @property
+    def intervals(self):
+        return list(self._intervals)
+
+    def __len__(self):
+        return sum(upper - lower + 1 for lower, upper in self._intervals)
+
+    def __bool__(self):
+        return bool(self._intervals)
+
+    __nonzero__ = __bool__
+
+    def __eq__(self, other):
+        return isinstance(other, VlanRangeSet) and self._intervals == other._intervals
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(tuple(self._intervals))
+
+    def __repr__(self):
+        return 'VlanRangeSet(%r)' % (self._intervals,)
+
+    def __contains__(self, vlan):
+        idx = bisect_right(self._intervals, (vlan, float('inf'))) - 1
+        return idx >= 0 and self._intervals[idx][0] <= vlan <= self._intervals[idx][1]
+
+    def union(self, other):
+        return VlanRangeSet(self._intervals + other._intervals)
+
+    def intersection(self, other):
+        result = []
+        idx_a = idx_b = 0
+        list_a = self._intervals
+        list_b = other._intervals
+        while idx_a < len(list_a) and idx_b < len(list_b):
+            lower = max(list_a[idx_a][0], list_b[idx_b][0])
+            upper = min(list_a[idx_a][1], list_b[idx_b][1])
+            if lower <= upper:
+                result.append((lower, upper))
+            if list_a[idx_a][1] < list_b[idx_b][1]:
+                idx_a += 1
+            else:
+                idx_b += 1
+        return VlanRangeSet(result)
+
+    def difference(self, other):
+        result = []
+        idx_b = 0
+        list_b = other._intervals
+        for lower, upper in self._intervals:
+            while idx_b < len(list_b) and list_b[idx_b][1] < lower:
+                idx_b += 1
+            idx = idx_b
+            while idx < len(list_b) and list_b[idx][0] <= upper:
+                if list_b[idx][0] > lower:
+                    result.append((lower, list_b[idx][0] - 1))
+                lower = max(lower, list_b[idx][1] + 1)
+                if lower > upper:
+                    break
+                idx += 1
+            if lower <= upper:
+                result.append((lower, upper))
+        return VlanRangeSet(result)
+
+    def issubset(self, other):
+        return not self.difference(other)
+
+    def isdisjoint(self, other):
+        return not self.intersection(other)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+    __le__ = issubset
+
+    def to_payload(self):
+        """Return the set as an openconfig-vlan 'trunk-vlans' list"""
+        return [lower if lower == upper else '%d..%d' % (lower, upper) for lower, upper in self._intervals]
+
+    def to_ranges(self, separator='-'):
+        """Return the set as a list of VLAN/range strings using separator"""
+        return [str(lower) if lower == upper else '%d%s%d' % (lower, separator, upper) for lower, upper in self._intervals]
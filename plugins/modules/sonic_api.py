@@ -92,6 +92,15 @@ response:
   returned: always
   type: list
   sample: {"response": [ 204,{""}]}
+pool_stats:
+  description:
+    - Keep-alive connection pool statistics per host, cumulative for the
+      persistent connection. Only returned when C(ansible_httpapi_sonic_keepalive) is enabled.
+  returned: when keep-alive is enabled
+  type: dict
+  sample: {"10.0.0.1:443": {"requests": 120, "connections_created": 2, "connections_reused": 118,
+           "connections_discarded": 0, "idle_connections": 2}}
+  version_added: 2.1.0
 msg:
   description: The HTTP error message from the request.
   returned: HTTP Error
@@ -102,7 +111,7 @@ from ansible.module_utils.connection import ConnectionError
 
 from ansible.module_utils._text import to_text
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import edit_config, to_request
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import edit_config, to_request, get_pool_stats
 
 
 def initiate_request(module):
@@ -151,6 +160,9 @@ def main():
     result.update({
         'response': response,
     })
+    pool_stats = get_pool_stats(module)
+    if pool_stats:
+        result['pool_stats'] = pool_stats
     module.exit_json(**result)
 
 
@@ -447,6 +447,14 @@ options:
       - overridden
       - deleted
     default: merged
+  chunk_size:
+    description:
+      - Maximum number of ACL rules created by a single request.
+      - Rules of an ACL are created in bulk, I(chunk_size) rules per request.
+      - Must be greater than zero.
+    type: int
+    default: 500
+    version_added: 2.1.0
 """
 EXAMPLES = """
 # Using merged
@@ -1006,14 +1014,20 @@ EXAMPLES = """
 """
 RETURN = """
 before:
-  description: The configuration prior to the model invocation.
+  description:
+    - The configuration prior to the model invocation.
+    - When I(config) names the ACLs and I(state) is not C(overridden), only
+      those ACLs are read from the device and returned.
   returned: always
   type: list
   sample: >
     The configuration returned will always be in the same format
      of the parameters above.
 after:
-  description: The resulting configuration model invocation.
+  description:
+    - The resulting configuration model invocation.
+    - When I(config) names the ACLs and I(state) is not C(overridden), only
+      those ACLs are read from the device and returned.
   returned: when changed
   type: list
   sample: >
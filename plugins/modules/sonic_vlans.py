@@ -67,6 +67,14 @@ options:
     - replaced
     - overridden
     default: merged
+  chunk_size:
+    description:
+    - Maximum number of VLANs created by a single request.
+    - VLANs and their descriptions are created in bulk, I(chunk_size) VLANs per request.
+    - Must be greater than zero.
+    type: int
+    default: 500
+    version_added: 2.1.0
 """
 EXAMPLES = """
 # Using merged
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 2024 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Benchmark of the import time of the resource config modules.
+
+Each config module imports the Facts class, which resolves the facts
+collectors of the resources on first use. For every resource, a fresh
+interpreter imports its config module and then its own facts collector,
+which is what a task of that resource pays at startup. The same
+interpreter then resolves all the collectors, which is what every task
+paid when the collectors were imported along with the Facts class.
+ansible.module_utils.basic is imported before timing starts, as every
+module imports it regardless of the collection.
+
+Usage (with the collection on PYTHONPATH):
+
+    python bench_facts_import.py                    # all the resources
+    python bench_facts_import.py --resources vlans  # selected resources
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+SONIC_PACKAGE = 'ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic'
+FACTS_PACKAGE = SONIC_PACKAGE + '.facts.'
+
+CHILD_SCRIPT = '''
+import json
+import sys
+import time
+from importlib import import_module
+
+import ansible.module_utils.basic
+
+resource = sys.argv[1]
+start = time.time()
+import_module('%(sonic)s.config.%%s.%%s' %% (resource, resource))
+from %(sonic)s.facts.facts import FACT_RESOURCE_SUBSETS
+FACT_RESOURCE_SUBSETS[resource]
+lazy = time.time()
+lazy_modules = sorted(name for name in sys.modules if name.startswith('%(facts)s'))
+for name in FACT_RESOURCE_SUBSETS:
+    FACT_RESOURCE_SUBSETS[name]
+eager = time.time()
+print(json.dumps({
+    'lazy_seconds': lazy - start,
+    'eager_seconds': eager - start,
+    'lazy_modules': lazy_modules,
+    'eager_modules': sum(1 for name in sys.modules if name.startswith('%(facts)s')),
+}))
+''' % {'sonic': SONIC_PACKAGE, 'facts': FACTS_PACKAGE}
+
+
+def measure(resource):
+    """Import the config module of resource in a fresh interpreter"""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(path for path in sys.path if path)
+    output = subprocess.check_output([sys.executable, '-c', CHILD_SCRIPT, resource], env=env)
+    result = json.loads(output.decode('utf-8'))
+    result['resource'] = resource
+    return result
+
+
+def all_resources():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import (
+        FACT_RESOURCE_SUBSETS,
+    )
+    return sorted(FACT_RESOURCE_SUBSETS)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--resources', nargs='+')
+    args = parser.parse_args(argv)
+
+    print('%-22s %10s %10s %8s %8s' % ('resource', 'lazy', 'eager', 'modules', 'saved'))
+    for resource in args.resources or all_resources():
+        result = measure(resource)
+        print('%-22s %9.4fs %9.4fs %3d/%-4d %7.1f%%' % (
+            resource, result['lazy_seconds'], result['eager_seconds'], len(result['lazy_modules']),
+            result['eager_modules'], 100.0 * (1 - result['lazy_seconds'] / result['eager_seconds'])))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
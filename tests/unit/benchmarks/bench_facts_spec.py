@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 2024 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Benchmark of the argspec handling of the facts classes.
+
+A resource task builds its facts class at least twice (before and after
+applying the config). The construction used to deepcopy the argspec and
+generate the facts tree from it, which is now done once per argspec by
+get_generated_spec. Both ways are timed for the selected resources.
+
+The rendered facts used to be validated by netcommon validate_config,
+which runs a whole AnsibleModule argument validation, and now are by
+normalize_config. Both are timed on the synthetic configs of bench_utils.
+
+Usage (with the collection on PYTHONPATH):
+
+    python bench_facts_spec.py                                  # bgp_neighbors and l3_acls
+    python bench_facts_spec.py --resources vlans --count 10000  # selected resources
+    python bench_facts_spec.py --sizes 1000 10000               # sizes of the validated configs
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import argparse
+import sys
+import time
+from copy import deepcopy
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
+    utils,
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import (
+    FACT_RESOURCE_SUBSETS,
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.spec_utils import (
+    normalize_config,
+)
+
+from bench_utils import SHAPES
+
+DEFAULT_RESOURCES = ('bgp_neighbors', 'l3_acls')
+DEFAULT_COUNT = 2000
+DEFAULT_SIZES = (1000, 10000)
+
+
+def build_legacy(facts_class):
+    """Build facts_class the way it was built before get_generated_spec"""
+    facts = facts_class(None)
+    spec = deepcopy(facts.argument_spec)
+    facts.generated_spec = utils.generate_dict(spec['config']['options'])
+    return facts
+
+
+def measure(resource, count):
+    facts_class = FACT_RESOURCE_SUBSETS[resource]
+    results = {}
+    for name, build in (('legacy', build_legacy), ('cached', facts_class)):
+        start = time.time()
+        for dummy in range(count):
+            build(facts_class)
+        results[name] = (time.time() - start) / count
+    return results
+
+
+def measure_normalize(resource, size):
+    generator = dict((shape, gen) for shape, gen, test_keys in SHAPES)[resource]
+    argument_spec = FACT_RESOURCE_SUBSETS[resource](None).argument_spec
+    data = {'config': generator(size)}
+    results = {}
+    for name, validate in (('validate_config', utils.validate_config), ('normalize_config', normalize_config)):
+        start = time.time()
+        validate(argument_spec, data)
+        results[name] = time.time() - start
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--resources', nargs='+', default=list(DEFAULT_RESOURCES))
+    parser.add_argument('--count', type=int, default=DEFAULT_COUNT)
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    args = parser.parse_args(argv)
+
+    print('%-22s %12s %12s' % ('resource', 'legacy', 'cached'))
+    for resource in args.resources:
+        results = measure(resource, args.count)
+        print('%-22s %10.1fus %10.1fus' % (resource, results['legacy'] * 1e6, results['cached'] * 1e6))
+
+    shapes = [shape for shape, gen, test_keys in SHAPES]
+    print('\n%-22s %8s %16s %16s' % ('resource', 'size', 'validate_config', 'normalize_config'))
+    for resource in args.resources:
+        if resource not in shapes:
+            continue
+        for size in args.sizes:
+            results = measure_normalize(resource, size)
+            print('%-22s %8d %15.3fs %15.3fs' % (resource, size, results['validate_config'], results['normalize_config']))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
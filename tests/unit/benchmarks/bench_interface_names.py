@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 2024 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Benchmark of the interface name normalization in module_utils utils.
+
+The resource modules normalize the name of every 'want' entry, and often
+the names of their 'have' entries and of nested lists too. The names
+were normalized with uncompiled patterns and validated against the
+device naming mode each time, and now are normalized once per module
+with precompiled patterns. Both ways are timed on synthetic names, along
+with update_url on request paths holding them.
+
+Usage (with the collection on PYTHONPATH):
+
+    python bench_interface_names.py                 # 10000 names, 3 passes
+    python bench_interface_names.py --count 50000   # number of names
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import argparse
+import random
+import re
+import sys
+import time
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic import sonic
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils import utils
+
+DEFAULT_COUNT = 10000
+DEFAULT_PASSES = 3
+
+NAME_FORMATS = (
+    'Eth1/%d', 'eth 1/%d', 'Eth1/%d/1', 'Eth 1/%d', 'PortChannel%d', 'po%d',
+    'Vlan%d', 'vlan %d', 'Loopback%d', 'lo%d',
+)
+
+
+class BenchModule:
+    """Stand-in for AnsibleModule on a device in standard naming mode"""
+
+    def fail_json(self, msg, **kwargs):
+        raise ValueError(msg)
+
+
+def gen_names(count, seed=0):
+    rnd = random.Random(seed)
+    return [rnd.choice(NAME_FORMATS) % rnd.randint(1, count // 4 + 1) for dummy in range(count)]
+
+
+def legacy_normalize_interface_name(intf_name, module):
+    """get_normalize_interface_name as it was before the name cache"""
+    change_flag = False
+    ret_intf_name = re.sub(r"\s+", "", intf_name, flags=re.UNICODE)
+    ret_intf_name = ret_intf_name.capitalize()
+
+    match = re.search(r"\d", ret_intf_name)
+    if match:
+        change_flag = True
+        start_pos = match.start()
+        name = ret_intf_name[0:start_pos]
+        intf_id = ret_intf_name[start_pos:]
+
+        if name.startswith("Eth"):
+            utils.validate_intf_naming_mode(intf_name, module)
+
+        if ret_intf_name.startswith("Management") or ret_intf_name.startswith("Mgmt"):
+            name = "eth"
+            intf_id = "0"
+        elif re.search(utils.STANDARD_ETH_REGEXP, ret_intf_name):
+            name = "Eth"
+        elif re.search(utils.NATIVE_ETH_REGEXP, ret_intf_name):
+            name = "Ethernet"
+        elif name.startswith("Po"):
+            name = "PortChannel"
+        elif name.startswith("Vlan"):
+            name = "Vlan"
+        elif name.startswith("Lo"):
+            name = "Loopback"
+        else:
+            change_flag = False
+
+        ret_intf_name = name + intf_id
+
+    if not change_flag:
+        ret_intf_name = intf_name
+
+    return ret_intf_name
+
+
+def legacy_update_url(url):
+    """update_url as it was before the plain substring check"""
+    match = re.search(sonic.STANDARD_ETH_REGEXP, url)
+    ret_url = url
+    if match:
+        interface_name = match.group()
+        interface_name = interface_name.replace("/", "%2f")
+        ret_url = sonic.PATTERN.sub(interface_name, url)
+    return ret_url
+
+
+def measure(names, passes):
+    """Normalize names passes times in one module, the legacy and the cached way"""
+    # The naming mode is fetched from the device once per module run
+    utils.intf_naming_mode = utils.STANDARD_MODE
+    results = {}
+    for name, normalize in (('legacy', legacy_normalize_interface_name), ('cached', utils.get_normalize_interface_name)):
+        module = BenchModule()
+        start = time.time()
+        for dummy in range(passes):
+            for intf_name in names:
+                normalize(intf_name, module)
+        results[name] = time.time() - start
+    return results
+
+
+def measure_update_url(names):
+    urls = ['data/openconfig-interfaces:interfaces/interface=%s/config' % name for name in names]
+    urls.extend('data/openconfig-network-instance:network-instances/network-instance=Vrf%d' % index for index in range(len(names)))
+    results = {}
+    for name, update in (('legacy', legacy_update_url), ('current', sonic.update_url)):
+        start = time.time()
+        for url in urls:
+            update(url)
+        results[name] = time.time() - start
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=DEFAULT_COUNT)
+    parser.add_argument('--passes', type=int, default=DEFAULT_PASSES)
+    args = parser.parse_args(argv)
+
+    names = gen_names(args.count)
+    results = measure(names, args.passes)
+    print('%-22s %8s %6s %10s %10s' % ('normalize', 'names', 'passes', 'legacy', 'cached'))
+    print('%-22s %8d %6d %9.4fs %9.4fs' % ('', args.count, args.passes, results['legacy'], results['cached']))
+
+    results = measure_update_url(names)
+    print('\n%-22s %8s %17s %10s' % ('update_url', 'urls', 'legacy', 'current'))
+    print('%-22s %8d %16.4fs %9.4fs' % ('', 2 * args.count, results['legacy'], results['current']))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,338 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 2024 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Benchmarks for the config comparison helpers in module_utils utils.
+
+Synthetic configs shaped like the l3_acls, vlans, bgp_neighbors and
+l2_interfaces argspecs are generated at the requested sizes and fed to
+get_diff, get_replaced_config, remove_empties_from_list, dict_to_set and
+update_states. Wall time and peak traced memory are reported for each
+combination and can be checked against thresholds.json.
+
+Usage (with the collection on PYTHONPATH):
+
+    python bench_utils.py                      # 1000, 10000 and 50000 elements
+    python bench_utils.py --sizes 1000 --check # fail on threshold regressions
+"""
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import argparse
+import copy
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    dict_to_set,
+    get_diff,
+    get_replaced_config,
+    remove_empties_from_list,
+    update_states,
+)
+
+DEFAULT_SIZES = (1000, 10000, 50000)
+THRESHOLDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'thresholds.json')
+
+# Fraction of 'want' elements that differ from 'have', and the fraction of
+# 'have' elements that are absent from 'want'.
+CHANGED_RATIO = 0.1
+EXTRA_RATIO = 0.05
+
+L3_ACLS_TEST_KEYS = [
+    {'config': {'address_family': ''}},
+    {'acls': {'name': ''}},
+    {'rules': {'sequence_num': ''}},
+]
+VLANS_TEST_KEYS = [
+    {'config': {'vlan_id': ''}},
+]
+BGP_NEIGHBORS_TEST_KEYS = [
+    {'config': {'vrf_name': '', 'bgp_as': ''}},
+    {'neighbors': {'neighbor': ''}},
+    {'peer_group': {'name': ''}},
+    {'afis': {'afi': '', 'safi': ''}},
+]
+L2_INTERFACES_TEST_KEYS = [
+    {'config': {'name': ''}},
+    {'allowed_vlans': {'vlan': ''}},
+]
+
+# Floors and default headroom used by --write-thresholds, so that very
+# fast benchmarks and slower CI runners do not produce spurious failures.
+MIN_SECONDS = 0.05
+MIN_PEAK_KB = 256
+TIME_FACTOR = 10
+MEMORY_FACTOR = 2
+
+RULES_PER_ACL = 100
+NEIGHBORS_PER_VRF = 500
+
+
+def gen_l3_acl_rule(seq, variant):
+    return {
+        'sequence_num': seq,
+        'action': 'permit' if variant % 2 else 'deny',
+        'protocol': {'name': 'tcp'},
+        'source': {'prefix': '10.%d.%d.0/24' % ((seq >> 8) & 255, seq & 255)},
+        'destination': {'any': True, 'port_number': {'eq': 1000 + variant}},
+        'remark': None,
+    }
+
+
+def gen_l3_acls(size, variant=0, start=0):
+    """Return an l3_acls config holding 'size' rules spread over ACLs."""
+    acls = []
+    first = start // RULES_PER_ACL
+    for acl_idx in range((size + RULES_PER_ACL - 1) // RULES_PER_ACL):
+        count = min(RULES_PER_ACL, size - acl_idx * RULES_PER_ACL)
+        rules = [gen_l3_acl_rule(seq * 10, variant) for seq in range(1, count + 1)]
+        name = 'acl%d' % (first + acl_idx)
+        acls.append({'name': name, 'remark': name, 'rules': rules})
+    return [{'address_family': 'ipv4', 'acls': acls}]
+
+
+def gen_vlans(size, variant=0, start=0):
+    """Return a vlans config holding 'size' VLANs."""
+    return [{'vlan_id': vlan_id, 'description': 'vlan-%d-%d' % (vlan_id, variant)}
+            for vlan_id in range(start + 1, start + size + 1)]
+
+
+def gen_bgp_neighbor(idx, variant):
+    return {
+        'neighbor': '10.%d.%d.%d' % ((idx >> 16) & 255, (idx >> 8) & 255, idx & 255),
+        'remote_as': {'peer_as': 65000 + variant},
+        'peer_group': 'pg%d' % (idx % 4),
+        'advertisement_interval': 30,
+        'timers': {'keepalive': 60, 'holdtime': 180},
+        'bfd': {'enabled': bool(variant % 2)},
+    }
+
+
+def gen_bgp_neighbors(size, variant=0, start=0):
+    """Return a bgp_neighbors config holding 'size' neighbors spread over VRFs."""
+    config = []
+    first = start // NEIGHBORS_PER_VRF
+    for vrf_idx in range((size + NEIGHBORS_PER_VRF - 1) // NEIGHBORS_PER_VRF):
+        count = min(NEIGHBORS_PER_VRF, size - vrf_idx * NEIGHBORS_PER_VRF)
+        base = (first + vrf_idx) * NEIGHBORS_PER_VRF
+        config.append({
+            'bgp_as': 65100,
+            'vrf_name': 'default' if first + vrf_idx == 0 else 'Vrf%d' % (first + vrf_idx),
+            'neighbors': [gen_bgp_neighbor(base + idx, variant) for idx in range(count)],
+            'peer_group': [{'name': 'pg%d' % idx, 'remote_as': {'peer_type': 'external'}} for idx in range(4)],
+        })
+    return config
+
+
+def gen_l2_interfaces(size, variant=0, start=0):
+    """Return an l2_interfaces config holding 'size' interfaces."""
+    config = []
+    for idx in range(start, start + size):
+        entry = {'name': 'Eth1/%d' % (idx + 1)}
+        if idx % 2:
+            entry['access'] = {'vlan': 10 + variant}
+        else:
+            entry['trunk'] = {'allowed_vlans': [{'vlan': '%d' % (100 + vlan + variant)} for vlan in range(4)]}
+        config.append(entry)
+    return config
+
+
+def iter_leaf_lists(config):
+    """Yield the innermost element lists of a generated config."""
+    for entry in config:
+        if 'acls' in entry:
+            for acl in entry['acls']:
+                yield acl['rules']
+        elif 'neighbors' in entry:
+            yield entry['neighbors']
+        else:
+            yield config
+            return
+
+
+def gen_have(generator, size, seed):
+    """Return a 'have' config for generator(size) in a repeatable way.
+
+    CHANGED_RATIO of the leaf elements differ from 'want' and about
+    EXTRA_RATIO more elements are only present in 'have'.
+    """
+    rnd = random.Random(seed)
+    have = generator(size)
+    changed = generator(size, variant=1)
+    for have_list, changed_list in zip(iter_leaf_lists(have), iter_leaf_lists(changed)):
+        for idx in range(len(have_list)):
+            if rnd.random() < CHANGED_RATIO:
+                have_list[idx] = changed_list[idx]
+    extra = generator(max(int(size * EXTRA_RATIO), 1), variant=2, start=size)
+    if 'acls' in have[0]:
+        have[0]['acls'].extend(extra[0]['acls'])
+    else:
+        have.extend(extra)
+    return have
+
+
+SHAPES = [
+    ('l3_acls', gen_l3_acls, L3_ACLS_TEST_KEYS),
+    ('vlans', gen_vlans, VLANS_TEST_KEYS),
+    ('bgp_neighbors', gen_bgp_neighbors, BGP_NEIGHBORS_TEST_KEYS),
+    ('l2_interfaces', gen_l2_interfaces, L2_INTERFACES_TEST_KEYS),
+]
+
+
+def bench_get_diff(want, have, test_keys):
+    return lambda: get_diff(want, have, copy.deepcopy(test_keys))
+
+
+def bench_get_replaced_config(want, have, test_keys):
+    return lambda: get_replaced_config(want, have, copy.deepcopy(test_keys))
+
+
+def bench_remove_empties_from_list(want, have, test_keys):
+    return lambda: remove_empties_from_list(want)
+
+
+def flatten_item(item):
+    """Keep only the nesting dict_to_set can hash: scalars below the first level."""
+    flat = {}
+    for key, value in item.items():
+        if isinstance(value, dict):
+            value = dict((k, v) for k, v in value.items() if not isinstance(v, (dict, list)))
+        flat[key] = value
+    return flat
+
+
+def bench_dict_to_set(want, have, test_keys):
+    # dict_to_set rewrites nested lists in place, so work on private copies
+    # of the leaf elements.
+    items = [flatten_item(item) for leaf_list in iter_leaf_lists(copy.deepcopy(want)) for item in leaf_list]
+    return lambda: [dict_to_set(item) for item in items]
+
+
+def bench_update_states(want, have, test_keys):
+    return lambda: update_states(want, 'merged')
+
+
+FUNCTIONS = [
+    ('get_diff', bench_get_diff),
+    ('get_replaced_config', bench_get_replaced_config),
+    ('remove_empties_from_list', bench_remove_empties_from_list),
+    ('dict_to_set', bench_dict_to_set),
+    ('update_states', bench_update_states),
+]
+
+
+def measure(func):
+    """Return (seconds, peak traced KiB) for func.
+
+    Tracing slows Python code down considerably, so the time is taken from
+    a separate untraced run.
+    """
+    gc.collect()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak // 1024
+
+
+def run(sizes, shapes=None, functions=None):
+    """Return a list of result dicts for every size/shape/function."""
+    results = []
+    for size in sizes:
+        for shape, generator, test_keys in SHAPES:
+            if shapes and shape not in shapes:
+                continue
+            want = generator(size)
+            have = gen_have(generator, size, seed=size)
+            for name, factory in FUNCTIONS:
+                if functions and name not in functions:
+                    continue
+                seconds, peak_kb = measure(factory(want, have, test_keys))
+                results.append({
+                    'id': '%s/%s/%d' % (name, shape, size),
+                    'seconds': seconds,
+                    'peak_kb': peak_kb,
+                })
+    return results
+
+
+def load_thresholds(path=THRESHOLDS_FILE):
+    with open(path) as fp:
+        return json.load(fp)
+
+
+def make_thresholds(results, time_factor, memory_factor):
+    """Return thresholds allowing the given headroom over results."""
+    thresholds = {}
+    for result in results:
+        thresholds[result['id']] = {
+            'seconds': round(max(result['seconds'] * time_factor, MIN_SECONDS), 3),
+            'peak_kb': int(max(result['peak_kb'] * memory_factor, MIN_PEAK_KB)),
+        }
+    return thresholds
+
+
+def check(results, thresholds):
+    """Return the list of messages for results exceeding their thresholds."""
+    failures = []
+    for result in results:
+        limit = thresholds.get(result['id'])
+        if not limit:
+            continue
+        if result['seconds'] > limit['seconds']:
+            failures.append('%s took %.3fs, threshold %.3fs' % (result['id'], result['seconds'], limit['seconds']))
+        if result['peak_kb'] > limit['peak_kb']:
+            failures.append('%s peaked at %d KiB, threshold %d KiB' % (result['id'], result['peak_kb'], limit['peak_kb']))
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--shapes', nargs='+', choices=[shape[0] for shape in SHAPES])
+    parser.add_argument('--functions', nargs='+', choices=[func[0] for func in FUNCTIONS])
+    parser.add_argument('--check', action='store_true', help='exit non-zero when a threshold is exceeded')
+    parser.add_argument('--thresholds', default=THRESHOLDS_FILE)
+    parser.add_argument('--write-thresholds', action='store_true',
+                        help='rewrite the thresholds file from this run, with headroom')
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.shapes, args.functions)
+    for result in results:
+        print('%-50s %10.4fs %10d KiB' % (result['id'], result['seconds'], result['peak_kb']))
+
+    if args.write_thresholds:
+        thresholds = {}
+        if os.path.exists(args.thresholds):
+            thresholds = load_thresholds(args.thresholds)
+        thresholds.update(make_thresholds(results, TIME_FACTOR, MEMORY_FACTOR))
+        with open(args.thresholds, 'w') as fp:
+            json.dump(thresholds, fp, indent=2, sort_keys=True)
+            fp.write('\n')
+
+    if args.check:
+        failures = check(results, load_thresholds(args.thresholds))
+        for failure in failures:
+            print('REGRESSION: %s' % failure)
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,21 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import unittest
+
+import sys
+sys.path.append('/root/.ansible/collections')
+
+from .bench_facts_import import (
+    FACTS_PACKAGE,
+    measure,
+)
+
+
+class TestBenchFactsImport(unittest.TestCase):
+
+    def test_01_only_own_collector_is_imported(self):
+        result = measure('vlans')
+        self.assertEqual(result['lazy_modules'], [FACTS_PACKAGE + 'facts', FACTS_PACKAGE + 'vlans', FACTS_PACKAGE + 'vlans.vlans'])
+        self.assertGreater(result['eager_modules'], len(result['lazy_modules']))
@@ -0,0 +1,60 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import unittest
+
+import sys
+sys.path.append('/root/.ansible/collections')
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic import sonic
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils import utils
+
+from .bench_interface_names import (
+    BenchModule,
+    gen_names,
+    legacy_normalize_interface_name,
+    legacy_update_url,
+)
+
+EXTRA_NAMES = [
+    'Management0', 'mgmt 0', 'Ethernet0', 'eth0', 'Eth1/1/1', 'PortChannel 10', 'Vlan', 'Vrf1', 'vxlan1',
+    'default', '', 'lo 1', 'Loopback 20',
+]
+
+
+class TestInterfaceNames(unittest.TestCase):
+
+    def setUp(self):
+        self.saved_mode = utils.intf_naming_mode
+        utils.intf_naming_mode = utils.STANDARD_MODE
+
+    def tearDown(self):
+        utils.intf_naming_mode = self.saved_mode
+
+    def test_01_matches_legacy(self):
+        module = BenchModule()
+        for intf_name in gen_names(2000, seed=25) + EXTRA_NAMES:
+            try:
+                expected = legacy_normalize_interface_name(intf_name, BenchModule())
+            except ValueError:
+                with self.assertRaises(ValueError, msg=intf_name):
+                    utils.get_normalize_interface_name(intf_name, module)
+                continue
+            self.assertEqual(utils.get_normalize_interface_name(intf_name, module), expected, intf_name)
+            self.assertEqual(utils.get_normalize_interface_name(intf_name, module), expected, intf_name)
+
+    def test_02_cached_per_module(self):
+        module = BenchModule()
+        self.assertEqual(utils.get_normalize_interface_name('eth 1/2', module), 'Eth1/2')
+        self.assertEqual(module._sonic_intf_names, {'eth 1/2': 'Eth1/2'})
+        utils.intf_naming_mode = utils.NATIVE_MODE
+        self.assertEqual(utils.get_normalize_interface_name('eth 1/2', module), 'Eth1/2')
+        with self.assertRaises(ValueError):
+            utils.get_normalize_interface_name('eth 1/2', BenchModule())
+        self.assertEqual(utils.get_normalize_interface_name('po 1', None), 'PortChannel1')
+
+    def test_03_update_url_matches_legacy(self):
+        for intf_name in gen_names(200, seed=25) + EXTRA_NAMES:
+            url = 'data/openconfig-interfaces:interfaces/interface=%s/config' % intf_name
+            self.assertEqual(sonic.update_url(url), legacy_update_url(url), url)
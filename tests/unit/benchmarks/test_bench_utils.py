@@ -0,0 +1,54 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import copy
+import unittest
+
+import sys
+sys.path.append('/root/.ansible/collections')
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils import utils
+from .bench_utils import (
+    SHAPES,
+    gen_have,
+    iter_leaf_lists,
+)
+
+# Only the smallest size runs as part of the unit tests; larger sizes are
+# available through the standalone runner, which also checks the
+# timings against thresholds.json (--check).
+CI_SIZE = 1000
+# The legacy engines are quadratic, compare them on smaller configs
+LEGACY_SIZE = 200
+
+
+class TestBenchUtils(unittest.TestCase):
+
+    def test_01_generators_produce_requested_size(self):
+        for shape, generator, test_keys in SHAPES:
+            config = generator(CI_SIZE)
+            count = sum(len(leaf_list) for leaf_list in iter_leaf_lists(config))
+            self.assertEqual(count, CI_SIZE, shape)
+
+    def test_02_have_differs_from_want(self):
+        for shape, generator, test_keys in SHAPES:
+            want = generator(CI_SIZE)
+            have = gen_have(generator, CI_SIZE, seed=CI_SIZE)
+            self.assertNotEqual(want, have, shape)
+            self.assertEqual(have, gen_have(generator, CI_SIZE, seed=CI_SIZE), shape)
+
+    def test_03_matches_legacy(self):
+        try:
+            for shape, generator, test_keys in SHAPES:
+                want = generator(LEGACY_SIZE)
+                have = gen_have(generator, LEGACY_SIZE, seed=LEGACY_SIZE)
+                for flag, function in (('use_legacy_diff', utils.get_diff), ('use_legacy_replaced', utils.get_replaced_config)):
+                    results = []
+                    for legacy in (True, False):
+                        setattr(utils, flag, legacy)
+                        results.append(function(copy.deepcopy(want), copy.deepcopy(have), copy.deepcopy(test_keys)))
+                    self.assertEqual(results[0], results[1], (shape, function.__name__))
+        finally:
+            utils.use_legacy_diff = False
+            utils.use_legacy_replaced = False
@@ -10,6 +10,10 @@ from ansible_collections.dellemc.enterprise_sonic.tests.unit.modules.utils impor
     ModuleTestCase,
 )
 
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import (
+    patch,
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic import sonic
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     update_url
 )
@@ -73,7 +77,7 @@ class TestSonicModule(ModuleTestCase):
                 {'code': response.get('code', 200), 'value': response.get('value', {})}
             ])
 
-    def facts_side_effect(self, module, commands):
+    def facts_side_effect(self, module, commands, **kwargs):
         """Side effect function for 'facts' GET requests mock"""
         responses = []
         for command in commands:
@@ -92,7 +96,7 @@ class TestSonicModule(ModuleTestCase):
 
         return responses
 
-    def config_side_effect(self, module, commands):
+    def config_side_effect(self, module, commands, **kwargs):
         """Side effect function for 'config' requests mock"""
         responses = []
         for command in commands:
@@ -113,6 +117,14 @@ class TestSonicModule(ModuleTestCase):
 
         return responses
 
+    def coalescing_config_side_effect(self, module, commands, **kwargs):
+        """Side effect function for 'config' requests mock, which sends
+        the requests through edit_config and its request coalescing
+        """
+        with patch.object(sonic, 'get_connection') as get_connection:
+            get_connection.return_value.edit_config.side_effect = lambda requests: self.config_side_effect(module, requests)
+            return sonic.edit_config(module, commands, **kwargs)
+
     def execute_module(self, failed=False, changed=False):
         if failed:
             result = self.failed()
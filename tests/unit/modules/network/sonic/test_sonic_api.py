@@ -22,17 +22,32 @@ class TestSonicInterfacesModule(TestSonicModule):
         cls.mock_edit_config = patch(
             "ansible_collections.dellemc.enterprise_sonic.plugins.modules.sonic_api.edit_config"
         )
+        cls.mock_get_pool_stats = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.modules.sonic_api.get_pool_stats"
+        )
         cls.fixture_data = cls.load_fixtures('sonic_api.yaml')
 
     def setUp(self):
         super(TestSonicInterfacesModule, self).setUp()
         self.edit_config = self.mock_edit_config.start()
         self.edit_config.return_value = [(204, '')]
+        self.get_pool_stats = self.mock_get_pool_stats.start()
+        self.get_pool_stats.return_value = {}
 
     def tearDown(self):
         super(TestSonicInterfacesModule, self).tearDown()
         self.mock_edit_config.stop()
+        self.mock_get_pool_stats.stop()
 
     def test_sonic_api_merged_01(self):
         set_module_args(self.fixture_data['merged_01']['module_args'])
         result = self.execute_module(changed=True)
+        self.assertNotIn('pool_stats', result)
+
+    def test_sonic_api_pool_stats(self):
+        pool_stats = {'10.0.0.1:443': {'requests': 2, 'connections_created': 1, 'connections_reused': 1,
+                                       'connections_discarded': 0, 'idle_connections': 1}}
+        self.get_pool_stats.return_value = pool_stats
+        set_module_args(self.fixture_data['merged_01']['module_args'])
+        result = self.execute_module(changed=True)
+        self.assertEqual(result['pool_stats'], pool_stats)
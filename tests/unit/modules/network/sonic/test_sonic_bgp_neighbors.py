@@ -51,6 +51,9 @@ class TestSonicBgpModule(TestSonicModule):
         self.initialize_config_requests(self.fixture_data['merged_01']['expected_config_requests'])
         result = self.execute_module(changed=True)
         self.validate_config_requests()
+        # VRF list, then one batch each for the AS numbers, neighbors and
+        # peer groups of all the VRFs, before and after the change
+        self.assertEqual(self.utils_edit_config.call_count, 8)
 
     # Merge test when neighbor and peer-group are already present in existing config
     def test_sonic_bgp_neighbors_merged_02(self):
@@ -25,6 +25,9 @@ class TestSonicInterfacesModule(TestSonicModule):
         cls.mock_config_edit_config = patch(
             "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.interfaces.interfaces.edit_config"
         )
+        cls.mock_utils_edit_config = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils.edit_config"
+        )
         cls.mock_get_interface_naming_mode = patch(
             "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils.get_device_interface_naming_mode"
         )
@@ -37,6 +40,8 @@ class TestSonicInterfacesModule(TestSonicModule):
 
         self.facts_edit_config.side_effect = self.facts_side_effect
         self.config_edit_config.side_effect = self.config_side_effect
+        self.utils_edit_config = self.mock_utils_edit_config.start()
+        self.utils_edit_config.side_effect = self.facts_side_effect
 
         self.get_interface_naming_mode = self.mock_get_interface_naming_mode.start()
         self.get_interface_naming_mode.return_value = 'standard'
@@ -45,6 +50,7 @@ class TestSonicInterfacesModule(TestSonicModule):
         super(TestSonicInterfacesModule, self).tearDown()
         self.mock_facts_edit_config.stop()
         self.mock_config_edit_config.stop()
+        self.mock_utils_edit_config.stop()
         self.mock_get_interface_naming_mode.stop()
 
     def test_sonic_interfaces_merged_01(self):
@@ -74,3 +80,29 @@ class TestSonicInterfacesModule(TestSonicModule):
         self.initialize_config_requests(self.fixture_data['overridden_01']['expected_config_requests'])
         result = self.execute_module(changed=True)
         self.validate_config_requests()
+
+    def test_sonic_interfaces_deleted_02_default_speed(self):
+        set_module_args(self.fixture_data['deleted_02_default_speed']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['deleted_02_default_speed']['existing_interfaces_config'])
+        self.initialize_config_requests(self.fixture_data['deleted_02_default_speed']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+    def test_sonic_interfaces_deleted_03_coalescing(self):
+        # The fec, autoneg and speed requests are applied in order, they must not be merged
+        self.config_edit_config.side_effect = self.coalescing_config_side_effect
+        set_module_args(self.fixture_data['deleted_02_default_speed']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['deleted_02_default_speed']['existing_interfaces_config'])
+        self.initialize_config_requests(self.fixture_data['deleted_02_default_speed']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+    def test_sonic_interfaces_deleted_04_bracketed_breakout(self):
+        # The 40G speed is the default of the 1x40G mode the platform runs
+        # for '1x100G[40G]', so the speed is not deleted
+        set_module_args(self.fixture_data['deleted_04_bracketed_breakout']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['deleted_04_bracketed_breakout']['existing_interfaces_config'])
+        self.initialize_config_requests(self.fixture_data['deleted_04_bracketed_breakout']['expected_config_requests'])
+        result = self.execute_module(changed=False)
+        self.validate_config_requests()
+        self.assertEqual(self.utils_edit_config.call_count, 1)
@@ -0,0 +1,96 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import (
+    patch,
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.modules import (
+    sonic_l2_acls,
+)
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.modules.utils import (
+    set_module_args,
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_acls.l2_acls import L2_aclsFacts
+from .sonic_module import TestSonicModule
+
+
+class FactsModule(object):
+    pass
+
+
+class TestSonicL2AclsModule(TestSonicModule):
+    module = sonic_l2_acls
+
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_facts_edit_config = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.acl_utils.edit_config"
+        )
+        cls.mock_config_edit_config = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.l2_acls.l2_acls.edit_config"
+        )
+        cls.fixture_data = cls.load_fixtures('sonic_l2_acls.yaml')
+
+    def setUp(self):
+        super(TestSonicL2AclsModule, self).setUp()
+        self.facts_edit_config = self.mock_facts_edit_config.start()
+        self.config_edit_config = self.mock_config_edit_config.start()
+        self.facts_edit_config.side_effect = self.facts_side_effect
+        self.config_edit_config.side_effect = self.config_side_effect
+
+    def tearDown(self):
+        super(TestSonicL2AclsModule, self).tearDown()
+        self.mock_facts_edit_config.stop()
+        self.mock_config_edit_config.stop()
+
+    def test_sonic_l2_acls_merged_01(self):
+        set_module_args(self.fixture_data['merged_01']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_01']['existing_l2_acls_config'])
+        self.initialize_config_requests(self.fixture_data['merged_01']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+    def test_sonic_l2_acls_replaced_01(self):
+        set_module_args(self.fixture_data['replaced_01']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['replaced_01']['existing_l2_acls_config'])
+        self.initialize_config_requests(self.fixture_data['replaced_01']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+    def test_sonic_l2_acls_deleted_01(self):
+        set_module_args(self.fixture_data['deleted_01']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['deleted_01']['existing_l2_acls_config'])
+        self.initialize_config_requests(self.fixture_data['deleted_01']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+    def test_sonic_l2_acls_overridden_01(self):
+        set_module_args(self.fixture_data['overridden_01']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['overridden_01']['existing_l2_acls_config'])
+        self.initialize_config_requests(self.fixture_data['overridden_01']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+    def test_sonic_l2_acls_merged_02_invalid_chunk_size(self):
+        set_module_args(self.fixture_data['merged_02_invalid_chunk_size']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_02_invalid_chunk_size']['existing_l2_acls_config'])
+        self.initialize_config_requests(self.fixture_data['merged_02_invalid_chunk_size']['expected_config_requests'])
+        result = self.execute_module(failed=True)
+        self.assertEqual(result['msg'], 'chunk_size must be greater than zero, got -1')
+        self.assertEqual(self.config_edit_config.call_count, 0)
+
+    def test_sonic_l2_acls_before_matches_facts(self):
+        fixture = self.fixture_data['replaced_01']
+        set_module_args(fixture['module_args'])
+        self.initialize_facts_get_requests(fixture['existing_l2_acls_config'])
+        self.initialize_config_requests(fixture['expected_config_requests'])
+        result = self.execute_module(changed=True)
+
+        module = FactsModule()
+        module._sonic_l2_acl_targets = [acl['name'] for acl in fixture['module_args']['config']]
+        with patch('ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.acl_utils.to_request',
+                   side_effect=lambda module, requests: requests):
+            facts = L2_aclsFacts(module).populate_facts(None, {'ansible_network_resources': {}})
+        self.assertTrue(result['before'])
+        self.assertEqual(result['before'], facts['ansible_network_resources']['l2_acls'])
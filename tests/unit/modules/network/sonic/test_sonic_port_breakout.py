@@ -66,6 +66,8 @@ class TestSonicInterfacesModule(TestSonicModule):
         self.initialize_config_requests(self.fixture_data['deleted_01']['expected_config_requests'])
         result = self.execute_module(changed=True)
         self.validate_config_requests()
+        # The mode is given by BREAKOUT_CFG_LIST, no platform component is read
+        self.assertEqual(self.utils_edit_config.call_count, 0)
 
     def test_sonic_port_breakout_deleted_02(self):
         set_module_args(self.fixture_data['deleted_02']['module_args'])
@@ -73,3 +75,13 @@ class TestSonicInterfacesModule(TestSonicModule):
         self.initialize_config_requests(self.fixture_data['deleted_02']['expected_config_requests'])
         result = self.execute_module(changed=True)
         self.validate_config_requests()
+
+    def test_sonic_port_breakout_deleted_03_component_modes(self):
+        set_module_args(self.fixture_data['deleted_03_component_modes']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['deleted_03_component_modes']['existing_port_breakout_config'])
+        self.initialize_config_requests(self.fixture_data['deleted_03_component_modes']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+        # The platform component is only read for the bracketed value
+        self.assertEqual(result['before'], [{'name': '1/10', 'mode': '1x40G'}, {'name': '1/11', 'mode': '4x25G'}])
+        self.assertEqual(self.utils_edit_config.call_count, 2)
@@ -71,3 +71,11 @@ class TestSonicInterfacesModule(TestSonicModule):
         self.initialize_config_requests(self.fixture_data['deleted_02']['expected_config_requests'])
         result = self.execute_module(changed=True)
         self.validate_config_requests()
+
+    def test_sonic_static_routes_merged_02_coalescing(self):
+        self.config_edit_config.side_effect = self.coalescing_config_side_effect
+        set_module_args(self.fixture_data['merged_02_coalescing']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_02_coalescing']['existing_static_routes_config'])
+        self.initialize_config_requests(self.fixture_data['merged_02_coalescing']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
@@ -92,3 +92,27 @@ class TestSonicInterfacesModule(TestSonicModule):
         self.initialize_config_requests(self.fixture_data['overridden_01']['expected_config_requests'])
         result = self.execute_module(changed=True)
         self.validate_config_requests()
+
+    def test_sonic_vlans_merged_03_chunked(self):
+        set_module_args(self.fixture_data['merged_03_chunked']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_03_chunked']['existing_vlans_config'])
+        self.initialize_config_requests(self.fixture_data['merged_03_chunked']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+    def test_sonic_vlans_merged_04_no_change(self):
+        set_module_args(self.fixture_data['merged_04_no_change']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_04_no_change']['existing_vlans_config'])
+        self.initialize_config_requests(self.fixture_data['merged_04_no_change']['expected_config_requests'])
+        result = self.execute_module(changed=False)
+        self.validate_config_requests()
+        # The facts are not read again when nothing changed
+        self.assertEqual(self.facts_edit_config.call_count, 1)
+
+    def test_sonic_vlans_merged_05_invalid_chunk_size(self):
+        set_module_args(self.fixture_data['merged_05_invalid_chunk_size']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_05_invalid_chunk_size']['existing_vlans_config'])
+        self.initialize_config_requests(self.fixture_data['merged_05_invalid_chunk_size']['expected_config_requests'])
+        result = self.execute_module(failed=True)
+        self.assertEqual(result['msg'], 'chunk_size must be greater than zero, got 0')
+        self.assertEqual(self.config_edit_config.call_count, 0)
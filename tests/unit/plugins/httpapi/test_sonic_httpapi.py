@@ -0,0 +1,180 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import socket
+import threading
+import unittest
+
+import sys
+sys.path.append('/root/.ansible/collections')
+
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import patch
+from ansible_collections.dellemc.enterprise_sonic.plugins.httpapi.sonic import (
+    ConnectionPool,
+    HttpApi,
+)
+
+HTTPAPI_MODULE = 'ansible_collections.dellemc.enterprise_sonic.plugins.httpapi.sonic'
+
+
+class FakeSocket(object):
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakePool(ConnectionPool):
+    """ConnectionPool whose reused sockets fail as if closed by the device"""
+
+    def __init__(self):
+        super(FakePool, self).__init__('sonic', 443)
+        self.sent = []
+
+    def _new_connection(self):
+        self._count('connections_created')
+        return FakeSocket(failures=0), 0
+
+    @staticmethod
+    def _send(conn, method, path, body, headers):
+        if conn.failures:
+            raise socket.error('connection reset')
+        return 200, 'OK', {}, b''
+
+    def add_stale(self):
+        self._idle.append((FakeSocket(failures=1), 1, 1e12))
+
+
+class FakeConnection(object):
+
+    def __init__(self, options):
+        self.options = options
+        self.connected = True
+        self._auth = {'Authorization': 'Basic old'}
+        self._url = 'https://sonic'
+        self.logged = []
+
+    def get_option(self, name):
+        return self.options.get(name)
+
+    def _log_messages(self, message):
+        self.logged.append(message)
+
+
+class FakeResponsePool(object):
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.headers = []
+
+    def urlopen(self, method, path, body, headers):
+        self.headers.append(headers)
+        return self.responses.pop(0)
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def test_01_stale_socket_retried_for_idempotent_methods(self):
+        pool = FakePool()
+        pool.add_stale()
+        self.assertEqual(pool.urlopen('GET', '/restconf/data', None, {})[0], 200)
+        self.assertEqual(pool.get_stats()['connections_discarded'], 1)
+        self.assertEqual(pool.get_stats()['connections_created'], 1)
+
+    def test_02_stale_socket_not_retried_for_post(self):
+        for method in ('POST', 'PATCH'):
+            pool = FakePool()
+            pool.add_stale()
+            with self.assertRaises(socket.error):
+                pool.urlopen(method, '/restconf/data', '{}', {})
+            self.assertEqual(pool.get_stats()['connections_created'], 0)
+
+
+class TestSendPooled(unittest.TestCase):
+
+    def setUp(self):
+        options = {'host': 'sonic', 'use_ssl': True, 'use_proxy': True, 'http_agent': 'ansible-httpget'}
+        self.connection = FakeConnection(options)
+        self.httpapi = HttpApi(self.connection)
+        self.httpapi.get_option = {'keepalive': True, 'root_path': '/restconf'}.get
+        self.logins = []
+
+    def test_01_reauthenticates_on_401(self):
+        pool = FakeResponsePool([(401, 'Unauthorized', {}, b''), (200, 'OK', {}, b'{"a": 1}')])
+        self.httpapi.get_pool = lambda: pool
+
+        def login(username, password):
+            self.logins.append(username)
+            self.connection._auth = {'Authorization': 'Bearer new'}
+        self.httpapi.login = login
+
+        response, response_data = self.httpapi.send_pooled('/restconf/data', None, {'Accept': 'json'}, 'get')
+        self.assertEqual(response.getcode(), 200)
+        self.assertEqual(response_data.read(), b'{"a": 1}')
+        self.assertEqual(len(self.logins), 1)
+        self.assertEqual([headers['Authorization'] for headers in pool.headers], ['Basic old', 'Bearer new'])
+        self.assertEqual(pool.headers[0]['User-Agent'], 'ansible-httpget')
+        self.assertEqual(len(self.connection.logged), 4)
+
+    def test_02_unhandled_error_raised(self):
+        self.connection._auth = None
+        self.httpapi.login = lambda username, password: self.logins.append(username)
+        pool = FakeResponsePool([(401, 'Unauthorized', {}, b'')])
+        self.httpapi.get_pool = lambda: pool
+        with self.assertRaises(HTTPError):
+            self.httpapi.send_pooled('/restconf/data', None, {}, 'get')
+        self.assertEqual(self.logins, [])
+
+    def test_03_session_renewed_once(self):
+        pool = FakeResponsePool([(401, 'Unauthorized', {}, b''), (200, 'OK', {}, b'')])
+        self.httpapi.get_pool = lambda: pool
+        self.httpapi.login = lambda username, password: self.logins.append(username)
+
+        def urlopen(method, path, body, headers):
+            # Another request renews the session meanwhile
+            self.connection._auth = {'Authorization': 'Bearer new'}
+            return FakeResponsePool.urlopen(pool, method, path, body, headers)
+        pool.urlopen = urlopen
+        response, response_data = self.httpapi.send_pooled('/restconf/data', None, {}, 'get')
+        self.assertEqual(response.getcode(), 200)
+        self.assertEqual(self.logins, [])
+
+    def test_04_proxied_requests_not_pooled(self):
+        self.assertTrue(self.httpapi.use_pool())
+        with patch(HTTPAPI_MODULE + '.getproxies', return_value={'https': 'http://proxy:3128'}):
+            self.assertFalse(self.httpapi.use_pool())
+            self.connection.options['use_proxy'] = False
+            self.assertTrue(self.httpapi.use_pool())
+
+
+class TestEditConfig(unittest.TestCase):
+
+    def setUp(self):
+        options = {'host': 'sonic', 'use_ssl': True, 'use_proxy': False}
+        self.httpapi = HttpApi(FakeConnection(options))
+        self.options = {'max_inflight': 4, 'keepalive': True}
+        self.httpapi.get_option = self.options.get
+        self.threads = []
+
+        def send_one(req):
+            self.threads.append(threading.current_thread())
+            return 204, req['path']
+        self.httpapi._send_one = send_one
+
+    def edit_config(self):
+        requests = [{'path': 'data/%d' % index, 'method': 'patch', 'independent': True} for index in range(8)]
+        self.assertEqual(self.httpapi.edit_config(requests), [(204, 'data/%d' % index) for index in range(8)])
+
+    def test_01_concurrent_over_the_pool(self):
+        self.edit_config()
+        self.assertNotIn(threading.current_thread(), self.threads)
+
+    def test_02_serial_without_keepalive(self):
+        self.options['keepalive'] = False
+        self.edit_config()
+        self.assertEqual(set(self.threads), set([threading.current_thread()]))
@@ -0,0 +1,122 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import copy
+import random
+import unittest
+
+import sys
+sys.path.append('/root/.ansible/collections')
+
+from ansible.module_utils.connection import ConnectionError
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import patch
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.acl_utils import (
+    MAX_ACL_SET_READS,
+    AclRule,
+    AclRuleOptions,
+    get_acl_sets,
+)
+
+ACL_UTILS_MODULE = 'ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.acl_utils'
+
+
+class SampleAclRule(AclRule):
+    __slots__ = ('action', 'destination', 'protocol_options', 'remark', 'sequence_num', 'source', 'vlan_id')
+
+
+def random_rule(rnd):
+    rule = {'sequence_num': rnd.randint(1, 3), 'action': rnd.choice(['permit', 'deny'])}
+    for endpoint in ('source', 'destination'):
+        rule[endpoint] = rnd.choice([{'any': True}, {'host': rnd.choice(['10.1.1.1', '10.1.1.2'])},
+                                     {'prefix': '10.0.0.0/8', 'port_number': {'eq': rnd.randint(1, 2)}}])
+    if rnd.random() < 0.5:
+        rule['protocol_options'] = {'tcp': dict((flag, True) for flag in rnd.sample(['ack', 'syn', 'fin'], rnd.randint(1, 3)))}
+    if rnd.random() < 0.3:
+        rule['vlan_id'] = rnd.randint(1, 2)
+    if rnd.random() < 0.3:
+        rule['remark'] = rnd.choice(['a', 'b'])
+    return rule
+
+
+class TestAclRule(unittest.TestCase):
+
+    def test_01_equality_matches_dicts(self):
+        rnd = random.Random(1701)
+        for dummy in range(1000):
+            rule_a = random_rule(rnd)
+            rule_b = random_rule(rnd) if rnd.random() < 0.7 else copy.deepcopy(rule_a)
+            record_a = SampleAclRule(rule_a)
+            record_b = SampleAclRule(rule_b)
+            self.assertEqual(record_a == record_b, rule_a == rule_b)
+            self.assertEqual(record_a != record_b, rule_a != rule_b)
+            if rule_a == rule_b:
+                self.assertEqual(hash(record_a), hash(record_b))
+            self.assertEqual(record_a.to_dict(), rule_a)
+
+    def test_02_dict_access(self):
+        record = SampleAclRule({'sequence_num': 1, 'action': 'permit', 'source': {'any': True},
+                                'destination': {'host': '10.1.1.1', 'port_number': {'lt': 80}}})
+        self.assertEqual(record['action'], 'permit')
+        self.assertIsNone(record.get('remark'))
+        self.assertEqual(record.get('unknown', 5), 5)
+        self.assertRaises(KeyError, record.__getitem__, 'vlan_id')
+        self.assertIsInstance(record['destination'], AclRuleOptions)
+        self.assertEqual(record['destination']['port_number'].get('lt'), 80)
+        self.assertEqual(next(iter(record['source'])), 'any')
+        self.assertIn('host', record['destination'])
+        self.assertRaises(KeyError, record['source'].__getitem__, 'host')
+
+    def test_03_records_have_no_instance_dict(self):
+        record = SampleAclRule({'sequence_num': 1, 'source': {'any': True}})
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertFalse(hasattr(record['source'], '__dict__'))
+
+    def test_04_empty_values_are_not_set(self):
+        rendered = {'sequence_num': 1, 'remark': None, 'source': {'any': True},
+                    'protocol_options': {'tcp': {}}, 'destination': {'host': '10.1.1.1', 'port_number': {}}}
+        record = SampleAclRule(rendered)
+        self.assertEqual(record, SampleAclRule({'sequence_num': 1, 'source': {'any': True}, 'destination': {'host': '10.1.1.1'}}))
+        self.assertEqual(record.to_dict(), {'sequence_num': 1, 'source': {'any': True}, 'destination': {'host': '10.1.1.1'}})
+
+
+def acl_set(name, acl_type):
+    return {'name': name, 'type': acl_type, 'config': {'name': name, 'type': 'openconfig-acl:' + acl_type}}
+
+
+class TestGetAclSets(unittest.TestCase):
+
+    def setUp(self):
+        self.acl_sets = [acl_set('acl %d' % index, acl_type) for index in range(20) for acl_type in ('ACL_IPV4', 'ACL_L2')]
+        self.paths = []
+        mock_edit_config = patch(ACL_UTILS_MODULE + '.edit_config', side_effect=self.edit_config)
+        mock_edit_config.start()
+        self.addCleanup(mock_edit_config.stop)
+        mock_to_request = patch(ACL_UTILS_MODULE + '.to_request', side_effect=lambda module, requests: requests)
+        mock_to_request.start()
+        self.addCleanup(mock_to_request.stop)
+
+    def edit_config(self, module, requests):
+        path = requests[0]['path']
+        self.paths.append(path)
+        if path == 'data/openconfig-acl:acl/acl-sets':
+            return [(200, {'openconfig-acl:acl-sets': {'acl-set': self.acl_sets}})]
+        for acl in self.acl_sets:
+            if path.endswith('acl-set=%s,%s' % (acl['name'].replace(' ', '%20'), acl['type'])):
+                return [(200, {'openconfig-acl:acl-set': [acl]})]
+        raise ConnectionError({'code': 404, 'error-message': 'Resource not found'})
+
+    def test_01_read_per_acl(self):
+        acls = get_acl_sets(None, [('acl 1', 'ACL_L2'), ('acl/missing', 'ACL_L2'), ('acl 2', 'ACL_IPV4')])
+        self.assertEqual(acls, [acl_set('acl 1', 'ACL_L2'), acl_set('acl 2', 'ACL_IPV4')])
+        self.assertEqual(self.paths, [
+            'data/openconfig-acl:acl/acl-sets/acl-set=acl%201,ACL_L2',
+            'data/openconfig-acl:acl/acl-sets/acl-set=acl%2Fmissing,ACL_L2',
+            'data/openconfig-acl:acl/acl-sets/acl-set=acl%202,ACL_IPV4',
+        ])
+
+    def test_02_single_read_for_many_acls(self):
+        acl_targets = [('acl %d' % index, 'ACL_L2') for index in range(MAX_ACL_SET_READS + 1)]
+        acls = get_acl_sets(None, acl_targets)
+        self.assertEqual(acls, [acl_set(name, acl_type) for name, acl_type in acl_targets])
+        self.assertEqual(self.paths, ['data/openconfig-acl:acl/acl-sets'])
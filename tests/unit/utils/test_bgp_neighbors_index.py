@@ -0,0 +1,68 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import random
+import unittest
+
+import sys
+sys.path.append('/root/.ansible/collections')
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.bgp_neighbors.bgp_neighbors import (
+    Bgp_neighbors,
+)
+
+
+def scan_pg(have, bgp_as, vrf_name, name):
+    mat_dict = next((m for m in have if m['bgp_as'] == bgp_as and m['vrf_name'] == vrf_name), None)
+    if mat_dict and mat_dict.get('peer_group') is not None:
+        return next((m for m in mat_dict['peer_group'] if m['name'] == name), None)
+
+
+def scan_af(have, bgp_as, vrf_name, name, afi, safi):
+    mat_pg = scan_pg(have, bgp_as, vrf_name, name)
+    if mat_pg and mat_pg.get('address_family', {}).get('afis') is not None:
+        return next((af for af in mat_pg['address_family']['afis'] if af['afi'] == afi and af['safi'] == safi), None)
+
+
+def scan_nei(have, bgp_as, vrf_name, neighbor):
+    mat_dict = next((m for m in have if m['bgp_as'] == bgp_as and m['vrf_name'] == vrf_name), None)
+    if mat_dict and mat_dict.get('neighbors') is not None:
+        return next((m for m in mat_dict['neighbors'] if m['neighbor'] == neighbor), None)
+
+
+def random_have(rnd):
+    have = []
+    for dummy in range(rnd.randint(0, 4)):
+        conf = {'bgp_as': rnd.choice([1, 2]), 'vrf_name': rnd.choice(['default', 'Vrf1'])}
+        if rnd.random() < 0.8:
+            conf['peer_group'] = []
+            for idx in range(rnd.randint(0, 4)):
+                pg = {'name': rnd.choice(['pg1', 'pg2', 'pg3']), 'id': idx}
+                if rnd.random() < 0.7:
+                    pg['address_family'] = {'afis': [{'afi': rnd.choice(['ipv4', 'ipv6']), 'safi': 'unicast', 'id': n}
+                                                     for n in range(rnd.randint(0, 3))]}
+                conf['peer_group'].append(pg)
+        if rnd.random() < 0.8:
+            conf['neighbors'] = [{'neighbor': rnd.choice(['1.1.1.1', '2.2.2.2', 'Ethernet0']), 'id': idx}
+                                 for idx in range(rnd.randint(0, 4))]
+        have.append(conf)
+    return have
+
+
+class TestBgpNeighborsIndex(unittest.TestCase):
+
+    def test_01_index_matches_linear_scans(self):
+        rnd = random.Random(2001)
+        for dummy in range(500):
+            have = random_have(rnd)
+            index = Bgp_neighbors.build_have_index(have)
+            for bgp_as in (1, 2, 3):
+                for vrf_name in ('default', 'Vrf1'):
+                    for name in ('pg1', 'pg2', 'pg3'):
+                        self.assertIs(index['peer_group'].get((bgp_as, vrf_name, name)), scan_pg(have, bgp_as, vrf_name, name))
+                        for afi in ('ipv4', 'ipv6'):
+                            self.assertIs(index['af'].get((bgp_as, vrf_name, name, afi, 'unicast')),
+                                          scan_af(have, bgp_as, vrf_name, name, afi, 'unicast'))
+                    for neighbor in ('1.1.1.1', '2.2.2.2', 'Ethernet0'):
+                        self.assertIs(index['neighbor'].get((bgp_as, vrf_name, neighbor)), scan_nei(have, bgp_as, vrf_name, neighbor))
@@ -0,0 +1,102 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import unittest
+
+import sys
+sys.path.append('/root/.ansible/collections')
+
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import (
+    patch,
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic import sonic
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
+    RequestCache,
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils import bgp_utils
+
+BGP_PATH = '/data/openconfig-network-instance:network-instances/network-instance={0}/protocols/protocol=BGP,bgp/bgp'
+RESPONSES = {
+    'data/sonic-vrf:sonic-vrf/VRF/VRF_LIST': {'sonic-vrf:VRF_LIST': [{'vrf_name': 'default'}, {'vrf_name': 'Vrf1'}]},
+    BGP_PATH.format('default') + '/global': {'openconfig-network-instance:global': {'config': {'as': 65000}}},
+    BGP_PATH.format('Vrf1') + '/global': {},
+    BGP_PATH.format('default') + '/global/config': {'openconfig-network-instance:config': {'as': 65000}},
+    BGP_PATH.format('Vrf1') + '/global/config': {},
+    BGP_PATH.format('default') + '/neighbors': {'openconfig-network-instance:neighbors': {'neighbor': [{'neighbor-address': '1.1.1.1'}]}},
+    BGP_PATH.format('default') + '/peer-groups': {},
+    '/data/openconfig-network-instance:network-instances/network-instance=default/table-connections': {},
+}
+
+
+class FakeModule(object):
+
+    def __init__(self):
+        self.params = {}
+
+    def fail_json(self, **kwargs):
+        raise AssertionError(kwargs)
+
+
+class TestBgpSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.sent = []
+        self.responses = dict(RESPONSES)
+        self.mock_edit_config = patch.object(bgp_utils, 'edit_config', side_effect=self.edit_config)
+        self.mock_to_request = patch.object(bgp_utils, 'to_request', side_effect=lambda module, requests: requests)
+        self.mock_edit_config.start()
+        self.mock_to_request.start()
+
+    def tearDown(self):
+        self.mock_edit_config.stop()
+        self.mock_to_request.stop()
+
+    def edit_config(self, module, requests):
+        if isinstance(requests, dict):
+            requests = [requests]
+        self.sent.extend(request['path'] for request in requests)
+        return [[200, self.responses[request['path']]] for request in requests]
+
+    def read_all(self, module):
+        bgp_utils.get_bgp_data(module, {'bgp_as': 'as'})
+        bgp_utils.get_bgp_af_data(module, {})
+        bgp_utils.get_all_bgp_af_redistribute(module, ['default'], {})
+        return bgp_utils.get_all_bgp_neighbors(module)
+
+    def test_01_shared_within_facts_gathering(self):
+        module = FakeModule()
+        module._sonic_request_cache = RequestCache()
+        neighbors = self.read_all(module)
+        neighbors[0]['neighbors']['neighbor'].append({'neighbor-address': '2.2.2.2'})
+        self.assertEqual(self.read_all(module), [{'bgp_as': 65000, 'vrf_name': 'default', 'neighbors': {
+            'neighbor': [{'neighbor-address': '1.1.1.1'}]}}])
+        self.assertEqual(bgp_utils.get_bgp_snapshot(module).get_peergroups(), {'default': []})
+
+        # The VRF list and each per-VRF tree are read once
+        self.assertEqual(len(self.sent), len(set(self.sent)))
+        self.assertEqual(len(self.sent), 8)
+
+    def test_02_kept_on_module_outside_facts_gathering(self):
+        module = FakeModule()
+        self.read_all(module)
+        count = len(self.sent)
+        self.read_all(module)
+        self.assertEqual(len(self.sent), count)
+
+        # A change request drops the snapshot
+        with patch.object(sonic, 'get_connection'):
+            sonic.edit_config(module, [{'path': BGP_PATH.format('default') + '/global', 'method': 'delete'}])
+        self.read_all(module)
+        self.assertEqual(len(self.sent), 2 * count)
+
+    def test_03_redistribute_reads_given_vrfs(self):
+        module = FakeModule()
+        bgp_utils.get_all_bgp_af_redistribute(module, ['default'], {})
+        self.assertEqual(self.sent, ['/data/openconfig-network-instance:network-instances/network-instance=default/table-connections'])
+
+    def test_04_empty_body_responses(self):
+        # An empty response body is returned as ""
+        self.responses[BGP_PATH.format('Vrf1') + '/global/config'] = ""
+        self.responses[BGP_PATH.format('default') + '/neighbors'] = ""
+        self.assertEqual(bgp_utils.get_all_bgp_neighbors(FakeModule()), [{'bgp_as': 65000, 'vrf_name': 'default'}])
@@ -0,0 +1,68 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import unittest
+
+import sys
+sys.path.append('/root/.ansible/collections')
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
+    coalesce_requests,
+)
+
+INTF_URL = 'data/openconfig-interfaces:interfaces'
+ETH_URL = INTF_URL + '/interface=Eth1%2f1/openconfig-if-ethernet:ethernet/config'
+
+
+def vlan_create_request(vlan_id):
+    name = 'Vlan%d' % vlan_id
+    return {'path': INTF_URL, 'method': 'patch',
+            'data': {'openconfig-interfaces:interfaces': {'interface': [{'name': name, 'config': {'name': name}}]}}}
+
+
+def vlan_description_request(vlan_id, description):
+    name = 'Vlan%d' % vlan_id
+    return {'path': INTF_URL + '/interface=%s/config' % name, 'method': 'patch',
+            'data': {'openconfig-interfaces:config': {'name': name, 'description': description}}}
+
+
+class TestCoalesceRequests(unittest.TestCase):
+
+    def test_01_same_path(self):
+        requests = [
+            {'path': ETH_URL, 'method': 'patch', 'data': {'openconfig-if-ethernet:config': {'port-speed': 'SPEED_10GB'}}},
+            {'path': ETH_URL, 'method': 'patch', 'data': {'openconfig-if-ethernet:config': {'auto-negotiate': True}}},
+        ]
+        coalesced, counts = coalesce_requests(requests)
+        self.assertEqual(counts, [2])
+        self.assertEqual(coalesced[0]['data'],
+                         {'openconfig-if-ethernet:config': {'port-speed': 'SPEED_10GB', 'auto-negotiate': True}})
+        # Original requests are left untouched
+        self.assertEqual(requests[0]['data'], {'openconfig-if-ethernet:config': {'port-speed': 'SPEED_10GB'}})
+
+    def test_02_container_parent_path(self):
+        requests = [
+            vlan_create_request(10), vlan_description_request(10, 'ten'),
+            vlan_create_request(20), vlan_description_request(20, 'twenty'),
+        ]
+        coalesced, counts = coalesce_requests(requests)
+        self.assertEqual(counts, [4])
+        self.assertEqual(coalesced[0]['path'], INTF_URL)
+        self.assertEqual(coalesced[0]['data'], {'openconfig-interfaces:interfaces': {'interface': [
+            {'name': 'Vlan10', 'config': {'name': 'Vlan10', 'description': 'ten'}},
+            {'name': 'Vlan20', 'config': {'name': 'Vlan20', 'description': 'twenty'}},
+        ]}})
+
+    def test_03_not_coalesced(self):
+        requests = [
+            vlan_create_request(10),
+            {'path': INTF_URL + '/interface=Vlan30', 'method': 'delete'},
+            vlan_description_request(10, 'ten'),
+            {'path': ETH_URL, 'method': 'patch', 'data': {'openconfig-if-ethernet:config': {'port-speed': 'SPEED_10GB'}}},
+            # Unknown list entry in the parent payload
+            vlan_description_request(40, 'forty'),
+        ]
+        coalesced, counts = coalesce_requests(requests)
+        self.assertEqual(counts, [1, 1, 1, 1, 1])
+        self.assertEqual(coalesced, requests)
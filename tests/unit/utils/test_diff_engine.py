@@ -0,0 +1,118 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import copy
+import glob
+import os
+import random
+import unittest
+import yaml
+
+import sys
+sys.path.append('/root/.ansible/collections')
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils import utils
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    get_diff,
+)
+
+TEST_KEYS = [
+    {'config': {'name': ''}},
+    {'rules': {'sequence_num': '', 'action': ''}},
+    {'members': {'ifname': ''}},
+]
+
+
+def random_leaf(rnd):
+    return rnd.choice([None, 'a', 'b', 1, 2, True, False])
+
+
+def random_rule(rnd):
+    rule = {}
+    if rnd.random() < 0.8:
+        rule['sequence_num'] = rnd.randint(1, 6)
+    if rnd.random() < 0.5:
+        rule['action'] = rnd.choice(['permit', 'deny'])
+    if rnd.random() < 0.7:
+        rule['remark'] = random_leaf(rnd)
+    if rnd.random() < 0.3:
+        rule['ports'] = [rnd.randint(1, 3) for dummy in range(rnd.randint(0, 3))]
+    return rule
+
+
+def random_entry(rnd):
+    entry = {}
+    if rnd.random() < 0.9:
+        entry['name'] = rnd.choice(['e1', 'e2', 'e3', 'e4'])
+    entry['mtu'] = random_leaf(rnd)
+    if rnd.random() < 0.6:
+        entry['rules'] = [random_rule(rnd) for dummy in range(rnd.randint(0, 6))]
+    if rnd.random() < 0.4:
+        entry['members'] = [{'ifname': rnd.choice(['Eth1', 'Eth2', 'Eth3'])} for dummy in range(rnd.randint(0, 3))]
+    if rnd.random() < 0.3:
+        entry['vlans'] = [rnd.choice([10, 20, 30]) for dummy in range(rnd.randint(0, 3))]
+    if rnd.random() < 0.3:
+        entry['peers'] = [{'addr': rnd.choice(['1.1.1.1', '2.2.2.2']), 'asn': rnd.randint(1, 2)} for dummy in range(rnd.randint(0, 3))]
+    return entry
+
+
+class TestDiffEngine(unittest.TestCase):
+
+    def tearDown(self):
+        utils.use_legacy_diff = False
+
+    def run_diff(self, legacy, want, have, test_keys, is_skeleton):
+        utils.use_legacy_diff = legacy
+        try:
+            return get_diff(copy.deepcopy(want), copy.deepcopy(have), copy.deepcopy(test_keys), is_skeleton)
+        except Exception as exc:
+            # Inputs the legacy engine cannot handle must fail the same way.
+            return type(exc)
+
+    def diff_both(self, want, have, test_keys, is_skeleton=None):
+        legacy = self.run_diff(True, want, have, test_keys, is_skeleton)
+        indexed = self.run_diff(False, want, have, test_keys, is_skeleton)
+        return legacy, indexed
+
+    def test_01_yaml_cases_match_legacy(self):
+        for file_name in sorted(glob.glob(os.path.join(os.path.dirname(__file__), 'test_*.yaml'))):
+            with open(file_name, 'r') as file_stream:
+                data = yaml.full_load(file_stream)
+            legacy, indexed = self.diff_both(data.get('want', []), data.get('have', []),
+                                             data.get('test_keys', None), data.get('skeleton', None))
+            self.assertEqual(legacy, indexed, file_name)
+            self.assertEqual(data.get('diff', []), indexed, file_name)
+
+    def test_02_random_lists_match_legacy(self):
+        rnd = random.Random(20201)
+        for dummy in range(400):
+            want = [random_entry(rnd) for dummy in range(rnd.randint(0, 5))]
+            have = [random_entry(rnd) for dummy in range(rnd.randint(0, 5))]
+            test_keys = TEST_KEYS if rnd.random() < 0.8 else None
+            is_skeleton = rnd.random() < 0.2
+            legacy, indexed = self.diff_both(want, have, test_keys, is_skeleton)
+            self.assertEqual(legacy, indexed, (want, have, test_keys, is_skeleton))
+
+    def test_03_random_dicts_match_legacy(self):
+        rnd = random.Random(20202)
+        for dummy in range(200):
+            want = random_entry(rnd)
+            have = random_entry(rnd)
+            legacy, indexed = self.diff_both(want, have, TEST_KEYS)
+            self.assertEqual(legacy, indexed, (want, have))
+
+    def test_04_first_match_wins_across_key_subsets(self):
+        want = [{'name': 'x', 'vrf': 'red', 'mtu': 1}]
+        have = [{'vrf': 'red', 'mtu': 2}, {'name': 'x', 'vrf': 'red', 'mtu': 1}]
+        test_keys = [{'config': {'name': '', 'vrf': ''}}]
+        legacy, indexed = self.diff_both(want, have, test_keys)
+        self.assertEqual(legacy, indexed)
+        self.assertEqual(indexed, [{'name': 'x', 'vrf': 'red', 'mtu': 1}])
+
+    def test_05_unhashable_key_values(self):
+        want = [{'name': ['a', 'b'], 'mtu': 1}, {'name': {'k': 1}, 'mtu': 2}]
+        have = [{'name': ['a', 'b'], 'mtu': 3}, {'name': {'k': 1}, 'mtu': 2}]
+        legacy, indexed = self.diff_both(want, have, None)
+        self.assertEqual(legacy, indexed)
+        self.assertEqual(indexed, [{'name': ['a', 'b'], 'mtu': 1}])
@@ -0,0 +1,136 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import copy
+import random
+import unittest
+
+import sys
+sys.path.append('/root/.ansible/collections')
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils import utils
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    get_replaced_config,
+)
+
+TEST_KEYS = [
+    {'config': {'vrf_name': '', 'bgp_as': ''}},
+    {'neighbors': {'neighbor': ''}},
+    {'afis': {'afi': '', 'safi': ''}},
+]
+
+
+def random_leaf(rnd):
+    return rnd.choice([None, 'a', 'b', 1, 2, True, False, '', [], {}])
+
+
+def random_afi(rnd):
+    afi = {}
+    if rnd.random() < 0.9:
+        afi['afi'] = rnd.choice(['ipv4', 'ipv6'])
+    if rnd.random() < 0.8:
+        afi['safi'] = rnd.choice(['unicast', None])
+    if rnd.random() < 0.6:
+        afi['max_path'] = random_leaf(rnd)
+    return afi
+
+
+def random_neighbor(rnd):
+    nbr = {}
+    if rnd.random() < 0.9:
+        nbr['neighbor'] = rnd.choice(['1.1.1.1', '2.2.2.2', '3.3.3.3', None])
+    if rnd.random() < 0.6:
+        nbr['remote_as'] = rnd.choice([1, 2, {'peer_as': rnd.randint(1, 2)}])
+    if rnd.random() < 0.4:
+        nbr['afis'] = [random_afi(rnd) for dummy in range(rnd.randint(0, 3))]
+    if rnd.random() < 0.3:
+        nbr['timers'] = {'keepalive': rnd.choice([30, 60, None]), 'holdtime': rnd.choice([90, None])}
+    return nbr
+
+
+def random_entry(rnd):
+    entry = {}
+    if rnd.random() < 0.95:
+        entry['bgp_as'] = rnd.choice([1, 2])
+    if rnd.random() < 0.95:
+        entry['vrf_name'] = rnd.choice(['default', 'Vrf1', 'Vrf2'])
+    if rnd.random() < 0.5:
+        entry['router_id'] = random_leaf(rnd)
+    if rnd.random() < 0.7:
+        entry['neighbors'] = [random_neighbor(rnd) for dummy in range(rnd.randint(0, 6))]
+    if rnd.random() < 0.3:
+        entry['communities'] = [rnd.choice(['no-export', 'no-advertise', 'local-as']) for dummy in range(rnd.randint(0, 3))]
+    if rnd.random() < 0.2:
+        entry['peer_groups'] = [{'name': rnd.choice(['pg1', 'pg2'])} for dummy in range(rnd.randint(0, 2))]
+    return entry
+
+
+def mutate(rnd, config):
+    """Derive an 'existing' config that mostly overlaps the new one."""
+    config = copy.deepcopy(config)
+    rnd.shuffle(config)
+    for entry in config:
+        for nbr in entry.get('neighbors') or []:
+            if rnd.random() < 0.3:
+                nbr['remote_as'] = rnd.randint(1, 3)
+            if rnd.random() < 0.2:
+                nbr.pop('afis', None)
+        if rnd.random() < 0.3:
+            entry.setdefault('neighbors', []).append(random_neighbor(rnd))
+    if rnd.random() < 0.3:
+        config.append(random_entry(rnd))
+    return config
+
+
+class TestReplacedEngine(unittest.TestCase):
+
+    def tearDown(self):
+        utils.use_legacy_replaced = False
+
+    def run_replaced(self, legacy, new_conf, exist_conf, test_keys):
+        utils.use_legacy_replaced = legacy
+        try:
+            return get_replaced_config(copy.deepcopy(new_conf), copy.deepcopy(exist_conf), copy.deepcopy(test_keys))
+        except Exception as exc:
+            # Inputs the legacy implementation cannot handle must fail the same way.
+            return type(exc)
+
+    def assert_same(self, new_conf, exist_conf, test_keys):
+        legacy = self.run_replaced(True, new_conf, exist_conf, test_keys)
+        indexed = self.run_replaced(False, new_conf, exist_conf, test_keys)
+        self.assertEqual(legacy, indexed, (new_conf, exist_conf, test_keys))
+        return indexed
+
+    def test_01_random_lists_match_legacy(self):
+        rnd = random.Random(20901)
+        for dummy in range(500):
+            new_conf = [random_entry(rnd) for dummy in range(rnd.randint(0, 4))]
+            if rnd.random() < 0.5:
+                exist_conf = mutate(rnd, new_conf)
+            else:
+                exist_conf = [random_entry(rnd) for dummy in range(rnd.randint(0, 4))]
+            test_keys = TEST_KEYS if rnd.random() < 0.85 else []
+            self.assert_same(new_conf, exist_conf, test_keys)
+
+    def test_02_random_dicts_match_legacy(self):
+        rnd = random.Random(20902)
+        for dummy in range(300):
+            new_conf = random_entry(rnd)
+            exist_conf = mutate(rnd, [new_conf])[0] if rnd.random() < 0.5 else random_entry(rnd)
+            self.assert_same(new_conf, exist_conf, TEST_KEYS)
+
+    def test_03_duplicate_keys_scan_past_unchanged_entry(self):
+        new_conf = [{'vrf_name': 'default', 'bgp_as': 1,
+                     'neighbors': [{'neighbor': '1.1.1.1', 'remote_as': 5}]}]
+        exist_conf = [{'vrf_name': 'default', 'bgp_as': 1,
+                       'neighbors': [{'neighbor': '1.1.1.1', 'remote_as': 5},
+                                     {'neighbor': '1.1.1.1', 'remote_as': 6}]}]
+        replaced = self.assert_same(new_conf, exist_conf, TEST_KEYS)
+        self.assertEqual(replaced, [{'vrf_name': 'default', 'bgp_as': 1,
+                                     'neighbors': [{'neighbor': '1.1.1.1', 'remote_as': 6}]}])
+
+    def test_04_mixed_list_falls_back(self):
+        new_conf = {'vrf_name': 'default', 'bgp_as': 1, 'neighbors': [{'neighbor': '1.1.1.1'}, 'x']}
+        exist_conf = {'vrf_name': 'default', 'bgp_as': 1, 'neighbors': ['y', {'neighbor': '1.1.1.1'}]}
+        self.assert_same(new_conf, exist_conf, TEST_KEYS)
@@ -0,0 +1,48 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import unittest
+
+import sys
+sys.path.append('/root/.ansible/collections')
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
+    RequestCache,
+)
+
+INTF_URL = 'data/openconfig-interfaces:interfaces'
+VLAN_URL = 'data/openconfig-network-instance:network-instances'
+
+
+class FakeConnection(object):
+
+    def __init__(self):
+        self.sent = []
+
+    def edit_config(self, requests):
+        self.sent.extend(requests)
+        return [[200, {'path': request['path'], 'items': [1, 2]}] for request in requests]
+
+
+class TestRequestCache(unittest.TestCase):
+
+    def test_01_get_requests_fetched_once(self):
+        connection = FakeConnection()
+        cache = RequestCache()
+        first = cache.edit_config(connection, [{'path': INTF_URL, 'method': 'get'}])
+        first[0][1]['items'].append(3)
+        second = cache.edit_config(connection, [{'path': VLAN_URL, 'method': 'get'},
+                                                {'path': INTF_URL, 'method': 'GET'}])
+
+        self.assertEqual([request['path'] for request in connection.sent], [INTF_URL, VLAN_URL])
+        self.assertEqual(second[0][1]['path'], VLAN_URL)
+        # Changes made by a caller do not leak into the cache
+        self.assertEqual(second[1], [200, {'path': INTF_URL, 'items': [1, 2]}])
+        self.assertEqual(cache.get_stats(), {'hits': 1, 'misses': 2})
+
+    def test_02_cacheable(self):
+        self.assertTrue(RequestCache.is_cacheable([{'path': INTF_URL, 'method': 'get'}]))
+        self.assertFalse(RequestCache.is_cacheable([{'path': INTF_URL, 'method': 'get'},
+                                                    {'path': INTF_URL, 'method': 'patch', 'data': {}}]))
+        self.assertFalse(RequestCache.is_cacheable(['show running-configuration']))
@@ -0,0 +1,180 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import random
+import unittest
+from copy import deepcopy
+
+import sys
+sys.path.append('/root/.ansible/collections')
+
+from ansible.module_utils import basic
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
+    utils,
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.bgp_neighbors.bgp_neighbors import Bgp_neighborsArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.l3_acls.l3_acls import L3_aclsArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.system.system import SystemArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.vlans.vlans import VlansArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import FACT_RESOURCE_SUBSETS
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import patch
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.modules.utils import AnsibleFailJson, fail_json
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.spec_utils import (
+    GeneratedSpec,
+    get_generated_spec,
+    get_options_validator,
+    normalize_config,
+)
+
+SAMPLES_PER_RESOURCE = 25
+
+
+def random_value(rnd, option):
+    if option.get('choices') and rnd.random() < 0.95:
+        return rnd.choice(option['choices'])
+    option_type = option.get('type', 'str')
+    if option_type == 'dict':
+        return random_options(rnd, option['options']) if option.get('options') else {'key': 'value'}
+    if option_type == 'list':
+        elements = option.get('elements')
+        if elements == 'dict':
+            return [random_options(rnd, option['options']) for dummy in range(rnd.randint(0, 2))]
+        if elements is None or elements == 'str':
+            if rnd.random() < 0.2:
+                return 'item1,item2'
+        return [random_value(rnd, {'type': elements or 'str'}) for dummy in range(rnd.randint(0, 3))]
+    return rnd.choice({
+        'str': ['Eth1/1', '', 'default', 100],
+        'int': [0, 65000, '42'],
+        'bool': [True, False, 'yes', 'false', 0],
+    }[option_type])
+
+
+def random_options(rnd, spec):
+    options = {}
+    for name, option in spec.items():
+        draw = rnd.random()
+        if draw < 0.4:
+            continue
+        options[name] = None if draw < 0.5 else random_value(rnd, option)
+    if rnd.random() < 0.01:
+        options['unsupported'] = True
+    return options
+
+
+def ansible_validate(argument_spec, data):
+    try:
+        return utils.validate_config(argument_spec, data)
+    except SystemExit:
+        return None
+
+
+class TestGetGeneratedSpec(unittest.TestCase):
+
+    def test_01_matches_generate_dict(self):
+        for args_class in (Bgp_neighborsArgs, L3_aclsArgs, SystemArgs):
+            spec = args_class.argument_spec
+            self.assertEqual(get_generated_spec(args_class), utils.generate_dict(spec['config']['options']))
+            self.assertEqual(get_generated_spec(args_class, 'config', None), utils.generate_dict(spec['config']))
+            self.assertEqual(get_generated_spec(args_class, None), utils.generate_dict(spec))
+
+    def test_02_shared_by_facts_instances(self):
+        facts_class = FACT_RESOURCE_SUBSETS['bgp_neighbors']
+        first = facts_class(None)
+        second = facts_class(None)
+        self.assertIs(first.generated_spec, second.generated_spec)
+        self.assertIs(first.generated_spec, get_generated_spec(Bgp_neighborsArgs))
+        self.assertIsNot(get_generated_spec(Bgp_neighborsArgs, None), first.generated_spec)
+
+    def test_03_read_only(self):
+        generated_spec = get_generated_spec(SystemArgs)
+        self.assertIsInstance(generated_spec, GeneratedSpec)
+        with self.assertRaises(TypeError):
+            generated_spec['hostname'] = 'sonic'
+        with self.assertRaises(TypeError):
+            generated_spec['anycast_address'].update({'ipv4': False})
+        with self.assertRaises(TypeError):
+            generated_spec.pop('hostname')
+
+    def test_04_deepcopy_is_writable(self):
+        generated_spec = get_generated_spec(SystemArgs)
+        config = deepcopy(generated_spec)
+        self.assertIs(type(config), dict)
+        self.assertIs(type(config['anycast_address']), dict)
+        config['hostname'] = 'sonic'
+        config['anycast_address']['ipv4'] = False
+        self.assertIsNone(generated_spec['hostname'])
+        self.assertEqual(config.copy(), config)
+        self.assertIs(type(generated_spec.copy()), dict)
+
+
+class TestNormalizeConfig(unittest.TestCase):
+
+    def assert_equivalent(self, argument_spec, data, msg=None):
+        expected = ansible_validate(argument_spec, deepcopy(data))
+        if expected is None:
+            with self.assertRaises(SystemExit, msg=msg):
+                normalize_config(argument_spec, data)
+            return
+        snapshot = deepcopy(data)
+        self.assertEqual(normalize_config(argument_spec, data), expected, msg)
+        self.assertEqual(normalize_config(argument_spec, data, remove_empties=True), utils.remove_empties(expected), msg)
+        self.assertEqual(data, snapshot, msg)
+
+    def test_01_matches_validate_config(self):
+        rnd = random.Random(2301)
+        for resource in sorted(FACT_RESOURCE_SUBSETS):
+            argument_spec = FACT_RESOURCE_SUBSETS[resource](None).argument_spec
+            self.assertIsNotNone(get_options_validator(argument_spec), resource)
+            config = argument_spec['config']
+            for dummy in range(SAMPLES_PER_RESOURCE):
+                if config['type'] == 'list':
+                    data = {'config': [random_options(rnd, config['options']) for dummy in range(rnd.randint(1, 3))]}
+                else:
+                    data = {'config': random_options(rnd, config['options'])}
+                self.assert_equivalent(argument_spec, data, '%s: %r' % (resource, data))
+
+    def test_02_conversions_and_defaults(self):
+        argument_spec = {
+            'config': {'type': 'list', 'elements': 'dict', 'options': {
+                'name': {'type': 'str', 'required': True},
+                'mtu': {'type': 'int'},
+                'enabled': {'type': 'bool', 'default': True},
+                'mode': {'type': 'str', 'choices': ['yes', 'other']},
+                'vlans': {'type': 'list', 'elements': 'int'},
+                'timers': {'type': 'dict', 'options': {'hold': {'type': 'int', 'default': 180}}},
+            }},
+            'state': {'type': 'str', 'default': 'merged'},
+        }
+        data = {'config': [{'name': 100, 'mtu': '9100', 'mode': 'True', 'vlans': ['10', 20], 'timers': {}}]}
+        self.assert_equivalent(argument_spec, data)
+        self.assertEqual(normalize_config(argument_spec, data, remove_empties=True), {
+            'config': [{'name': '100', 'mtu': 9100, 'enabled': True, 'mode': 'yes', 'vlans': [10, 20], 'timers': {'hold': 180}}],
+            'state': 'merged',
+        })
+
+    def test_03_invalid_values(self):
+        argument_spec = {'config': {'type': 'dict', 'options': {
+            'name': {'type': 'str', 'required': True},
+            'mtu': {'type': 'int'},
+            'mode': {'type': 'str', 'choices': ['access', 'trunk']},
+            'access': {'type': 'int'},
+            'trunk': {'type': 'int'},
+        }, 'mutually_exclusive': [['access', 'trunk']]}}
+        for config in ({'mtu': 1}, {'name': 'a', 'mtu': 'big'}, {'name': 'a', 'mode': 'other'},
+                       {'name': 'a', 'other': 1}, {'name': 'a', 'access': 1, 'trunk': 2}):
+            self.assert_equivalent(argument_spec, {'config': config}, config)
+
+    def test_04_delegated_argspec(self):
+        argument_spec = {'config': {'type': 'dict', 'options': {'name': {'type': 'str', 'aliases': ['id']}}}}
+        self.assertIsNone(get_options_validator(argument_spec))
+        self.assertEqual(normalize_config(argument_spec, {'config': {'id': 'a'}}), ansible_validate(argument_spec, {'config': {'id': 'a'}}))
+
+    def test_05_invalid_facts_fail_the_module(self):
+        with patch.object(basic.AnsibleModule, 'fail_json', side_effect=fail_json):
+            with self.assertRaises(AnsibleFailJson) as context:
+                normalize_config(VlansArgs.argument_spec, {'config': [{'vlan_id': 'abc'}]})
+        result = context.exception.args[0]
+        self.assertTrue(result['failed'])
+        self.assertIn('vlan_id', result['msg'])
@@ -0,0 +1,66 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import random
+import unittest
+
+import sys
+sys.path.append('/root/.ansible/collections')
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.vlan_utils import (
+    VlanRangeSet,
+)
+
+
+def random_vlan_set(rnd):
+    vlans = set()
+    values = []
+    for dummy in range(rnd.randint(0, 6)):
+        lower = rnd.randint(1, 60)
+        upper = lower + rnd.choice([0, 0, 1, 5, 20])
+        vlans.update(range(lower, upper + 1))
+        values.append(str(lower) if lower == upper else '%d%s%d' % (lower, rnd.choice(['-', '..']), upper))
+    return vlans, VlanRangeSet.from_values(values)
+
+
+def expand(vlan_set):
+    vlans = set()
+    for lower, upper in vlan_set.intervals:
+        vlans.update(range(lower, upper + 1))
+    return vlans
+
+
+class TestVlanRangeSet(unittest.TestCase):
+
+    def test_01_parse_and_normalize(self):
+        vlan_set = VlanRangeSet.from_values(['21-30', '11', 12, '13..14', '14,16', '"31..32"', None, ''])
+        self.assertEqual(vlan_set.intervals, [(11, 14), (16, 16), (21, 32)])
+        self.assertEqual(vlan_set.to_payload(), ['11..14', 16, '21..32'])
+        self.assertEqual(vlan_set.to_ranges(), ['11-14', '16', '21-32'])
+        self.assertEqual(len(vlan_set), 17)
+
+    def test_02_from_allowed_vlans(self):
+        vlan_set = VlanRangeSet.from_allowed_vlans([{'vlan': '100-200'}, {'vlan': '150'}, {'vlan': '201'}])
+        self.assertEqual(vlan_set.intervals, [(100, 201)])
+        self.assertFalse(VlanRangeSet.from_allowed_vlans(None))
+
+    def test_03_operations_match_python_sets(self):
+        rnd = random.Random(1301)
+        for dummy in range(500):
+            vlans_a, set_a = random_vlan_set(rnd)
+            vlans_b, set_b = random_vlan_set(rnd)
+            self.assertEqual(expand(set_a | set_b), vlans_a | vlans_b)
+            self.assertEqual(expand(set_a & set_b), vlans_a & vlans_b)
+            self.assertEqual(expand(set_a - set_b), vlans_a - vlans_b)
+            self.assertEqual(set_a <= set_b, vlans_a <= vlans_b)
+            self.assertEqual(set_a.isdisjoint(set_b), vlans_a.isdisjoint(vlans_b))
+            for vlan in range(0, 90):
+                self.assertEqual(vlan in set_a, vlan in vlans_a)
+
+    def test_04_full_range(self):
+        all_vlans = VlanRangeSet.from_values(['1-4094'])
+        some_vlans = VlanRangeSet.from_values(['%d' % vlan for vlan in range(2, 4094, 2)])
+        self.assertEqual(len(all_vlans - some_vlans), 4094 - 2046)
+        self.assertTrue(some_vlans <= all_vlans)
+        self.assertEqual(all_vlans & some_vlans, some_vlans)